@@ -0,0 +1,132 @@
+"""
+Conflict detection for absence requests.
+
+A requested period conflicts with the intern's other pending or approved
+requests it overlaps, with days the intern already has approved attendance,
+and with holidays inside it. Overlaps are found with the ``&&`` operator on
+the ``period`` daterange, served by the partial GiST index on
+``(intern, period)``, so the check is one index probe however long the
+intern's history is.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+from typing import List, Optional
+
+from django.db.backends.postgresql.psycopg_any import DateRange
+from django.db.models import Exists, OuterRef, Q, QuerySet
+
+from apps.absenteeism.models import AbsenteeismRequest
+from apps.attendance.models import Attendance
+from apps.holidays.calendar import get_working_calendar
+from apps.holidays.models import Holiday
+from apps.interns.models import InternProfile
+
+OPEN_STATUSES = (AbsenteeismRequest.Status.PENDING, AbsenteeismRequest.Status.APPROVED)
+
+
+@dataclass(frozen=True)
+class AbsenceConflicts:
+    """Everything a requested absence period collides with"""
+
+    overlapping: List[AbsenteeismRequest]
+    attended_days: List[date]
+    holidays: List[Holiday]
+    working_days: int
+
+    @property
+    def approved_overlaps(self) -> List[AbsenteeismRequest]:
+        return [
+            other
+            for other in self.overlapping
+            if other.status == AbsenteeismRequest.Status.APPROVED
+        ]
+
+    def __bool__(self) -> bool:
+        return bool(
+            self.overlapping
+            or self.attended_days
+            or self.holidays
+            or self.working_days == 0
+        )
+
+
+class AbsenceConflictService:
+    """Service finding conflicts for absence periods"""
+
+    @staticmethod
+    def overlapping(
+        intern: InternProfile,
+        start: date,
+        end: date,
+        exclude_id: Optional[int] = None,
+    ) -> QuerySet[AbsenteeismRequest]:
+        """Pending and approved requests of the intern overlapping a period."""
+        queryset = AbsenteeismRequest.objects.filter(
+            intern=intern,
+            period__overlap=DateRange(start, end, "[]"),
+            status__in=OPEN_STATUSES,
+        )
+        if exclude_id is not None:
+            queryset = queryset.exclude(pk=exclude_id)
+        return queryset.order_by("start_date")
+
+    @staticmethod
+    def find(
+        intern: InternProfile,
+        start: date,
+        end: date,
+        exclude_id: Optional[int] = None,
+    ) -> AbsenceConflicts:
+        """
+        Collect the conflicts of an absence period for one intern.
+
+        Args:
+            intern: Intern requesting the absence
+            start: First day (inclusive)
+            end: Last day (inclusive)
+            exclude_id: Request to leave out, e.g. the one under review
+
+        Returns:
+            AbsenceConflicts; working days use the cached working calendar
+        """
+        attended_days = Attendance.objects.filter(
+            intern=intern,
+            check_in_date__range=(start, end),
+            approval_status=Attendance.ApprovalStatus.APPROVED,
+        ).order_by("check_in_date")
+        holidays = Holiday.objects.filter(
+            Q(branch__isnull=True) | Q(branch_id=intern.branch_id),
+            date__range=(start, end),
+            is_full_day=True,
+        ).order_by("date")
+        return AbsenceConflicts(
+            overlapping=list(
+                AbsenceConflictService.overlapping(intern, start, end, exclude_id)
+            ),
+            attended_days=list(attended_days.values_list("check_in_date", flat=True)),
+            holidays=list(holidays),
+            working_days=get_working_calendar().working_days(
+                start, end, intern.branch_id
+            ),
+        )
+
+    @staticmethod
+    def annotate_overlaps(queryset: QuerySet[AbsenteeismRequest]) -> QuerySet:
+        """
+        Flag each request that overlaps another open request of its intern.
+
+        Adds a boolean ``has_overlap`` computed as an ``EXISTS`` probe on the
+        GiST index, for listings such as the approval queue.
+        """
+        return queryset.annotate(
+            has_overlap=Exists(
+                AbsenteeismRequest.objects.filter(
+                    intern=OuterRef("intern"),
+                    period__overlap=OuterRef("period"),
+                    status__in=OPEN_STATUSES,
+                ).exclude(pk=OuterRef("pk"))
+            )
+        )
@@ -3,6 +3,7 @@ from __future__ import annotations
 from django import forms
 from django.core.exceptions import ValidationError
 
+from apps.absenteeism.conflicts import AbsenceConflicts, AbsenceConflictService
 from apps.absenteeism.models import AbsenteeismRequest
 
 
@@ -59,6 +60,11 @@ class AbsenteeismRequestForm(forms.ModelForm):
         model = AbsenteeismRequest
         fields = ["start_date", "end_date", "reason", "supporting_document"]
 
+    def __init__(self, *args, intern=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Requesting intern; when given, the period is checked for conflicts
+        self.intern = intern
+
     def clean(self):
         cleaned_data = super().clean()
         start_date = cleaned_data.get("start_date")
@@ -67,9 +73,31 @@ class AbsenteeismRequestForm(forms.ModelForm):
         if start_date and end_date:
             if end_date < start_date:
                 raise ValidationError("End date must be on or after the start date.")
+            if self.intern is not None:
+                self._check_conflicts(start_date, end_date)
 
         return cleaned_data
 
+    def _check_conflicts(self, start_date, end_date):
+        conflicts = AbsenceConflictService.find(
+            self.intern, start_date, end_date, exclude_id=self.instance.pk
+        )
+        errors = [
+            f"This period overlaps your {other.get_status_display().lower()} request "
+            f"for {other.start_date:%b %d, %Y} - {other.end_date:%b %d, %Y}."
+            for other in conflicts.overlapping
+        ]
+        if conflicts.attended_days:
+            days = ", ".join(f"{day:%b %d, %Y}" for day in conflicts.attended_days)
+            errors.append(f"You already have approved attendance on {days}.")
+        if conflicts.working_days == 0:
+            errors.append(
+                "The selected period has no working days; it only covers "
+                "weekends and holidays."
+            )
+        if errors:
+            raise ValidationError(errors)
+
 
 class AbsenteeismApprovalForm(forms.Form):
     """Form for supervisor/manager to approve or reject absenteeism request"""
@@ -102,6 +130,11 @@ class AbsenteeismApprovalForm(forms.Form):
         required=False,
     )
 
+    def __init__(self, *args, conflicts: AbsenceConflicts | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Conflicts of the request under review, shown alongside the form
+        self.conflicts = conflicts
+
     def clean(self):
         cleaned_data = super().clean()
         decision = cleaned_data.get("decision")
@@ -110,4 +143,13 @@ class AbsenteeismApprovalForm(forms.Form):
         if decision == "reject" and not decision_note:
             raise ValidationError("A note is required when rejecting a request.")
 
+        # Approved ranges of one intern must not overlap
+        if decision == "approve" and self.conflicts and self.conflicts.approved_overlaps:
+            other = self.conflicts.approved_overlaps[0]
+            raise ValidationError(
+                "This request overlaps an approved absence "
+                f"({other.start_date:%b %d, %Y} - {other.end_date:%b %d, %Y}); "
+                "reject it or ask the intern to adjust the dates."
+            )
+
         return cleaned_data
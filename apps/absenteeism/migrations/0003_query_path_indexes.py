@@ -0,0 +1,32 @@
+# Generated by Django 4.2.11 on 2026-10-17 03:21
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interns', '0003_populate_intern_types'),
+        ('absenteeism', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='absenteeismrequest',
+            index=models.Index(fields=['intern', 'status'], name='absence_intern_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='absenteeismrequest',
+            index=models.Index(fields=['intern', '-submitted_at'], name='absence_intern_submitted_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='absenteeismrequest',
+            index=models.Index(condition=models.Q(('status', 'pending')), fields=['submitted_at'], name='absence_pending_idx'),
+        ),
+        migrations.AlterField(
+            model_name='absenteeismrequest',
+            name='intern',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='absenteeism_requests', to='interns.internprofile'),
+        ),
+    ]
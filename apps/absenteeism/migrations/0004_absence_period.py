@@ -0,0 +1,34 @@
+# Generated by Django 4.2.11 on 2026-10-17 04:35
+
+import django.contrib.postgres.fields.ranges
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import BtreeGistExtension
+from django.db import migrations, models
+
+BACKFILL_PERIOD = """
+UPDATE absenteeism_absenteeismrequest
+SET period = daterange(start_date, end_date, '[]')
+WHERE period IS NULL;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('absenteeism', '0003_query_path_indexes'),
+    ]
+
+    operations = [
+        # Lets the GiST index cover the integer intern_id alongside the range
+        BtreeGistExtension(),
+        migrations.AddField(
+            model_name='absenteeismrequest',
+            name='period',
+            field=django.contrib.postgres.fields.ranges.DateRangeField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunSQL(BACKFILL_PERIOD, migrations.RunSQL.noop),
+        migrations.AddIndex(
+            model_name='absenteeismrequest',
+            index=django.contrib.postgres.indexes.GistIndex(condition=models.Q(('status__in', ['pending', 'approved'])), fields=['intern', 'period'], name='absence_intern_period_gist'),
+        ),
+    ]
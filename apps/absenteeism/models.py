@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+from django.contrib.postgres.fields import DateRangeField
+from django.contrib.postgres.indexes import GistIndex
 from django.db import models
+from django.db.backends.postgresql.psycopg_any import DateRange
 from django.utils import timezone
 
 
@@ -11,7 +14,13 @@ class AbsenteeismRequest(models.Model):
         REJECTED = "rejected", "Rejected"
         CANCELLED = "cancelled", "Cancelled"
 
-    intern = models.ForeignKey("interns.InternProfile", on_delete=models.CASCADE, related_name="absenteeism_requests")
+    # Lookups by intern are served by the composite indexes in Meta
+    intern = models.ForeignKey(
+        "interns.InternProfile",
+        on_delete=models.CASCADE,
+        related_name="absenteeism_requests",
+        db_index=False,
+    )
     approver = models.ForeignKey(
         "accounts.User",
         on_delete=models.SET_NULL,
@@ -23,6 +32,10 @@ class AbsenteeismRequest(models.Model):
     reason = models.TextField()
     start_date = models.DateField()
     end_date = models.DateField()
+    # start_date..end_date as a daterange, kept in sync by save(), so overlap
+    # checks are one GiST index probe. Rows written by bulk_create() or
+    # queryset update() have no period until they are saved again.
+    period = DateRangeField(null=True, blank=True, editable=False)
     supporting_document = models.FileField(upload_to="absenteeism/supporting_documents/", blank=True, null=True)
     submitted_at = models.DateTimeField(auto_now_add=True)
     decision_at = models.DateTimeField(null=True, blank=True)
@@ -30,6 +43,33 @@ class AbsenteeismRequest(models.Model):
 
     class Meta:
         ordering = ["-submitted_at"]
+        indexes = [
+            # Per-intern status counts on dashboards and reports
+            models.Index(fields=["intern", "status"], name="absence_intern_status_idx"),
+            # Per-intern request history, newest first
+            models.Index(
+                fields=["intern", "-submitted_at"], name="absence_intern_submitted_idx"
+            ),
+            # Approval queue: only pending requests, oldest first
+            models.Index(
+                fields=["submitted_at"],
+                name="absence_pending_idx",
+                condition=models.Q(status="pending"),
+            ),
+            # Overlap checks against an intern's open and approved requests
+            GistIndex(
+                fields=["intern", "period"],
+                name="absence_intern_period_gist",
+                condition=models.Q(status__in=["pending", "approved"]),
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        self.period = DateRange(self.start_date, self.end_date, "[]")
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and {"start_date", "end_date"} & set(update_fields):
+            kwargs["update_fields"] = {*update_fields, "period"}
+        super().save(*args, **kwargs)
 
     def __str__(self) -> str:
         return f"AbsenteeismRequest({self.intern.user.get_full_name()} {self.start_date:%Y-%m-%d}→{self.end_date:%Y-%m-%d})"
@@ -2,9 +2,11 @@ from __future__ import annotations
 
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
+from django.db import transaction
 from django.shortcuts import get_object_or_404, redirect, render
 from django.utils import timezone
 
+from apps.absenteeism.conflicts import OPEN_STATUSES, AbsenceConflictService
 from apps.absenteeism.forms import AbsenteeismApprovalForm, AbsenteeismRequestForm
 from apps.absenteeism.models import AbsenteeismRequest
 from apps.accounts.decorators import intern_required, supervisor_or_above
@@ -20,7 +22,9 @@ def request_absence(request):
     intern_profile = get_object_or_404(InternProfile, user=request.user)
 
     if request.method == "POST":
-        form = AbsenteeismRequestForm(request.POST, request.FILES)
+        form = AbsenteeismRequestForm(
+            request.POST, request.FILES, intern=intern_profile
+        )
         if form.is_valid():
             absence_request = form.save(commit=False)
             absence_request.intern = intern_profile
@@ -35,7 +39,7 @@ def request_absence(request):
             )
             return redirect("absenteeism:my_requests")
     else:
-        form = AbsenteeismRequestForm()
+        form = AbsenteeismRequestForm(intern=intern_profile)
 
     return render(request, "absenteeism/request_absence.html", {"form": form})
 
@@ -120,7 +124,9 @@ def pending_requests(request):
         else:
             requests = AbsenteeismRequest.objects.none()
 
-    requests = requests.select_related("intern__user").order_by("submitted_at")
+    requests = AbsenceConflictService.annotate_overlaps(
+        requests.select_related("intern__user").order_by("submitted_at")
+    )
 
     return render(
         request,
@@ -153,15 +159,52 @@ def approve_request(request, request_id):
         messages.error(request, "This request has already been processed.")
         return redirect("absenteeism:request_list")
 
+    conflicts = AbsenceConflictService.find(
+        absence_request.intern,
+        absence_request.start_date,
+        absence_request.end_date,
+        exclude_id=absence_request.id,
+    )
+
     if request.method == "POST":
-        form = AbsenteeismApprovalForm(request.POST)
+        form = AbsenteeismApprovalForm(request.POST, conflicts=conflicts)
+        if form.is_valid() and form.cleaned_data["decision"] == "approve":
+            with transaction.atomic():
+                # Lock the intern's open requests so approvals of overlapping
+                # ranges are decided one at a time, then validate against the
+                # conflicts as they stand once the lock is held
+                open_requests = dict(
+                    AbsenteeismRequest.objects.select_for_update()
+                    .filter(
+                        intern_id=absence_request.intern_id, status__in=OPEN_STATUSES
+                    )
+                    .order_by("pk")
+                    .values_list("pk", "status")
+                )
+                status = open_requests.get(absence_request.pk)
+                if status != AbsenteeismRequest.Status.PENDING:
+                    messages.error(request, "This request has already been processed.")
+                    return redirect("absenteeism:request_list")
+
+                conflicts = AbsenceConflictService.find(
+                    absence_request.intern,
+                    absence_request.start_date,
+                    absence_request.end_date,
+                    exclude_id=absence_request.id,
+                )
+                form = AbsenteeismApprovalForm(request.POST, conflicts=conflicts)
+                if form.is_valid():
+                    absence_request.approve(
+                        approver=request.user,
+                        note=form.cleaned_data.get("decision_note", ""),
+                    )
+                    absence_request.save()
+
         if form.is_valid():
             decision = form.cleaned_data["decision"]
             decision_note = form.cleaned_data.get("decision_note", "")
 
             if decision == "approve":
-                absence_request.approve(approver=request.user, note=decision_note)
-                absence_request.save()
                 messages.success(
                     request,
                     f"Absence request for {absence_request.intern.user.get_full_name()} has been approved.",
@@ -186,7 +229,7 @@ def approve_request(request, request_id):
 
             return redirect("absenteeism:pending_requests")
     else:
-        form = AbsenteeismApprovalForm()
+        form = AbsenteeismApprovalForm(conflicts=conflicts)
 
     return render(
         request,
@@ -194,6 +237,7 @@ def approve_request(request, request_id):
         {
             "absence_request": absence_request,
             "form": form,
+            "conflicts": conflicts,
         },
     )
 
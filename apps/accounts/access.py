@@ -0,0 +1,81 @@
+"""
+Access policy for views that act on a specific intern.
+
+Checks resolve with at most one ``EXISTS`` query and are memoized on the user
+object. ``request.user`` is loaded once per request, so repeating a check in
+the same request (a view and its template, or a loop over records of one
+intern) costs nothing extra.
+"""
+
+from __future__ import annotations
+
+from django.db.models import QuerySet
+
+from apps.accounts.models import User
+from apps.interns.models import InternProfile
+
+FULL_ACCESS_ROLES = (User.Roles.MANAGER, User.Roles.ADMIN)
+
+# Attribute on the user object holding memoized results
+_MEMO_ATTRIBUTE = "_access_policy_memo"
+
+
+def _intern_id(intern) -> int:
+    return intern.pk if isinstance(intern, InternProfile) else int(intern)
+
+
+def _memo(user) -> dict:
+    memo = getattr(user, _MEMO_ATTRIBUTE, None)
+    if memo is None:
+        memo = {}
+        setattr(user, _MEMO_ATTRIBUTE, memo)
+    return memo
+
+
+def has_full_access(user) -> bool:
+    """Managers, admins and superusers may act on every intern."""
+    return user.is_superuser or user.role in FULL_ACCESS_ROLES
+
+
+def supervised_interns(user) -> QuerySet:
+    """Interns the user may supervise, for use as a filter or subquery."""
+    if has_full_access(user):
+        return InternProfile.objects.all()
+    return InternProfile.objects.filter(internal_supervisor__user=user)
+
+
+def can_supervise(user, intern) -> bool:
+    """
+    Return whether the user may approve, assess or report on an intern.
+
+    Args:
+        user: The acting user
+        intern: InternProfile instance or id
+
+    Returns:
+        True for managers/admins and the intern's internal supervisor
+    """
+    if has_full_access(user):
+        return True
+
+    key = ("supervise", _intern_id(intern))
+    memo = _memo(user)
+    if key not in memo:
+        memo[key] = InternProfile.objects.filter(
+            pk=key[1], internal_supervisor__user=user
+        ).exists()
+    return memo[key]
+
+
+def can_view_intern_report(user, intern: InternProfile) -> bool:
+    """
+    Return whether the user may download an intern's report.
+
+    Interns see only their own report and supervisors those of their
+    assigned interns; other staff roles may see any report.
+    """
+    if user.role == User.Roles.INTERN:
+        return intern.user_id == user.pk
+    if user.role == User.Roles.SUPERVISOR:
+        return can_supervise(user, intern)
+    return True
@@ -16,6 +16,8 @@ if TYPE_CHECKING:  # pragma: no cover - import for type checking only
 
 logger = logging.getLogger(__name__)
 
+NOTIFICATION_EMAIL_TEMPLATE = "notifications/email/notification_email.html"
+
 
 class EmailService:
     """Service for sending emails throughout the application"""
@@ -202,6 +204,38 @@ class EmailService:
         """
         subject = f"[IMS] {notification.title}"
 
+        return EmailService.send_notification_email_direct(
+            subject=subject,
+            template_name=NOTIFICATION_EMAIL_TEMPLATE,
+            context=EmailService._notification_context(recipient, notification, context),
+            recipient_list=[recipient.email],
+        )
+
+    @staticmethod
+    def render_notification_email(
+        recipient,
+        notification,
+        context: dict | None = None,
+    ) -> tuple[str, str, str]:
+        """
+        Render a notification email without sending it.
+
+        Args:
+            recipient: User instance the email is addressed to
+            notification: Notification instance
+            context: Additional template context (optional)
+
+        Returns:
+            tuple: (subject, plain text body, HTML body)
+        """
+        html_message = render_to_string(
+            NOTIFICATION_EMAIL_TEMPLATE,
+            EmailService._notification_context(recipient, notification, context),
+        )
+        return f"[IMS] {notification.title}", strip_tags(html_message), html_message
+
+    @staticmethod
+    def _notification_context(recipient, notification, context: dict | None) -> dict:
         template_context = {
             "notification": notification,
             "user": recipient,
@@ -215,12 +249,7 @@ class EmailService:
         if context:
             template_context.update(context)
 
-        return EmailService.send_notification_email_direct(
-            subject=subject,
-            template_name="notifications/email/notification_email.html",
-            context=template_context,
-            recipient_list=[recipient.email],
-        )
+        return template_context
 
     @staticmethod
     def send_onboarding_email(
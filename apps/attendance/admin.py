@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from apps.attendance.models import Attendance
+from apps.attendance.models import Attendance, AttendanceDay, AttendanceSyncEvent
 
 
 @admin.register(Attendance)
@@ -18,3 +18,48 @@ class AttendanceAdmin(admin.ModelAdmin):
         "intern__user__last_name",
         "branch__name",
     )
+
+
+@admin.register(AttendanceDay)
+class AttendanceDayAdmin(admin.ModelAdmin):
+    list_display = ("intern", "date", "minutes_worked", "on_time", "approval_status")
+    list_filter = ("approval_status", "on_time")
+    search_fields = ("intern__user__first_name", "intern__user__last_name")
+    date_hierarchy = "date"
+    # Derived from Attendance; rebuild with the rebuild_attendance_rollups command
+    readonly_fields = (
+        "intern",
+        "date",
+        "attendance",
+        "minutes_worked",
+        "on_time",
+        "approval_status",
+        "updated_at",
+    )
+
+    def has_add_permission(self, request):
+        return False
+
+
+@admin.register(AttendanceSyncEvent)
+class AttendanceSyncEventAdmin(admin.ModelAdmin):
+    list_display = ("intern", "kind", "occurred_at", "outcome", "received_at")
+    list_filter = ("kind", "outcome")
+    search_fields = (
+        "intern__user__first_name",
+        "intern__user__last_name",
+        "idempotency_key",
+    )
+    # Audit trail of the batch sync endpoint
+    readonly_fields = (
+        "intern",
+        "idempotency_key",
+        "kind",
+        "occurred_at",
+        "attendance",
+        "outcome",
+        "received_at",
+    )
+
+    def has_add_permission(self, request):
+        return False
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from django.apps import AppConfig
 
 
@@ -5,3 +7,9 @@ class AttendanceConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.attendance"
     verbose_name = "Attendance"
+
+    def ready(self) -> None:
+        # Import signal handlers that keep the daily rollups current.
+        from . import signals  # noqa: F401
+
+        return super().ready()
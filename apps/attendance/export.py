@@ -0,0 +1,247 @@
+"""
+Streaming CSV and XLSX exports of attendance records.
+
+Rows are read with ``.iterator(chunk_size=...)`` and encoded as they are
+produced, so memory use stays flat however many records the filters match.
+XLSX files are written as a zip stream with inline-string cells, which
+needs no spreadsheet library and never holds the whole sheet in memory.
+"""
+
+from __future__ import annotations
+
+import csv
+import re
+import zipfile
+from datetime import datetime
+from decimal import Decimal
+from typing import Iterable, Iterator, Optional, Sequence
+from xml.sax.saxutils import escape
+
+from django.db.models import QuerySet
+from django.utils import timezone
+
+EXPORT_CHUNK_SIZE = 2000
+EXPORT_FORMATS = ("csv", "xlsx")
+
+EXPORT_COLUMNS = (
+    "Date",
+    "Intern",
+    "Email",
+    "Branch",
+    "Check-in",
+    "Check-out",
+    "Hours",
+    "Latitude",
+    "Longitude",
+    "Distance from branch (m)",
+    "Status",
+    "Auto-approved",
+    "Approved by",
+    "Approved at",
+    "Notes",
+)
+
+CONTENT_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+# Spreadsheet apps run cells starting with these as formulas
+_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+# Control characters are not allowed in XML 1.0
+_XML_ILLEGAL = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+
+def export_queryset(queryset: QuerySet) -> QuerySet:
+    """Select the related rows and columns an export reads, oldest first"""
+    return queryset.select_related(
+        "intern__user", "branch", "approved_by"
+    ).order_by("check_in_time", "id")
+
+
+def _local(value: Optional[datetime]) -> str:
+    if value is None:
+        return ""
+    if timezone.is_aware(value):
+        value = timezone.localtime(value)
+    return value.strftime("%Y-%m-%d %H:%M")
+
+
+def _text(value: str) -> str:
+    """Neutralise user-entered text that a spreadsheet would evaluate"""
+    if value.startswith(_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def export_rows(
+    queryset: QuerySet, chunk_size: int = EXPORT_CHUNK_SIZE
+) -> Iterator[tuple]:
+    """
+    Yield one tuple per attendance record, in ``EXPORT_COLUMNS`` order.
+
+    Args:
+        queryset: Attendance queryset, see ``export_queryset``
+        chunk_size: Rows fetched per database round-trip
+
+    Yields:
+        Row tuples of strings and numbers
+    """
+    for attendance in queryset.iterator(chunk_size=chunk_size):
+        user = attendance.intern.user
+        hours = None
+        if attendance.check_out_time:
+            worked = attendance.check_out_time - attendance.check_in_time
+            hours = round(worked.total_seconds() / 3600, 2)
+        distance = attendance.distance_from_branch()
+        approver = attendance.approved_by
+        day = attendance.check_in_date or timezone.localdate(attendance.check_in_time)
+        yield (
+            day.isoformat(),
+            _text(user.get_full_name()),
+            user.email,
+            _text(attendance.branch.name),
+            _local(attendance.check_in_time),
+            _local(attendance.check_out_time),
+            hours,
+            attendance.latitude,
+            attendance.longitude,
+            round(distance) if distance is not None else None,
+            attendance.get_approval_status_display(),
+            "Yes" if attendance.auto_approved else "No",
+            _text(approver.get_full_name()) if approver else "",
+            _local(attendance.approved_at),
+            _text(attendance.notes),
+        )
+
+
+class _Echo:
+    """File-like object that returns what is written to it"""
+
+    def write(self, value):
+        return value
+
+
+def iter_csv(rows: Iterable[Sequence]) -> Iterator[str]:
+    """Encode rows as CSV lines, header first"""
+    writer = csv.writer(_Echo())
+    # Byte order mark so Excel opens the file as UTF-8
+    yield "\ufeff" + writer.writerow(EXPORT_COLUMNS)
+    for row in rows:
+        yield writer.writerow(["" if value is None else value for value in row])
+
+
+class _ChunkBuffer:
+    """Write-only stream whose contents are drained by the generator"""
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data) -> int:
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def _xlsx_row(number: int, values: Sequence) -> str:
+    cells = []
+    for value in values:
+        if value is None or value == "":
+            cells.append("<c/>")
+        elif isinstance(value, (int, float, Decimal)) and not isinstance(value, bool):
+            cells.append(f"<c><v>{value}</v></c>")
+        else:
+            text = escape(_XML_ILLEGAL.sub("", str(value)))
+            cells.append(
+                f'<c t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+            )
+    return f'<row r="{number}">{"".join(cells)}</row>'
+
+
+_XLSX_PARTS = {
+    "[Content_Types].xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" '
+        'ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" ContentType="application/'
+        'vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/'
+        'vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        "</Types>"
+    ),
+    "_rels/.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/'
+        'relationships"><Relationship Id="rId1" Type="http://schemas.'
+        "openxmlformats.org/officeDocument/2006/relationships/officeDocument"
+        '" Target="xl/workbook.xml"/></Relationships>'
+    ),
+    "xl/workbook.xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/'
+        'main" xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/'
+        'relationships"><sheets><sheet name="Attendance" sheetId="1" '
+        'r:id="rId1"/></sheets></workbook>'
+    ),
+    "xl/_rels/workbook.xml.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/'
+        'relationships"><Relationship Id="rId1" Type="http://schemas.'
+        "openxmlformats.org/officeDocument/2006/relationships/worksheet"
+        '" Target="worksheets/sheet1.xml"/></Relationships>'
+    ),
+}
+
+
+def iter_xlsx(
+    rows: Iterable[Sequence], rows_per_chunk: int = 500
+) -> Iterator[bytes]:
+    """Encode rows as a single-sheet XLSX workbook, header first"""
+    buffer = _ChunkBuffer()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, content in _XLSX_PARTS.items():
+            archive.writestr(name, content)
+        yield buffer.drain()
+
+        with archive.open("xl/worksheets/sheet1.xml", "w") as sheet:
+            sheet.write(
+                b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                b'<worksheet xmlns="http://schemas.openxmlformats.org/'
+                b'spreadsheetml/2006/main"><sheetData>'
+            )
+            sheet.write(_xlsx_row(1, EXPORT_COLUMNS).encode())
+            for number, row in enumerate(rows, start=2):
+                sheet.write(_xlsx_row(number, row).encode())
+                if number % rows_per_chunk == 0:
+                    yield buffer.drain()
+            sheet.write(b"</sheetData></worksheet>")
+    yield buffer.drain()
+
+
+def iter_export(
+    queryset: QuerySet, export_format: str, chunk_size: int = EXPORT_CHUNK_SIZE
+) -> Iterator:
+    """
+    Stream filtered attendance records in ``export_format``.
+
+    Args:
+        queryset: Attendance queryset, e.g. from ``filter_attendance``
+        export_format: ``csv`` (yields str) or ``xlsx`` (yields bytes)
+        chunk_size: Rows fetched per database round-trip
+
+    Returns:
+        Iterator of encoded chunks
+    """
+    rows = export_rows(export_queryset(queryset), chunk_size=chunk_size)
+    if export_format == "xlsx":
+        return iter_xlsx(rows)
+    return iter_csv(rows)
@@ -0,0 +1,64 @@
+"""
+Attendance list filters shared by the list view, exports and commands.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta
+from typing import Mapping, Optional
+
+from django.db.models import Q, QuerySet
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+
+def parse_date_param(value: Optional[str]) -> Optional[date]:
+    """Parse a YYYY-MM-DD query parameter, ignoring malformed values"""
+    try:
+        return parse_date(value or "")
+    except ValueError:
+        return None
+
+
+def start_of_day(day: date) -> datetime:
+    """Return the aware datetime at midnight of ``day`` in the current timezone"""
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def filter_attendance(queryset: QuerySet, params: Mapping[str, str]) -> QuerySet:
+    """
+    Apply the attendance list filters to a queryset.
+
+    Args:
+        queryset: Attendance queryset to narrow
+        params: ``status``, ``intern`` (name or email search), ``date_from``
+            and ``date_to`` (YYYY-MM-DD); missing or blank values are ignored
+
+    Returns:
+        The filtered queryset
+    """
+    status_filter = params.get("status")
+    if status_filter:
+        queryset = queryset.filter(approval_status=status_filter)
+
+    intern_filter = params.get("intern")
+    if intern_filter:
+        queryset = queryset.filter(
+            Q(intern__user__first_name__icontains=intern_filter)
+            | Q(intern__user__last_name__icontains=intern_filter)
+            | Q(intern__user__email__icontains=intern_filter)
+        )
+
+    # Date bounds are applied as ranges on check_in_time so the
+    # (check_in_time, id) index can be used instead of casting every row
+    date_from = parse_date_param(params.get("date_from"))
+    if date_from:
+        queryset = queryset.filter(check_in_time__gte=start_of_day(date_from))
+
+    date_to = parse_date_param(params.get("date_to"))
+    if date_to:
+        queryset = queryset.filter(
+            check_in_time__lt=start_of_day(date_to + timedelta(days=1))
+        )
+
+    return queryset
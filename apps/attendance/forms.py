@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+from datetime import timedelta
+
 from django import forms
+from django.conf import settings
 from django.utils import timezone
 
-from apps.attendance.models import Attendance
+from apps.attendance.models import Attendance, AttendanceSyncEvent
+from apps.attendance.services import MAX_BULK_DECISIONS
 from apps.interns.models import InternProfile
 
 
@@ -95,6 +99,25 @@ class AttendanceApprovalForm(forms.Form):
         return cleaned_data
 
 
+class AttendanceBulkApprovalForm(AttendanceApprovalForm):
+    """Form for approving or rejecting several pending check-ins at once"""
+
+    attendance_ids = forms.Field(widget=forms.MultipleHiddenInput)
+
+    def clean_attendance_ids(self):
+        try:
+            attendance_ids = sorted(
+                {int(value) for value in self.cleaned_data["attendance_ids"]}
+            )
+        except (TypeError, ValueError):
+            raise forms.ValidationError("Invalid attendance selection.")
+        if len(attendance_ids) > MAX_BULK_DECISIONS:
+            raise forms.ValidationError(
+                f"Select at most {MAX_BULK_DECISIONS} records at a time."
+            )
+        return attendance_ids
+
+
 class CheckOutForm(forms.Form):
     """Simple form for checkout"""
 
@@ -108,3 +131,39 @@ class CheckOutForm(forms.Form):
         ),
         required=False,
     )
+
+
+class AttendanceSyncEventForm(forms.Form):
+    """Validates one queued event posted to the batch sync endpoint"""
+
+    key = forms.CharField(max_length=64)
+    type = forms.ChoiceField(choices=AttendanceSyncEvent.Kind.choices)
+    timestamp = forms.DateTimeField()
+    latitude = forms.DecimalField(max_digits=10, decimal_places=7, required=False)
+    longitude = forms.DecimalField(max_digits=10, decimal_places=7, required=False)
+    location_accuracy_m = forms.DecimalField(
+        max_digits=10, decimal_places=7, required=False
+    )
+    notes = forms.CharField(required=False)
+
+    def clean_timestamp(self):
+        timestamp = self.cleaned_data["timestamp"]
+        now = timezone.now()
+        # Allow for a little clock drift on the device
+        if timestamp > now + timedelta(minutes=5):
+            raise forms.ValidationError("Event time is in the future.")
+        max_age = getattr(settings, "ATTENDANCE_SYNC_MAX_AGE_DAYS", 7)
+        if timestamp < now - timedelta(days=max_age):
+            raise forms.ValidationError(
+                f"Events older than {max_age} days can no longer be synced."
+            )
+        return timestamp
+
+    def clean(self):
+        cleaned_data = super().clean()
+        if cleaned_data.get("type") == AttendanceSyncEvent.Kind.CHECK_IN and (
+            cleaned_data.get("latitude") is None
+            or cleaned_data.get("longitude") is None
+        ):
+            raise forms.ValidationError("Check-ins require latitude and longitude.")
+        return cleaned_data
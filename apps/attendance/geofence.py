@@ -0,0 +1,438 @@
+"""
+Geofence checks for attendance auto-approval.
+
+Every branch location and active ``BranchSite`` is a ``Geofence``. Single
+check-ins are located through ``GeofenceIndex``, an in-memory grid that each
+process builds once and rebuilds when branches or sites change. The change is
+detected from the database (row counts and latest ``updated_at``), re-checked
+at most every ``GEOFENCE_INDEX_CHECK_SECONDS``, so it reaches every worker
+whatever cache backend is configured; saves in the same process apply at once
+(see ``apps.branches.signals``). Re-validating a backlog of pending check-ins after
+a geofence changes evaluates them in bulk with NumPy instead.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, FloatField, Max
+from django.db.models.functions import Cast
+from django.utils import timezone
+
+from apps.attendance.models import Attendance, haversine_distance_meters
+from apps.attendance.rollups import AttendanceRollupService
+from apps.branches.models import Branch, BranchSite
+
+EARTH_RADIUS_METERS = 6371000
+DEFAULT_GRID_CELL_DEGREES = 0.01
+DEFAULT_INDEX_CHECK_SECONDS = 30
+
+
+def haversine_distances(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """
+    Element-wise great-circle distance in meters between coordinate arrays.
+
+    Arguments may be arrays of equal shape or scalars (which broadcast).
+    Matches ``haversine_distance_meters`` to floating point precision.
+    """
+    phi1 = np.radians(lat1)
+    phi2 = np.radians(lat2)
+    delta_phi = phi2 - phi1
+    delta_lambda = np.radians(lon2) - np.radians(lon1)
+
+    a = (
+        np.sin(delta_phi / 2) ** 2
+        + np.cos(phi1) * np.cos(phi2) * np.sin(delta_lambda / 2) ** 2
+    )
+    return EARTH_RADIUS_METERS * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+
+def within_geofence(
+    latitudes, longitudes, branch_latitudes, branch_longitudes, thresholds
+) -> np.ndarray:
+    """Return a boolean mask of check-ins inside their branch radius."""
+    distances = haversine_distances(
+        latitudes, longitudes, branch_latitudes, branch_longitudes
+    )
+    return distances <= thresholds
+
+
+def points_in_polygon(latitudes, longitudes, polygon) -> np.ndarray:
+    """
+    Boolean mask of points inside ``polygon`` using ray casting.
+
+    Vertices are treated as planar coordinates, which is accurate for
+    building- or campus-sized sites.
+    """
+    latitudes = np.asarray(latitudes, dtype=float)
+    longitudes = np.asarray(longitudes, dtype=float)
+    inside = np.zeros(latitudes.shape, dtype=bool)
+    for (lat_i, lon_i), (lat_j, lon_j) in zip(polygon, polygon[-1:] + polygon[:-1]):
+        if lat_i == lat_j:
+            continue
+        crosses = (lat_i > latitudes) != (lat_j > latitudes)
+        edge_lon = (lon_j - lon_i) * (latitudes - lat_i) / (lat_j - lat_i) + lon_i
+        inside ^= crosses & (longitudes < edge_lon)
+    return inside
+
+
+@dataclass(frozen=True)
+class Geofence:
+    """A circle or polygon within which a branch auto-approves check-ins"""
+
+    branch_id: int
+    site_id: Optional[int] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    radius_meters: float = 0
+    polygon: Tuple[Tuple[float, float], ...] = ()
+
+    def bounds(self) -> Tuple[float, float, float, float]:
+        """Return ``(min_lat, min_lon, max_lat, max_lon)``."""
+        if self.polygon:
+            lats = [lat for lat, _ in self.polygon]
+            lons = [lon for _, lon in self.polygon]
+            return min(lats), min(lons), max(lats), max(lons)
+        delta_lat = math.degrees(self.radius_meters / EARTH_RADIUS_METERS)
+        delta_lon = delta_lat / max(math.cos(math.radians(self.latitude)), 0.01)
+        return (
+            self.latitude - delta_lat,
+            self.longitude - delta_lon,
+            self.latitude + delta_lat,
+            self.longitude + delta_lon,
+        )
+
+    def contains(self, latitude: float, longitude: float) -> bool:
+        if self.polygon:
+            inside = False
+            for (lat_i, lon_i), (lat_j, lon_j) in zip(
+                self.polygon, self.polygon[-1:] + self.polygon[:-1]
+            ):
+                if (lat_i > latitude) != (lat_j > latitude):
+                    edge_lon = (lon_j - lon_i) * (latitude - lat_i) / (
+                        lat_j - lat_i
+                    ) + lon_i
+                    if longitude < edge_lon:
+                        inside = not inside
+            return inside
+        distance = haversine_distance_meters(
+            latitude, longitude, self.latitude, self.longitude
+        )
+        return distance <= self.radius_meters
+
+    def contains_many(self, latitudes, longitudes) -> np.ndarray:
+        """Vectorised ``contains`` over coordinate arrays."""
+        if self.polygon:
+            return points_in_polygon(latitudes, longitudes, self.polygon)
+        distances = haversine_distances(
+            latitudes, longitudes, self.latitude, self.longitude
+        )
+        return distances <= self.radius_meters
+
+
+def load_geofences(branch_ids: Optional[Iterable[int]] = None) -> List[Geofence]:
+    """
+    Load geofences for branch locations and their active sites.
+
+    Args:
+        branch_ids: Limit to these branches (defaults to all branches)
+
+    Returns:
+        List of Geofence, branch locations first
+    """
+    branches = Branch.objects.filter(latitude__isnull=False, longitude__isnull=False)
+    sites = BranchSite.objects.filter(is_active=True)
+    if branch_ids is not None:
+        branch_ids = list(branch_ids)
+        branches = branches.filter(id__in=branch_ids)
+        sites = sites.filter(branch_id__in=branch_ids)
+
+    geofences = [
+        Geofence(
+            branch_id=branch_id,
+            latitude=lat,
+            longitude=lon,
+            radius_meters=threshold,
+        )
+        for branch_id, lat, lon, threshold in branches.annotate(
+            lat=Cast("latitude", FloatField()),
+            lon=Cast("longitude", FloatField()),
+        ).values_list("id", "lat", "lon", "proximity_threshold_meters")
+    ]
+    for site in sites.select_related("branch").only(
+        "branch__proximity_threshold_meters",
+        "latitude",
+        "longitude",
+        "radius_meters",
+        "polygon",
+    ):
+        if site.polygon:
+            geofences.append(
+                Geofence(
+                    branch_id=site.branch_id,
+                    site_id=site.id,
+                    polygon=tuple(
+                        (float(lat), float(lon)) for lat, lon in site.polygon
+                    ),
+                )
+            )
+        elif site.latitude is not None and site.longitude is not None:
+            geofences.append(
+                Geofence(
+                    branch_id=site.branch_id,
+                    site_id=site.id,
+                    latitude=float(site.latitude),
+                    longitude=float(site.longitude),
+                    radius_meters=site.radius_meters
+                    or site.branch.proximity_threshold_meters,
+                )
+            )
+    return geofences
+
+
+class GeofenceIndex:
+    """
+    Grid index of geofences keyed by branch.
+
+    Each geofence is registered in every ``cell_degrees`` square its bounding
+    box touches. Locating a point is one dictionary lookup for its cell plus
+    exact tests against the geofences registered there, so the cost does not
+    grow with the number of sites a branch has.
+    """
+
+    def __init__(
+        self, geofences: Iterable[Geofence], cell_degrees: Optional[float] = None
+    ):
+        self.cell_degrees = cell_degrees or getattr(
+            settings, "GEOFENCE_GRID_CELL_DEGREES", DEFAULT_GRID_CELL_DEGREES
+        )
+        self._cells: Dict[Tuple[int, int, int], List[Geofence]] = defaultdict(list)
+        for geofence in geofences:
+            for cell in self._cells_for(geofence.bounds()):
+                self._cells[(geofence.branch_id, *cell)].append(geofence)
+
+    def _cell(self, latitude: float, longitude: float) -> Tuple[int, int]:
+        return (
+            math.floor(latitude / self.cell_degrees),
+            math.floor(longitude / self.cell_degrees),
+        )
+
+    def _cells_for(self, bounds) -> Iterator[Tuple[int, int]]:
+        min_lat, min_lon, max_lat, max_lon = bounds
+        low_x, low_y = self._cell(min_lat, min_lon)
+        high_x, high_y = self._cell(max_lat, max_lon)
+        for x in range(low_x, high_x + 1):
+            for y in range(low_y, high_y + 1):
+                yield x, y
+
+    def locate(
+        self, branch_id: int, latitude: float, longitude: float
+    ) -> Optional[Geofence]:
+        """Return a geofence of ``branch_id`` containing the point, if any."""
+        candidates = self._cells.get(
+            (branch_id, *self._cell(latitude, longitude)), ()
+        )
+        for geofence in candidates:
+            if geofence.contains(latitude, longitude):
+                return geofence
+        return None
+
+    def locate_many(
+        self, branch_id: int, latitudes, longitudes
+    ) -> List[Optional[Geofence]]:
+        """
+        Vectorised ``locate`` for many points of one branch.
+
+        Points are grouped by grid cell and each candidate geofence tests
+        all of a cell's remaining points at once.
+        """
+        latitudes = np.asarray(latitudes, dtype=float)
+        longitudes = np.asarray(longitudes, dtype=float)
+        found: List[Optional[Geofence]] = [None] * len(latitudes)
+
+        by_cell: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+        for position, (latitude, longitude) in enumerate(zip(latitudes, longitudes)):
+            by_cell[self._cell(latitude, longitude)].append(position)
+
+        for cell, positions in by_cell.items():
+            remaining = np.array(positions)
+            for geofence in self._cells.get((branch_id, *cell), ()):
+                inside = geofence.contains_many(
+                    latitudes[remaining], longitudes[remaining]
+                )
+                for position in remaining[inside]:
+                    found[position] = geofence
+                remaining = remaining[~inside]
+                if not remaining.size:
+                    break
+        return found
+
+
+_index: Optional[GeofenceIndex] = None
+_index_version: Optional[tuple] = None
+_index_checked_at: Optional[float] = None
+_index_lock = threading.Lock()
+
+
+def geofence_version() -> tuple:
+    """Row count and latest change of branches and sites in the database."""
+    return tuple(
+        (stats["rows"], stats["changed"])
+        for stats in (
+            model.objects.aggregate(rows=Count("id"), changed=Max("updated_at"))
+            for model in (Branch, BranchSite)
+        )
+    )
+
+
+def _index_is_fresh() -> bool:
+    interval = getattr(
+        settings, "GEOFENCE_INDEX_CHECK_SECONDS", DEFAULT_INDEX_CHECK_SECONDS
+    )
+    return (
+        _index is not None
+        and _index_checked_at is not None
+        and time.monotonic() - _index_checked_at < interval
+    )
+
+
+def get_geofence_index() -> GeofenceIndex:
+    """
+    Return this process's geofence index, rebuilding it if it is stale.
+
+    Between checks the index is served without touching the database. Once
+    ``GEOFENCE_INDEX_CHECK_SECONDS`` have passed, the version is read from
+    the branch and site tables and the index rebuilt if it changed, so a
+    change saved by one process reaches all of them within that interval.
+    """
+    global _index, _index_version, _index_checked_at
+
+    if not _index_is_fresh():
+        with _index_lock:
+            if not _index_is_fresh():
+                version = geofence_version()
+                if _index is None or version != _index_version:
+                    _index = GeofenceIndex(load_geofences())
+                    _index_version = version
+                _index_checked_at = time.monotonic()
+    return _index
+
+
+def invalidate_geofence_index() -> None:
+    """
+    Make this process re-check the geofence version on its next lookup.
+
+    Done immediately and again once the surrounding transaction commits, so
+    the index is not left built from uncommitted rows. Other processes pick
+    the change up from the database on their next periodic check.
+    """
+
+    def expire() -> None:
+        global _index_checked_at
+        _index_checked_at = None
+
+    expire()
+    transaction.on_commit(expire)
+
+
+@dataclass
+class RevalidationResult:
+    """Counts from a bulk re-validation run"""
+
+    checked: int = 0
+    approved: int = 0
+
+
+class GeofenceService:
+    """Service for bulk geofence evaluation of attendance records"""
+
+    @staticmethod
+    def revalidate_pending(
+        branch_ids: Optional[Iterable[int]] = None, chunk_size: int = 5000
+    ) -> RevalidationResult:
+        """
+        Re-run the geofence check for pending check-ins.
+
+        Pending records that now fall inside any geofence of their branch are
+        auto-approved exactly as ``Attendance.auto_validate`` would have done
+        at check-in time; records still outside stay pending for a
+        supervisor. Rows are processed in id order, ``chunk_size`` at a time,
+        with one SELECT and at most one UPDATE per chunk.
+
+        Args:
+            branch_ids: Limit to these branches (defaults to all branches)
+            chunk_size: Number of check-ins evaluated per batch
+
+        Returns:
+            RevalidationResult with checked/approved counts
+        """
+        result = RevalidationResult()
+        geofences_by_branch: Dict[int, List[Geofence]] = defaultdict(list)
+        for geofence in load_geofences(branch_ids):
+            geofences_by_branch[geofence.branch_id].append(geofence)
+        if not geofences_by_branch:
+            return result
+
+        pending = (
+            Attendance.objects.filter(
+                approval_status=Attendance.ApprovalStatus.PENDING,
+                branch_id__in=list(geofences_by_branch),
+            )
+            .annotate(
+                lat=Cast("latitude", FloatField()),
+                lon=Cast("longitude", FloatField()),
+            )
+            .order_by("id")
+        )
+
+        last_id = 0
+        while True:
+            rows = list(
+                pending.filter(id__gt=last_id).values_list(
+                    "id", "branch_id", "lat", "lon"
+                )[:chunk_size]
+            )
+            if not rows:
+                break
+            last_id = rows[-1][0]
+
+            attendance_ids = np.fromiter((row[0] for row in rows), dtype=np.int64)
+            row_branches = np.fromiter((row[1] for row in rows), dtype=np.int64)
+            latitudes = np.fromiter((row[2] for row in rows), dtype=float)
+            longitudes = np.fromiter((row[3] for row in rows), dtype=float)
+
+            mask = np.zeros(len(rows), dtype=bool)
+            for branch_id, geofences in geofences_by_branch.items():
+                for geofence in geofences:
+                    # Only rows of this branch not already inside a geofence
+                    positions = np.flatnonzero((row_branches == branch_id) & ~mask)
+                    if not positions.size:
+                        break
+                    mask[positions] = geofence.contains_many(
+                        latitudes[positions], longitudes[positions]
+                    )
+
+            result.checked += len(rows)
+            if mask.any():
+                approved_ids = attendance_ids[mask].tolist()
+                with transaction.atomic():
+                    result.approved += Attendance.objects.filter(
+                        id__in=approved_ids,
+                        approval_status=Attendance.ApprovalStatus.PENDING,
+                    ).update(
+                        approval_status=Attendance.ApprovalStatus.APPROVED,
+                        auto_approved=True,
+                        approved_at=timezone.now(),
+                        updated_at=timezone.now(),
+                    )
+                    AttendanceRollupService.refresh_ids(approved_ids)
+
+        return result
@@ -0,0 +1,92 @@
+"""
+Management command to export attendance records as CSV or XLSX
+"""
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+
+from apps.attendance.export import EXPORT_CHUNK_SIZE, EXPORT_FORMATS, iter_export
+from apps.attendance.filters import filter_attendance
+from apps.attendance.models import Attendance
+
+
+class Command(BaseCommand):
+    help = (
+        "Stream attendance records, filtered like the attendance list, "
+        "to a CSV or XLSX file"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output",
+            "-o",
+            type=str,
+            help="File to write (CSV goes to stdout when omitted)",
+        )
+        parser.add_argument(
+            "--format",
+            choices=EXPORT_FORMATS,
+            help="Export format (defaults to the output file extension, else csv)",
+        )
+        parser.add_argument(
+            "--status",
+            choices=Attendance.ApprovalStatus.values,
+            help="Only records with this approval status",
+        )
+        parser.add_argument(
+            "--intern", type=str, help="Only interns whose name or email matches"
+        )
+        parser.add_argument(
+            "--from", dest="date_from", type=str, help="First date (YYYY-MM-DD)"
+        )
+        parser.add_argument(
+            "--to", dest="date_to", type=str, help="Last date (YYYY-MM-DD)"
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=EXPORT_CHUNK_SIZE,
+            help="Number of records fetched per database round-trip",
+        )
+
+    def handle(self, *args, **options):
+        output = options["output"]
+        export_format = options["format"]
+        if export_format is None:
+            export_format = "xlsx" if output and output.endswith(".xlsx") else "csv"
+        if export_format == "xlsx" and not output:
+            raise CommandError("XLSX exports need --output.")
+
+        for option, name in (("date_from", "--from"), ("date_to", "--to")):
+            if options[option]:
+                try:
+                    parsed = parse_date(options[option])
+                except ValueError:
+                    parsed = None
+                if parsed is None:
+                    raise CommandError(f"{name} must be a date in YYYY-MM-DD format.")
+
+        attendances = filter_attendance(Attendance.objects.all(), options)
+        chunks = iter_export(attendances, export_format, options["chunk_size"])
+
+        start_time = time.time()
+        if export_format == "xlsx":
+            with open(output, "wb") as handle:
+                for chunk in chunks:
+                    handle.write(chunk)
+        elif output:
+            with open(output, "w", encoding="utf-8", newline="") as handle:
+                handle.writelines(chunks)
+        else:
+            for chunk in chunks:
+                self.stdout.write(chunk, ending="")
+            return
+        duration = time.time() - start_time
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Exported attendance to {output} in {duration:.1f} seconds"
+            )
+        )
@@ -0,0 +1,56 @@
+"""
+Management command to notify interns and supervisors about missed check-ins
+
+Schedule it once a day after working hours, e.g. from cron:
+    0 20 * * 1-5 python manage.py notify_missed_check_ins
+"""
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+from apps.attendance.missed import MissedCheckInService
+
+
+class Command(BaseCommand):
+    help = (
+        "Notify active interns with no check-in on a working day, and their "
+        "internal supervisors"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--date",
+            type=str,
+            help="Day to check (YYYY-MM-DD, defaults to today)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report how many notifications would be sent",
+        )
+
+    def handle(self, *args, **options):
+        day = timezone.localdate()
+        if options["date"]:
+            try:
+                day = parse_date(options["date"])
+            except ValueError:
+                day = None
+            if day is None:
+                raise CommandError("--date must be a date in YYYY-MM-DD format.")
+
+        start_time = time.time()
+        result = MissedCheckInService.notify(day, dry_run=options["dry_run"])
+        duration = time.time() - start_time
+
+        verb = "Would notify" if options["dry_run"] else "Notified"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{verb} {result.interns} intern(s) and {result.supervisors} "
+                f"supervisor(s) about missed check-ins on {day:%Y-%m-%d} "
+                f"in {duration:.1f} seconds"
+            )
+        )
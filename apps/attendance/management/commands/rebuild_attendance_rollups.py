@@ -0,0 +1,64 @@
+"""
+Management command to recompute the daily attendance rollups
+"""
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+
+from apps.attendance.rollups import AttendanceRollupService
+
+
+class Command(BaseCommand):
+    help = "Rebuild the daily attendance rollups from raw check-ins"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--intern",
+            type=int,
+            action="append",
+            help="Only this intern profile id; may be repeated",
+        )
+        parser.add_argument(
+            "--from", dest="start", type=str, help="First date (YYYY-MM-DD)"
+        )
+        parser.add_argument("--to", dest="end", type=str, help="Last date (YYYY-MM-DD)")
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=2000,
+            help="Number of check-ins written per batch",
+        )
+
+    def handle(self, *args, **options):
+        start = self._parse_date(options["start"], "--from")
+        end = self._parse_date(options["end"], "--to")
+        if start and end and start > end:
+            raise CommandError("--from must not be after --to.")
+
+        start_time = time.time()
+        written = AttendanceRollupService.rebuild(
+            intern_ids=options["intern"],
+            start=start,
+            end=end,
+            chunk_size=options["chunk_size"],
+        )
+        duration = time.time() - start_time
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rebuilt {written} daily rollup(s) in {duration:.1f} seconds"
+            )
+        )
+
+    def _parse_date(self, value, option):
+        if not value:
+            return None
+        try:
+            parsed = parse_date(value)
+        except ValueError:
+            parsed = None
+        if parsed is None:
+            raise CommandError(f"{option} must be a date in YYYY-MM-DD format.")
+        return parsed
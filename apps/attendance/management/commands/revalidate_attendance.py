@@ -0,0 +1,57 @@
+"""
+Management command to re-run the geofence check on pending attendance
+"""
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Q
+
+from apps.attendance.geofence import GeofenceService
+from apps.branches.models import Branch
+
+
+class Command(BaseCommand):
+    help = (
+        "Re-evaluate pending check-ins against their branch geofence and "
+        "auto-approve those now inside the radius"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--branch",
+            type=str,
+            action="append",
+            help="Only this branch (id or code); may be repeated",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=5000,
+            help="Number of check-ins evaluated per batch",
+        )
+
+    def handle(self, *args, **options):
+        branch_ids = None
+        if options["branch"]:
+            lookup = Q()
+            for value in options["branch"]:
+                lookup |= Q(code=value)
+                if value.isdigit():
+                    lookup |= Q(id=int(value))
+            branch_ids = list(Branch.objects.filter(lookup).values_list("id", flat=True))
+            if not branch_ids:
+                raise CommandError("No branches match the given --branch values.")
+
+        start_time = time.time()
+        result = GeofenceService.revalidate_pending(
+            branch_ids, chunk_size=options["chunk_size"]
+        )
+        duration = time.time() - start_time
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Checked {result.checked} pending check-in(s), auto-approved "
+                f"{result.approved} in {duration:.1f} seconds"
+            )
+        )
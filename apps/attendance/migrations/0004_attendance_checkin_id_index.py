@@ -0,0 +1,32 @@
+# Generated by Django 4.2.11 on 2026-10-17 03:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('attendance', '0003_alter_attendance_location_accuracy_m'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='attendance',
+            name='latitude',
+            field=models.DecimalField(decimal_places=7, max_digits=10),
+        ),
+        migrations.AlterField(
+            model_name='attendance',
+            name='location_accuracy_m',
+            field=models.DecimalField(blank=True, decimal_places=7, max_digits=10, null=True),
+        ),
+        migrations.AlterField(
+            model_name='attendance',
+            name='longitude',
+            field=models.DecimalField(decimal_places=7, max_digits=10),
+        ),
+        migrations.AddIndex(
+            model_name='attendance',
+            index=models.Index(fields=['-check_in_time', '-id'], name='attendance_checkin_id_idx'),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 4.2.11 on 2026-10-17 03:21
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interns', '0003_populate_intern_types'),
+        ('attendance', '0004_attendance_checkin_id_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='attendance',
+            index=models.Index(fields=['intern', 'approval_status'], name='attendance_intern_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='attendance',
+            index=models.Index(fields=['intern', '-check_in_time'], name='attendance_intern_checkin_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='attendance',
+            index=models.Index(condition=models.Q(('approval_status', 'pending')), fields=['-check_in_time'], name='attendance_pending_idx'),
+        ),
+        migrations.AlterField(
+            model_name='attendance',
+            name='intern',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='attendances', to='interns.internprofile'),
+        ),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 4.2.11 on 2026-10-17 03:24
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def backfill_check_in_date(apps, schema_editor):
+    """Store the local check-in day; later same-day duplicates keep NULL."""
+    Attendance = apps.get_model("attendance", "Attendance")
+    rows = (
+        Attendance.objects.order_by("intern_id", "check_in_time", "id")
+        .only("id", "intern_id", "check_in_time")
+        .iterator(chunk_size=2000)
+    )
+
+    batch = []
+    last_key = None
+    for row in rows:
+        key = (row.intern_id, timezone.localdate(row.check_in_time))
+        if key == last_key:
+            continue
+        last_key = key
+        row.check_in_date = key[1]
+        batch.append(row)
+        if len(batch) >= 1000:
+            Attendance.objects.bulk_update(batch, ["check_in_date"])
+            batch = []
+    if batch:
+        Attendance.objects.bulk_update(batch, ["check_in_date"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('attendance', '0005_query_path_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='attendance',
+            name='check_in_date',
+            field=models.DateField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(backfill_check_in_date, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='attendance',
+            index=models.Index(fields=['check_in_date'], name='attendance_checkin_date_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='attendance',
+            constraint=models.UniqueConstraint(fields=('intern', 'check_in_date'), name='attendance_one_check_in_per_day'),
+        ),
+    ]
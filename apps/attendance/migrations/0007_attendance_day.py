@@ -0,0 +1,37 @@
+# Generated by Django 4.2.11 on 2026-10-17 03:45
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interns', '0003_populate_intern_types'),
+        ('attendance', '0006_attendance_check_in_date'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AttendanceDay',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('minutes_worked', models.PositiveIntegerField(default=0)),
+                ('on_time', models.BooleanField(default=False)),
+                ('approval_status', models.CharField(choices=[('pending', 'Pending'), ('approved', 'Approved'), ('rejected', 'Rejected')], max_length=32)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('attendance', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='rollup', to='attendance.attendance')),
+                ('intern', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='attendance_days', to='interns.internprofile')),
+            ],
+            options={
+                'verbose_name': 'Attendance Day',
+                'verbose_name_plural': 'Attendance Days',
+                'ordering': ['-date'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='attendanceday',
+            constraint=models.UniqueConstraint(fields=('intern', 'date'), name='attendance_day_intern_date_uniq'),
+        ),
+    ]
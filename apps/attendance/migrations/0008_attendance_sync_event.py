@@ -0,0 +1,37 @@
+# Generated by Django 4.2.11 on 2026-10-17 04:00
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interns', '0003_populate_intern_types'),
+        ('attendance', '0007_attendance_day'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AttendanceSyncEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('idempotency_key', models.CharField(max_length=64)),
+                ('kind', models.CharField(choices=[('check_in', 'Check-in'), ('check_out', 'Check-out')], max_length=16)),
+                ('occurred_at', models.DateTimeField()),
+                ('outcome', models.CharField(choices=[('checked_in', 'Checked in'), ('checked_out', 'Checked out'), ('already_recorded', 'Already recorded')], max_length=32)),
+                ('received_at', models.DateTimeField(auto_now_add=True)),
+                ('attendance', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='sync_events', to='attendance.attendance')),
+                ('intern', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='attendance_sync_events', to='interns.internprofile')),
+            ],
+            options={
+                'verbose_name': 'Attendance Sync Event',
+                'verbose_name_plural': 'Attendance Sync Events',
+                'ordering': ['-received_at'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='attendancesyncevent',
+            constraint=models.UniqueConstraint(fields=('intern', 'idempotency_key'), name='attendance_sync_event_key_uniq'),
+        ),
+    ]
@@ -0,0 +1,161 @@
+"""
+Detection of interns who did not check in on a working day.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date
+from typing import List
+
+from django.db.models import Exists, OuterRef, Q, QuerySet
+from django.urls import reverse
+
+from apps.absenteeism.models import AbsenteeismRequest
+from apps.attendance.models import Attendance
+from apps.holidays.calendar import get_working_calendar
+from apps.holidays.models import Holiday
+from apps.interns.models import InternProfile
+from apps.notifications.models import Notification
+from apps.notifications.services import NotificationService
+
+MISSED_TITLE = "Missed check-in on {day:%b %d, %Y}"
+SUPERVISOR_TITLE = "Missed check-ins on {day:%b %d, %Y}"
+
+
+@dataclass
+class MissedCheckInResult:
+    """Counts from one missed check-in run"""
+
+    interns: int = 0
+    supervisors: int = 0
+
+
+class MissedCheckInService:
+    """Service finding and reporting missed check-ins"""
+
+    @staticmethod
+    def missing_interns(day: date) -> QuerySet:
+        """
+        Interns expected at work on ``day`` who have no attendance for it.
+
+        Active interns (by start/end date) are filtered in one query with
+        ``NOT EXISTS`` subqueries for the day's check-in, approved absences
+        covering the day and full-day holidays of their branch or all
+        branches. Non-working weekdays return no interns.
+
+        Args:
+            day: The working day to check
+
+        Returns:
+            InternProfile queryset with user and supervisor selected
+        """
+        if day.weekday() not in get_working_calendar().weekdays:
+            return InternProfile.objects.none()
+
+        checked_in = Attendance.objects.filter(intern=OuterRef("pk"), check_in_date=day)
+        absent = AbsenteeismRequest.objects.filter(
+            intern=OuterRef("pk"),
+            status=AbsenteeismRequest.Status.APPROVED,
+            start_date__lte=day,
+            end_date__gte=day,
+        )
+        holiday = Holiday.objects.filter(date=day, is_full_day=True).filter(
+            Q(branch__isnull=True) | Q(branch=OuterRef("branch_id"))
+        )
+
+        return (
+            InternProfile.objects.filter(
+                Q(end_date__isnull=True) | Q(end_date__gte=day),
+                start_date__lte=day,
+                user__is_active=True,
+            )
+            .filter(~Exists(checked_in), ~Exists(absent), ~Exists(holiday))
+            .select_related("user", "internal_supervisor__user")
+            .order_by("id")
+        )
+
+    @staticmethod
+    def notify(day: date, dry_run: bool = False) -> MissedCheckInResult:
+        """
+        Notify interns who missed ``day`` and their internal supervisors.
+
+        Each intern gets one notification and each supervisor one summary
+        listing their interns, all written through the bulk notification
+        path. Recipients already notified for ``day`` are skipped, so the
+        command can safely be re-run.
+
+        Args:
+            day: The working day to check
+            dry_run: Count recipients without creating notifications
+
+        Returns:
+            MissedCheckInResult with intern and supervisor counts
+        """
+        intern_title = MISSED_TITLE.format(day=day)
+        supervisor_title = SUPERVISOR_TITLE.format(day=day)
+
+        interns = list(
+            MissedCheckInService.missing_interns(day).filter(
+                ~Exists(
+                    Notification.objects.filter(
+                        recipient=OuterRef("user_id"), title=intern_title
+                    )
+                )
+            )
+        )
+
+        by_supervisor = defaultdict(list)
+        for intern in interns:
+            if intern.internal_supervisor_id:
+                by_supervisor[intern.internal_supervisor.user].append(intern)
+
+        already_told = set(
+            Notification.objects.filter(
+                recipient__in=list(by_supervisor), title=supervisor_title
+            ).values_list("recipient_id", flat=True)
+        )
+        for supervisor_user in [u for u in by_supervisor if u.pk in already_told]:
+            del by_supervisor[supervisor_user]
+
+        result = MissedCheckInResult(
+            interns=len(interns), supervisors=len(by_supervisor)
+        )
+        if dry_run:
+            return result
+
+        action_url = reverse("attendance:my_attendance")
+        notifications: List[Notification] = [
+            Notification(
+                recipient=intern.user,
+                title=intern_title,
+                message=(
+                    f"No check-in was recorded for you on {day:%B %d, %Y}. "
+                    "If you were absent, please submit an absence request."
+                ),
+                notification_type="warning",
+                category="attendance",
+                action_url=action_url,
+            )
+            for intern in interns
+        ]
+        list_url = reverse("attendance:list")
+        for supervisor_user, missing in by_supervisor.items():
+            names = ", ".join(intern.user.get_full_name() for intern in missing)
+            notifications.append(
+                Notification(
+                    recipient=supervisor_user,
+                    title=supervisor_title,
+                    message=(
+                        f"{len(missing)} of your intern(s) did not check in on "
+                        f"{day:%B %d, %Y}: {names}."
+                    ),
+                    notification_type="warning",
+                    category="attendance",
+                    action_url=list_url,
+                )
+            )
+
+        NotificationService.save_bulk_notifications(notifications, send_email=True)
+        return result
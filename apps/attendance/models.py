@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import math
+from datetime import date, datetime
 
 from django.db import models
 from django.utils import timezone
@@ -25,19 +26,35 @@ def haversine_distance_meters(
     return radius * c
 
 
+def local_date(value: datetime) -> date:
+    """Return the calendar date of ``value`` in the current time zone."""
+
+    if timezone.is_aware(value):
+        return timezone.localdate(value)
+    return value.date()
+
+
 class Attendance(models.Model):
     class ApprovalStatus(models.TextChoices):
         PENDING = "pending", "Pending"
         APPROVED = "approved", "Approved"
         REJECTED = "rejected", "Rejected"
 
+    # Lookups by intern are served by the composite indexes in Meta
     intern = models.ForeignKey(
-        "interns.InternProfile", on_delete=models.CASCADE, related_name="attendances"
+        "interns.InternProfile",
+        on_delete=models.CASCADE,
+        related_name="attendances",
+        db_index=False,
     )
     branch = models.ForeignKey(
         "branches.Branch", on_delete=models.CASCADE, related_name="attendances"
     )
     check_in_time = models.DateTimeField(default=timezone.now)
+    # Local calendar day of check_in_time, kept in sync by save(). Rows that
+    # duplicated an earlier check-in before the unique constraint existed
+    # have no date.
+    check_in_date = models.DateField(null=True, blank=True, editable=False)
     check_out_time = models.DateTimeField(null=True, blank=True)
     latitude = models.DecimalField(max_digits=10, decimal_places=7)
     longitude = models.DecimalField(max_digits=10, decimal_places=7)
@@ -70,6 +87,54 @@ class Attendance(models.Model):
     class Meta:
         ordering = ["-check_in_time"]
         verbose_name_plural = "Attendance Records"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["intern", "check_in_date"], name="attendance_one_check_in_per_day"
+            ),
+        ]
+        indexes = [
+            # Today's check-ins across all interns on dashboards
+            models.Index(fields=["check_in_date"], name="attendance_checkin_date_idx"),
+            # Keyset pagination of the attendance list on (check_in_time, id)
+            models.Index(
+                fields=["-check_in_time", "-id"], name="attendance_checkin_id_idx"
+            ),
+            # Per-intern status counts on dashboards and reports
+            models.Index(
+                fields=["intern", "approval_status"], name="attendance_intern_status_idx"
+            ),
+            # Per-intern history, newest first
+            models.Index(
+                fields=["intern", "-check_in_time"], name="attendance_intern_checkin_idx"
+            ),
+            # Approval queue: only pending rows, newest first
+            models.Index(
+                fields=["-check_in_time"],
+                name="attendance_pending_idx",
+                condition=models.Q(approval_status="pending"),
+            ),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored check-in time so save() can tell if it moved
+        instance._loaded_check_in_time = instance.__dict__.get("check_in_time")
+        return instance
+
+    def save(self, *args, **kwargs):
+        # Legacy same-day duplicates keep their NULL date unless the check-in
+        # itself is moved; deriving it would break the unique constraint
+        if (
+            self._state.adding
+            or self.check_in_date is not None
+            or self.check_in_time != getattr(self, "_loaded_check_in_time", None)
+        ):
+            self.check_in_date = local_date(self.check_in_time)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "check_in_time" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "check_in_date"}
+        super().save(*args, **kwargs)
 
     def __str__(self) -> str:
         return f"Attendance({self.intern.user.get_full_name()} @ {self.branch.name} on {self.check_in_time:%Y-%m-%d})"
@@ -85,13 +150,19 @@ class Attendance(models.Model):
         )
 
     def auto_validate(self) -> None:
-        distance = self.distance_from_branch()
-        if distance is None:
-            return
-        if distance <= self.branch.proximity_threshold_meters:
-            self.approval_status = self.ApprovalStatus.APPROVED
-            self.auto_approved = True
-            self.approved_at = timezone.now()
+        # Imported here because the geofence module imports this one
+        from apps.attendance.geofence import get_geofence_index
+
+        geofence = get_geofence_index().locate(
+            self.branch_id, float(self.latitude), float(self.longitude)
+        )
+        if geofence is not None:
+            self.mark_auto_approved()
+
+    def mark_auto_approved(self) -> None:
+        self.approval_status = self.ApprovalStatus.APPROVED
+        self.auto_approved = True
+        self.approved_at = timezone.now()
 
     def approve(self, *, approver) -> None:
         self.approval_status = self.ApprovalStatus.APPROVED
@@ -106,3 +177,100 @@ class Attendance(models.Model):
         self.auto_approved = False
         if note:
             self.notes = note
+
+
+class AttendanceDay(models.Model):
+    """
+    Daily rollup of one intern's attendance.
+
+    Rows are derived from ``Attendance`` by ``AttendanceRollupService`` and
+    kept current as check-ins, check-outs and approvals are saved, so hours
+    summaries read a date range of this table instead of raw check-ins.
+    """
+
+    intern = models.ForeignKey(
+        "interns.InternProfile",
+        on_delete=models.CASCADE,
+        related_name="attendance_days",
+        db_index=False,
+    )
+    date = models.DateField()
+    attendance = models.OneToOneField(
+        Attendance, on_delete=models.CASCADE, related_name="rollup"
+    )
+    minutes_worked = models.PositiveIntegerField(default=0)
+    on_time = models.BooleanField(default=False)
+    approval_status = models.CharField(
+        max_length=32, choices=Attendance.ApprovalStatus.choices
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["-date"]
+        verbose_name = "Attendance Day"
+        verbose_name_plural = "Attendance Days"
+        constraints = [
+            # Also serves per-intern date range reads
+            models.UniqueConstraint(
+                fields=["intern", "date"], name="attendance_day_intern_date_uniq"
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"AttendanceDay({self.intern_id} on {self.date:%Y-%m-%d})"
+
+    @property
+    def hours_worked(self) -> float:
+        return round(self.minutes_worked / 60, 2)
+
+
+class AttendanceSyncEvent(models.Model):
+    """
+    A queued check-in or check-out applied by the batch sync endpoint.
+
+    The client-generated idempotency key makes retries safe: replaying an
+    event returns the stored outcome instead of applying it again.
+    """
+
+    class Kind(models.TextChoices):
+        CHECK_IN = "check_in", "Check-in"
+        CHECK_OUT = "check_out", "Check-out"
+
+    class Outcome(models.TextChoices):
+        CHECKED_IN = "checked_in", "Checked in"
+        CHECKED_OUT = "checked_out", "Checked out"
+        ALREADY_RECORDED = "already_recorded", "Already recorded"
+
+    # Lookups by intern are served by the unique constraint in Meta
+    intern = models.ForeignKey(
+        "interns.InternProfile",
+        on_delete=models.CASCADE,
+        related_name="attendance_sync_events",
+        db_index=False,
+    )
+    idempotency_key = models.CharField(max_length=64)
+    kind = models.CharField(max_length=16, choices=Kind.choices)
+    occurred_at = models.DateTimeField()
+    attendance = models.ForeignKey(
+        Attendance,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="sync_events",
+    )
+    outcome = models.CharField(max_length=32, choices=Outcome.choices)
+    received_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["-received_at"]
+        verbose_name = "Attendance Sync Event"
+        verbose_name_plural = "Attendance Sync Events"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["intern", "idempotency_key"],
+                name="attendance_sync_event_key_uniq",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"AttendanceSyncEvent({self.intern_id} {self.kind} {self.idempotency_key})"
@@ -0,0 +1,122 @@
+"""
+Keyset (seek) pagination for attendance listings.
+
+Pages are addressed by opaque cursors encoding the ``(check_in_time, id)`` of
+the boundary row instead of an OFFSET, so fetching a deep page walks the same
+few index entries as the first one and rows inserted meanwhile never shift
+page boundaries.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from django.conf import settings
+from django.db.models import Q, QuerySet
+from django.utils.dateparse import parse_datetime
+
+DEFAULT_PAGE_SIZE = 50
+
+
+def encode_cursor(check_in_time: datetime, pk: int) -> str:
+    raw = f"{check_in_time.isoformat()}|{pk}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Optional[Tuple[datetime, int]]:
+    """Return ``(check_in_time, id)`` for a cursor, or None if it is invalid."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        timestamp, pk = base64.urlsafe_b64decode(padded).decode().rsplit("|", 1)
+        check_in_time = parse_datetime(timestamp)
+        if check_in_time is None:
+            return None
+        return check_in_time, int(pk)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        return None
+
+
+@dataclass
+class KeysetPage:
+    """One page of rows plus cursors for its neighbours"""
+
+    object_list: List = field(default_factory=list)
+    next_cursor: Optional[str] = None
+    previous_cursor: Optional[str] = None
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    @property
+    def has_previous(self) -> bool:
+        return self.previous_cursor is not None
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self) -> int:
+        return len(self.object_list)
+
+
+class AttendanceKeysetPaginator:
+    """Paginate attendance newest first on ``(check_in_time, id)``"""
+
+    def __init__(self, queryset: QuerySet, page_size: Optional[int] = None):
+        self.queryset = queryset
+        self.page_size = page_size or getattr(
+            settings, "ATTENDANCE_LIST_PAGE_SIZE", DEFAULT_PAGE_SIZE
+        )
+
+    def get_page(
+        self, after: Optional[str] = None, before: Optional[str] = None
+    ) -> KeysetPage:
+        """
+        Return the page following ``after`` or preceding ``before``.
+
+        Args:
+            after: Cursor of the last row on the previous page
+            before: Cursor of the first row on the next page
+
+        Returns:
+            KeysetPage; invalid or missing cursors yield the first page
+        """
+        after_key = decode_cursor(after) if after else None
+        before_key = decode_cursor(before) if before else None
+
+        if before_key and not after_key:
+            check_in_time, pk = before_key
+            rows = list(
+                self.queryset.filter(
+                    Q(check_in_time__gt=check_in_time)
+                    | Q(check_in_time=check_in_time, id__gt=pk)
+                ).order_by("check_in_time", "id")[: self.page_size + 1]
+            )
+            has_previous = len(rows) > self.page_size
+            rows = rows[: self.page_size][::-1]
+            has_next = True
+        else:
+            queryset = self.queryset
+            if after_key:
+                check_in_time, pk = after_key
+                queryset = queryset.filter(
+                    Q(check_in_time__lt=check_in_time)
+                    | Q(check_in_time=check_in_time, id__lt=pk)
+                )
+            rows = list(
+                queryset.order_by("-check_in_time", "-id")[: self.page_size + 1]
+            )
+            has_next = len(rows) > self.page_size
+            rows = rows[: self.page_size]
+            has_previous = after_key is not None
+
+        page = KeysetPage(object_list=rows)
+        if rows and has_next:
+            page.next_cursor = encode_cursor(rows[-1].check_in_time, rows[-1].pk)
+        if rows and has_previous:
+            page.previous_cursor = encode_cursor(rows[0].check_in_time, rows[0].pk)
+        return page
@@ -0,0 +1,236 @@
+"""
+Daily attendance rollups and hours summaries.
+
+Each dated ``Attendance`` row has one ``AttendanceDay`` holding the minutes
+worked, whether the check-in was on time and the approval state. Rows are
+upserted whenever an attendance record is saved (see
+``apps.attendance.signals``) and by the bulk approval paths, which bypass
+signals. ``rebuild_attendance_rollups`` recomputes them from scratch, e.g.
+after changing ``ATTENDANCE_START_TIME``.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import TruncMonth
+from django.utils import timezone
+
+from apps.attendance.models import Attendance, AttendanceDay
+
+DEFAULT_START_TIME = "09:00"
+DEFAULT_GRACE_MINUTES = 15
+
+ROLLUP_UPDATE_FIELDS = [
+    "intern",
+    "date",
+    "minutes_worked",
+    "on_time",
+    "approval_status",
+    "updated_at",
+]
+
+
+@dataclass(frozen=True)
+class MonthlyHours:
+    """Approved hours for one intern and calendar month"""
+
+    month: date
+    hours: float
+    days: int
+    on_time_days: int
+
+
+def _latest_on_time() -> time:
+    start = time.fromisoformat(
+        getattr(settings, "ATTENDANCE_START_TIME", DEFAULT_START_TIME)
+    )
+    grace = getattr(settings, "ATTENDANCE_GRACE_MINUTES", DEFAULT_GRACE_MINUTES)
+    return (datetime.combine(date.min, start) + timedelta(minutes=grace)).time()
+
+
+class AttendanceRollupService:
+    """Service maintaining and reading the daily attendance rollups"""
+
+    @staticmethod
+    def build_day(
+        attendance: Attendance, latest_on_time: Optional[time] = None
+    ) -> Optional[AttendanceDay]:
+        """
+        Return the unsaved rollup row for an attendance record.
+
+        Records without a ``check_in_date`` (legacy same-day duplicates) have
+        no rollup and return None.
+        """
+        if attendance.check_in_date is None:
+            return None
+        if latest_on_time is None:
+            latest_on_time = _latest_on_time()
+
+        minutes = 0
+        if attendance.check_out_time:
+            worked = attendance.check_out_time - attendance.check_in_time
+            minutes = max(0, int(worked.total_seconds() // 60))
+
+        check_in_time = attendance.check_in_time
+        if timezone.is_aware(check_in_time):
+            check_in_time = timezone.localtime(check_in_time)
+
+        return AttendanceDay(
+            intern_id=attendance.intern_id,
+            date=attendance.check_in_date,
+            attendance_id=attendance.pk,
+            minutes_worked=minutes,
+            on_time=check_in_time.time() <= latest_on_time,
+            approval_status=attendance.approval_status,
+            updated_at=timezone.now(),
+        )
+
+    @staticmethod
+    def refresh(attendances: Iterable[Attendance]) -> int:
+        """
+        Upsert rollup rows for the given attendance records in one query.
+
+        Returns:
+            Number of rollup rows written
+        """
+        latest_on_time = _latest_on_time()
+        days = [
+            day
+            for day in (
+                AttendanceRollupService.build_day(attendance, latest_on_time)
+                for attendance in attendances
+            )
+            if day is not None
+        ]
+        if not days:
+            return 0
+        AttendanceDay.objects.bulk_create(
+            days,
+            update_conflicts=True,
+            unique_fields=["attendance"],
+            update_fields=ROLLUP_UPDATE_FIELDS,
+        )
+        return len(days)
+
+    @staticmethod
+    def refresh_ids(attendance_ids: Iterable[int]) -> int:
+        """Refresh rollups after a queryset ``update()`` of these records."""
+        return AttendanceRollupService.refresh(
+            Attendance.objects.filter(id__in=list(attendance_ids)).only(
+                "intern_id",
+                "check_in_time",
+                "check_in_date",
+                "check_out_time",
+                "approval_status",
+            )
+        )
+
+    @staticmethod
+    def rebuild(
+        intern_ids: Optional[Iterable[int]] = None,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        chunk_size: int = 2000,
+    ) -> int:
+        """
+        Recompute rollups from the raw attendance records.
+
+        Existing rows in scope are deleted and rewritten in one transaction,
+        ``chunk_size`` records per INSERT.
+
+        Args:
+            intern_ids: Limit to these interns (defaults to all)
+            start: First check-in date to rebuild (inclusive)
+            end: Last check-in date to rebuild (inclusive)
+            chunk_size: Records read and written per batch
+
+        Returns:
+            Number of rollup rows written
+        """
+        scope = Q()
+        attendance_scope = Q(check_in_date__isnull=False)
+        if intern_ids is not None:
+            intern_ids = list(intern_ids)
+            scope &= Q(intern_id__in=intern_ids)
+            attendance_scope &= Q(intern_id__in=intern_ids)
+        if start is not None:
+            scope &= Q(date__gte=start)
+            attendance_scope &= Q(check_in_date__gte=start)
+        if end is not None:
+            scope &= Q(date__lte=end)
+            attendance_scope &= Q(check_in_date__lte=end)
+
+        written = 0
+        with transaction.atomic():
+            AttendanceDay.objects.filter(scope).delete()
+            attendances = (
+                Attendance.objects.filter(attendance_scope)
+                .order_by("id")
+                .only(
+                    "intern_id",
+                    "check_in_time",
+                    "check_in_date",
+                    "check_out_time",
+                    "approval_status",
+                )
+            )
+            batch: List[Attendance] = []
+            for attendance in attendances.iterator(chunk_size=chunk_size):
+                batch.append(attendance)
+                if len(batch) >= chunk_size:
+                    written += AttendanceRollupService.refresh(batch)
+                    batch = []
+            written += AttendanceRollupService.refresh(batch)
+        return written
+
+    @staticmethod
+    def monthly_hours(
+        intern_ids: Iterable[int], start: date, end: date
+    ) -> Dict[int, List[MonthlyHours]]:
+        """
+        Approved hours per intern and month between two dates.
+
+        One grouped range read on ``(intern, date)``.
+
+        Args:
+            intern_ids: Interns to summarise
+            start: First day (inclusive)
+            end: Last day (inclusive)
+
+        Returns:
+            Mapping of intern id to MonthlyHours, oldest month first
+        """
+        rows = (
+            AttendanceDay.objects.filter(
+                intern_id__in=list(intern_ids),
+                date__range=(start, end),
+                approval_status=Attendance.ApprovalStatus.APPROVED,
+            )
+            .annotate(month=TruncMonth("date"))
+            .order_by()
+            .values("intern_id", "month")
+            .annotate(
+                minutes=Sum("minutes_worked"),
+                days=Count("id"),
+                on_time_days=Count("id", filter=Q(on_time=True)),
+            )
+            .order_by("intern_id", "month")
+        )
+        summary: Dict[int, List[MonthlyHours]] = defaultdict(list)
+        for row in rows:
+            summary[row["intern_id"]].append(
+                MonthlyHours(
+                    month=row["month"],
+                    hours=round(row["minutes"] / 60, 1),
+                    days=row["days"],
+                    on_time_days=row["on_time_days"],
+                )
+            )
+        return summary
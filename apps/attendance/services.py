@@ -0,0 +1,110 @@
+"""
+Attendance approval services.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable
+
+from django.db import transaction
+from django.utils import timezone
+
+from apps.accounts.access import has_full_access, supervised_interns
+from apps.attendance.models import Attendance
+from apps.attendance.rollups import AttendanceRollupService
+from apps.notifications.services import NotificationService
+
+# Largest selection accepted by one bulk approval
+MAX_BULK_DECISIONS = 500
+
+
+@dataclass
+class BulkDecisionResult:
+    """Outcome of a bulk approve/reject request"""
+
+    updated: int = 0
+    skipped: int = 0
+
+
+class AttendanceApprovalService:
+    """Service for approving and rejecting pending attendance"""
+
+    @staticmethod
+    def reviewable_attendance(user):
+        """
+        Pending attendance the user may approve or reject.
+
+        Managers, admins and superusers see every pending record; supervisors
+        only those of their assigned interns.
+        """
+        queryset = Attendance.objects.filter(
+            approval_status=Attendance.ApprovalStatus.PENDING
+        )
+        if not has_full_access(user):
+            queryset = queryset.filter(intern__in=supervised_interns(user))
+        return queryset
+
+    @staticmethod
+    def bulk_decide(
+        user, attendance_ids: Iterable[int], approve: bool, note: str = ""
+    ) -> BulkDecisionResult:
+        """
+        Approve or reject many pending check-ins at once.
+
+        Permission and status are checked for the whole selection in one
+        query, the permitted rows are updated with a single UPDATE and the
+        interns are notified through the bulk notification path. Rows the
+        user may not review, or that are no longer pending, are skipped.
+
+        Args:
+            user: Supervisor, manager or admin making the decision
+            attendance_ids: Selected Attendance ids
+            approve: True to approve, False to reject
+            note: Rejection reason stored on each record
+
+        Returns:
+            BulkDecisionResult with updated/skipped counts
+        """
+        attendance_ids = list(set(attendance_ids))
+        with transaction.atomic():
+            attendances = list(
+                AttendanceApprovalService.reviewable_attendance(user)
+                .filter(id__in=attendance_ids)
+                .select_related("intern__user")
+                .select_for_update(of=("self",))
+                .order_by("id")
+            )
+            if not attendances:
+                return BulkDecisionResult(skipped=len(attendance_ids))
+
+            fields = {
+                "approval_status": (
+                    Attendance.ApprovalStatus.APPROVED
+                    if approve
+                    else Attendance.ApprovalStatus.REJECTED
+                ),
+                "approved_by": user,
+                "approved_at": timezone.now(),
+                "auto_approved": False,
+                "updated_at": timezone.now(),
+            }
+            if not approve and note:
+                fields["notes"] = note
+
+            updated = Attendance.objects.filter(
+                id__in=[attendance.pk for attendance in attendances],
+                approval_status=Attendance.ApprovalStatus.PENDING,
+            ).update(**fields)
+
+            # update() skips post_save, so refresh the daily rollups here
+            AttendanceRollupService.refresh_ids(
+                attendance.pk for attendance in attendances
+            )
+            NotificationService.notify_attendance_decisions(
+                attendances, approver=user, approved=approve, reason=note
+            )
+
+        return BulkDecisionResult(
+            updated=updated, skipped=len(attendance_ids) - updated
+        )
@@ -0,0 +1,10 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from apps.attendance.models import Attendance
+from apps.attendance.rollups import AttendanceRollupService
+
+
+@receiver(post_save, sender=Attendance)
+def refresh_rollup_on_save(sender, instance, **kwargs):  # type: ignore[override]
+    AttendanceRollupService.refresh([instance])
@@ -0,0 +1,225 @@
+"""
+Batch sync of check-ins and check-outs queued on a device.
+
+Interns on unreliable connections queue events locally and post them in one
+request. Every event carries a client-generated idempotency key; applied
+events are stored as ``AttendanceSyncEvent`` rows so that a retried batch
+returns the original outcomes instead of failing or double-applying.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from django.db import transaction
+from django.utils import timezone
+
+from apps.attendance.forms import AttendanceSyncEventForm
+from apps.attendance.geofence import get_geofence_index
+from apps.attendance.models import Attendance, AttendanceSyncEvent, local_date
+from apps.attendance.rollups import AttendanceRollupService
+from apps.interns.models import InternProfile
+
+# Largest number of events accepted in one sync request
+MAX_SYNC_EVENTS = 200
+
+REJECTED = "rejected"
+
+
+@dataclass
+class SyncEventResult:
+    """Outcome of one synced event"""
+
+    key: str
+    status: str
+    attendance_id: Optional[int] = None
+    approval_status: Optional[str] = None
+    replayed: bool = False
+    errors: Optional[List[str]] = None
+
+    def as_dict(self) -> dict:
+        result = {
+            "key": self.key,
+            "status": self.status,
+            "attendance_id": self.attendance_id,
+            "approval_status": self.approval_status,
+            "replayed": self.replayed,
+        }
+        if self.errors:
+            result["errors"] = self.errors
+        return result
+
+
+class AttendanceSyncService:
+    """Service applying queued attendance events in bulk"""
+
+    @staticmethod
+    def sync(
+        intern_profile: InternProfile, events: List[dict]
+    ) -> List[SyncEventResult]:
+        """
+        Apply a batch of queued check-in/check-out events.
+
+        Events are validated individually and applied in time order. Stored
+        outcomes for known keys and the attendance of the affected days are
+        read with one query each, geofences for all new check-ins are
+        checked in one batch, and the new records, check-outs, rollups and
+        sync events are each written with one bulk statement. The intern's
+        profile row is locked so concurrent syncs of the same device queue
+        apply one after the other.
+
+        Args:
+            intern_profile: Intern the events belong to (must have a branch)
+            events: Decoded event objects, see ``AttendanceSyncEventForm``
+
+        Returns:
+            One SyncEventResult per event, in request order
+        """
+        results: list = [None] * len(events)
+        pending = []
+        for position, event in enumerate(events):
+            form = AttendanceSyncEventForm(event if isinstance(event, dict) else {})
+            if form.is_valid():
+                pending.append((position, form.cleaned_data))
+            else:
+                key = event.get("key") if isinstance(event, dict) else None
+                results[position] = SyncEventResult(
+                    key=str(key or ""),
+                    status=REJECTED,
+                    errors=[
+                        error for errors in form.errors.values() for error in errors
+                    ],
+                )
+
+        with transaction.atomic():
+            InternProfile.objects.select_for_update().filter(
+                pk=intern_profile.pk
+            ).exists()
+
+            stored = {
+                event.idempotency_key: event
+                for event in AttendanceSyncEvent.objects.filter(
+                    intern=intern_profile,
+                    idempotency_key__in={data["key"] for _, data in pending},
+                ).select_related("attendance")
+            }
+            by_date: Dict = {
+                attendance.check_in_date: attendance
+                for attendance in Attendance.objects.filter(
+                    intern=intern_profile,
+                    check_in_date__in={
+                        local_date(data["timestamp"]) for _, data in pending
+                    },
+                )
+            }
+
+            created: List[Attendance] = []
+            checked_out: Dict[int, Attendance] = {}
+            applied: Dict[str, AttendanceSyncEvent] = {}
+            pending.sort(key=lambda item: item[1]["timestamp"])
+            for position, data in pending:
+                key = data["key"]
+                previous = stored.get(key) or applied.get(key)
+                if previous is not None:
+                    results[position] = (previous, True)
+                    continue
+
+                day = local_date(data["timestamp"])
+                attendance = by_date.get(day)
+                if data["type"] == AttendanceSyncEvent.Kind.CHECK_IN:
+                    if attendance is not None:
+                        outcome = AttendanceSyncEvent.Outcome.ALREADY_RECORDED
+                    else:
+                        attendance = Attendance(
+                            intern=intern_profile,
+                            branch_id=intern_profile.branch_id,
+                            check_in_time=data["timestamp"],
+                            check_in_date=day,
+                            latitude=data["latitude"],
+                            longitude=data["longitude"],
+                            location_accuracy_m=data["location_accuracy_m"],
+                            notes=data["notes"],
+                            recorded_by=intern_profile.user,
+                        )
+                        created.append(attendance)
+                        by_date[day] = attendance
+                        outcome = AttendanceSyncEvent.Outcome.CHECKED_IN
+                else:
+                    if attendance is None:
+                        results[position] = SyncEventResult(
+                            key=key,
+                            status=REJECTED,
+                            errors=["There is no check-in for that day."],
+                        )
+                        continue
+                    if attendance.check_out_time:
+                        outcome = AttendanceSyncEvent.Outcome.ALREADY_RECORDED
+                    elif data["timestamp"] < attendance.check_in_time:
+                        results[position] = SyncEventResult(
+                            key=key,
+                            status=REJECTED,
+                            errors=["Check-out is before the check-in."],
+                        )
+                        continue
+                    else:
+                        attendance.check_out_time = data["timestamp"]
+                        if data["notes"]:
+                            attendance.notes += f"\nCheckout notes: {data['notes']}"
+                        if attendance.pk:
+                            checked_out[attendance.pk] = attendance
+                        outcome = AttendanceSyncEvent.Outcome.CHECKED_OUT
+
+                applied[key] = AttendanceSyncEvent(
+                    intern=intern_profile,
+                    idempotency_key=key,
+                    kind=data["type"],
+                    occurred_at=data["timestamp"],
+                    attendance=attendance,
+                    outcome=outcome,
+                )
+                results[position] = (applied[key], False)
+
+            if created:
+                index = get_geofence_index()
+                located = index.locate_many(
+                    intern_profile.branch_id,
+                    [float(attendance.latitude) for attendance in created],
+                    [float(attendance.longitude) for attendance in created],
+                )
+                for attendance, geofence in zip(created, located):
+                    if geofence is not None:
+                        attendance.mark_auto_approved()
+                Attendance.objects.bulk_create(created)
+
+            if checked_out:
+                now = timezone.now()
+                for attendance in checked_out.values():
+                    attendance.updated_at = now
+                Attendance.objects.bulk_update(
+                    checked_out.values(), ["check_out_time", "notes", "updated_at"]
+                )
+
+            # Bulk writes bypass the post_save rollup signal
+            AttendanceRollupService.refresh([*created, *checked_out.values()])
+
+            AttendanceSyncEvent.objects.bulk_create(applied.values())
+
+        # Outcomes are read after the writes so new records report their ids
+        return [
+            AttendanceSyncService._result(*result) if isinstance(result, tuple) else result
+            for result in results
+        ]
+
+    @staticmethod
+    def _result(
+        event: AttendanceSyncEvent, replayed: bool = False
+    ) -> SyncEventResult:
+        attendance = event.attendance
+        return SyncEventResult(
+            key=event.idempotency_key,
+            status=event.outcome,
+            attendance_id=attendance.pk if attendance else None,
+            approval_status=attendance.approval_status if attendance else None,
+            replayed=replayed,
+        )
@@ -5,10 +5,13 @@ from django.urls import path
 from apps.attendance.views import (
     approve_attendance,
     attendance_list,
+    bulk_approve_attendance,
     checkout,
+    export_attendance,
     mark_attendance,
     my_attendance,
     pending_approvals,
+    sync_attendance,
 )
 
 app_name = "attendance"
@@ -17,9 +20,12 @@ urlpatterns = [
     # Intern views
     path("mark/", mark_attendance, name="mark"),
     path("my/", my_attendance, name="my_attendance"),
+    path("sync/", sync_attendance, name="sync"),
     path("<int:attendance_id>/checkout/", checkout, name="checkout"),
     # Supervisor/Manager views
     path("pending/", pending_approvals, name="pending_approvals"),
+    path("pending/bulk/", bulk_approve_attendance, name="bulk_approve"),
     path("<int:attendance_id>/approve/", approve_attendance, name="approve"),
     path("list/", attendance_list, name="list"),
+    path("list/export/", export_attendance, name="export"),
 ]
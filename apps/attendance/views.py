@@ -1,19 +1,30 @@
 from __future__ import annotations
 
+import json
+
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
-from django.db.models import Q
+from django.db import IntegrityError, transaction
+from django.http import JsonResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.utils import timezone
+from django.views.decorators.http import require_POST
 
+from apps.accounts.access import can_supervise
 from apps.accounts.decorators import intern_required, supervisor_or_above
 from apps.notifications.services import NotificationService
 from apps.attendance.forms import (
     AttendanceApprovalForm,
+    AttendanceBulkApprovalForm,
     AttendanceMarkForm,
     CheckOutForm,
 )
+from apps.attendance.export import CONTENT_TYPES, EXPORT_FORMATS, iter_export
+from apps.attendance.filters import filter_attendance
 from apps.attendance.models import Attendance
+from apps.attendance.pagination import AttendanceKeysetPaginator
+from apps.attendance.services import AttendanceApprovalService
+from apps.attendance.sync import MAX_SYNC_EVENTS, AttendanceSyncService
 from apps.interns.models import InternProfile
 
 
@@ -39,23 +50,26 @@ def mark_attendance(request):
 
     # Check if already marked attendance today
     today = timezone.localdate()
-    existing_attendance = Attendance.objects.filter(
-        intern=intern_profile, check_in_time__date=today
-    ).first()
-
-    if existing_attendance:
+    if Attendance.objects.filter(intern=intern_profile, check_in_date=today).exists():
         messages.info(request, "You have already marked attendance today.")
         return redirect("attendance:my_attendance")
 
     if request.method == "POST":
         form = AttendanceMarkForm(request.POST, intern_profile=intern_profile)
         if form.is_valid():
-            attendance = form.save()
+            # A concurrent check-in can still win the race; the unique
+            # (intern, check_in_date) constraint settles it
+            try:
+                with transaction.atomic():
+                    attendance = form.save()
+            except IntegrityError:
+                messages.info(request, "You have already marked attendance today.")
+                return redirect("attendance:my_attendance")
 
             if attendance.auto_approved:
                 messages.success(
                     request,
-                    f"✓ Attendance marked successfully! Auto-approved (within {intern_profile.branch.proximity_threshold_meters}m of branch).",
+                    "✓ Attendance marked successfully! Auto-approved (within a branch geofence).",
                 )
             else:
                 distance = attendance.distance_from_branch()
@@ -82,6 +96,54 @@ def mark_attendance(request):
     return render(request, "attendance/mark_attendance.html", context)
 
 
+@login_required
+@intern_required
+@require_POST
+def sync_attendance(request):
+    """
+    JSON endpoint applying check-ins and check-outs queued on a device.
+
+    The body is ``{"events": [...]}`` where each event has a client-generated
+    ``key``, a ``type`` (``check_in`` or ``check_out``), an ISO 8601
+    ``timestamp`` and, for check-ins, ``latitude`` and ``longitude``. The
+    response lists one result per event; retrying a batch with the same keys
+    returns the stored results. Like the other views it relies on the session
+    cookie and CSRF token.
+    """
+    try:
+        events = json.loads(request.body)["events"]
+    except (ValueError, KeyError, TypeError):
+        events = None
+    if not isinstance(events, list):
+        return JsonResponse(
+            {"error": "Expected a JSON object with an events list."}, status=400
+        )
+    if len(events) > MAX_SYNC_EVENTS:
+        return JsonResponse(
+            {"error": f"Send at most {MAX_SYNC_EVENTS} events per request."},
+            status=400,
+        )
+
+    intern_profile = (
+        InternProfile.objects.filter(user=request.user).select_related("user").first()
+    )
+    if intern_profile is None or not intern_profile.branch_id:
+        return JsonResponse(
+            {"error": "Your intern profile or branch is not set up."}, status=409
+        )
+
+    try:
+        results = AttendanceSyncService.sync(intern_profile, events)
+    except IntegrityError:
+        # A check-in saved through the form at the same moment; a retry
+        # with the same keys is safe
+        return JsonResponse(
+            {"error": "Conflicting check-in, please retry."}, status=409
+        )
+
+    return JsonResponse({"results": [result.as_dict() for result in results]})
+
+
 @login_required
 @intern_required
 def my_attendance(request):
@@ -155,31 +217,12 @@ def checkout(request, attendance_id):
 @supervisor_or_above
 def pending_approvals(request):
     """View for supervisors to see pending attendance approvals"""
-    # Get interns assigned to this supervisor
-    try:
-        from apps.supervisors.models import EmployeeProfile
-
-        employee_profile = EmployeeProfile.objects.get(user=request.user)
-        assigned_interns = employee_profile.assigned_interns.all()
-    except:
-        assigned_interns = InternProfile.objects.none()
-
-    # For managers and admins, show all pending
-    if request.user.role in ["manager", "admin"]:
-        pending_attendances = (
-            Attendance.objects.filter(approval_status=Attendance.ApprovalStatus.PENDING)
-            .select_related("intern__user", "branch")
-            .order_by("-check_in_time")
-        )
-    else:
-        pending_attendances = (
-            Attendance.objects.filter(
-                intern__in=assigned_interns,
-                approval_status=Attendance.ApprovalStatus.PENDING,
-            )
-            .select_related("intern__user", "branch")
-            .order_by("-check_in_time")
-        )
+    # Managers and admins see all pending records, supervisors their interns'
+    pending_attendances = (
+        AttendanceApprovalService.reviewable_attendance(request.user)
+        .select_related("intern__user", "branch")
+        .order_by("-check_in_time")
+    )
 
     context = {
         "pending_attendances": pending_attendances,
@@ -187,6 +230,40 @@ def pending_approvals(request):
     return render(request, "attendance/pending_approvals.html", context)
 
 
+@login_required
+@supervisor_or_above
+def bulk_approve_attendance(request):
+    """Approve or reject the pending attendance selected on the approvals page"""
+    if request.method != "POST":
+        return redirect("attendance:pending_approvals")
+
+    form = AttendanceBulkApprovalForm(request.POST)
+    if not form.is_valid():
+        for errors in form.errors.values():
+            for error in errors:
+                messages.error(request, error)
+        return redirect("attendance:pending_approvals")
+
+    approve = form.cleaned_data["action"] == "approve"
+    result = AttendanceApprovalService.bulk_decide(
+        request.user,
+        form.cleaned_data["attendance_ids"],
+        approve=approve,
+        note=form.cleaned_data.get("note", ""),
+    )
+
+    if result.updated:
+        verb = "approved" if approve else "rejected"
+        messages.success(request, f"✓ {result.updated} attendance record(s) {verb}.")
+    if result.skipped:
+        messages.warning(
+            request,
+            f"{result.skipped} record(s) were skipped because they were already "
+            "processed or you cannot review them.",
+        )
+    return redirect("attendance:pending_approvals")
+
+
 @login_required
 @supervisor_or_above
 def approve_attendance(request, attendance_id):
@@ -194,21 +271,11 @@ def approve_attendance(request, attendance_id):
     attendance = get_object_or_404(Attendance, id=attendance_id)
 
     # Check permission - must be supervisor of this intern or manager/admin
-    if request.user.role not in ["manager", "admin"]:
-        try:
-            from apps.supervisors.models import EmployeeProfile
-
-            employee_profile = EmployeeProfile.objects.get(user=request.user)
-            if attendance.intern not in employee_profile.assigned_interns.all():
-                messages.error(
-                    request, "You do not have permission to approve this attendance."
-                )
-                return redirect("attendance:pending_approvals")
-        except:
-            messages.error(
-                request, "You do not have permission to approve this attendance."
-            )
-            return redirect("attendance:pending_approvals")
+    if not can_supervise(request.user, attendance.intern_id):
+        messages.error(
+            request, "You do not have permission to approve this attendance."
+        )
+        return redirect("attendance:pending_approvals")
 
     if attendance.approval_status != Attendance.ApprovalStatus.PENDING:
         messages.warning(request, "This attendance has already been processed.")
@@ -260,36 +327,45 @@ def approve_attendance(request, attendance_id):
 @login_required
 @supervisor_or_above
 def attendance_list(request):
-    """View all attendance records with filters"""
-    attendances = (
-        Attendance.objects.all()
-        .select_related("intern__user", "branch", "approved_by")
-        .order_by("-check_in_time")
+    """View all attendance records with filters, paginated by keyset cursors"""
+    attendances = Attendance.objects.all().select_related(
+        "intern__user", "branch", "approved_by"
     )
 
-    # Apply filters
-    status_filter = request.GET.get("status")
-    if status_filter:
-        attendances = attendances.filter(approval_status=status_filter)
-
-    intern_filter = request.GET.get("intern")
-    if intern_filter:
-        attendances = attendances.filter(
-            Q(intern__user__first_name__icontains=intern_filter)
-            | Q(intern__user__last_name__icontains=intern_filter)
-            | Q(intern__user__email__icontains=intern_filter)
-        )
+    attendances = filter_attendance(attendances, request.GET)
 
-    date_from = request.GET.get("date_from")
-    if date_from:
-        attendances = attendances.filter(check_in_time__date__gte=date_from)
+    page = AttendanceKeysetPaginator(attendances).get_page(
+        after=request.GET.get("after"), before=request.GET.get("before")
+    )
 
-    date_to = request.GET.get("date_to")
-    if date_to:
-        attendances = attendances.filter(check_in_time__date__lte=date_to)
+    # Keep the active filters on the next/previous links
+    filters = request.GET.copy()
+    filters.pop("after", None)
+    filters.pop("before", None)
+    filter_query = filters.urlencode()
 
     context = {
-        "attendances": attendances,
+        "attendances": page,
+        "page": page,
+        "filter_query": filter_query,
         "status_choices": Attendance.ApprovalStatus.choices,
     }
     return render(request, "attendance/attendance_list.html", context)
+
+
+@login_required
+@supervisor_or_above
+def export_attendance(request):
+    """Stream the filtered attendance list as CSV or XLSX"""
+    export_format = request.GET.get("format", "csv")
+    if export_format not in EXPORT_FORMATS:
+        export_format = "csv"
+
+    attendances = filter_attendance(Attendance.objects.all(), request.GET)
+    response = StreamingHttpResponse(
+        iter_export(attendances, export_format),
+        content_type=CONTENT_TYPES[export_format],
+    )
+    filename = f"attendance-{timezone.localdate():%Y%m%d}.{export_format}"
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
@@ -1,12 +1,37 @@
-from django.contrib import admin
+from django.contrib import admin, messages
 
-from apps.branches.models import Branch, BranchEmployeeAssignment
+from apps.attendance.geofence import GeofenceService
+from apps.branches.models import Branch, BranchEmployeeAssignment, BranchSite
+
+GEOFENCE_FIELDS = {"latitude", "longitude", "proximity_threshold_meters"}
+
+
+class BranchSiteInline(admin.TabularInline):
+    model = BranchSite
+    extra = 0
+    fields = ("name", "latitude", "longitude", "radius_meters", "polygon", "is_active")
 
 
 @admin.register(Branch)
 class BranchAdmin(admin.ModelAdmin):
     list_display = ("name", "code", "city", "country", "proximity_threshold_meters")
     search_fields = ("name", "code", "city", "country")
+    inlines = [BranchSiteInline]
+
+    def save_related(self, request, form, formsets, change):
+        super().save_related(request, form, formsets, change)
+        obj = form.instance
+        sites_changed = any(formset.has_changed() for formset in formsets)
+        if change and (GEOFENCE_FIELDS.intersection(form.changed_data) or sites_changed):
+            # Pending check-ins may now be inside the updated geofence
+            result = GeofenceService.revalidate_pending([obj.pk])
+            if result.approved:
+                self.message_user(
+                    request,
+                    f"{result.approved} pending check-in(s) are now within a "
+                    "branch geofence and were auto-approved.",
+                    messages.INFO,
+                )
 
 
 @admin.register(BranchEmployeeAssignment)
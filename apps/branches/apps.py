@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from django.apps import AppConfig
 
 
@@ -5,3 +7,9 @@ class BranchesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.branches"
     verbose_name = "Branches"
+
+    def ready(self) -> None:
+        # Import signal handlers that keep the geofence index current.
+        from . import signals  # noqa: F401
+
+        return super().ready()
@@ -0,0 +1,35 @@
+# Generated by Django 4.2.11 on 2026-10-17 03:32
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('branches', '0002_alter_branch_latitude_alter_branch_longitude'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BranchSite',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255)),
+                ('latitude', models.DecimalField(blank=True, decimal_places=9, max_digits=12, null=True)),
+                ('longitude', models.DecimalField(blank=True, decimal_places=9, max_digits=12, null=True)),
+                ('radius_meters', models.PositiveIntegerField(blank=True, help_text='Radius of a circular site. Defaults to the branch threshold.', null=True)),
+                ('polygon', models.JSONField(blank=True, default=list, help_text='Polygon vertices as [[latitude, longitude], ...]. Overrides the circle.')),
+                ('is_active', models.BooleanField(default=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('branch', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='sites', to='branches.branch')),
+            ],
+            options={
+                'verbose_name': 'Branch Site',
+                'verbose_name_plural': 'Branch Sites',
+                'ordering': ['branch', 'name'],
+                'unique_together': {('branch', 'name')},
+            },
+        ),
+    ]
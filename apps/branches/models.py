@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from django.core.exceptions import ValidationError
 from django.db import models
 
 
@@ -31,6 +32,64 @@ class Branch(models.Model):
         return f"{self.name} ({self.code})"
 
 
+class BranchSite(models.Model):
+    """
+    An additional geofence for a branch, such as a satellite office.
+
+    A site is either a circle (``latitude``/``longitude`` and a radius) or a
+    polygon given as a list of ``[latitude, longitude]`` vertices. Check-ins
+    inside the branch location or any active site are auto-approved.
+    """
+
+    branch = models.ForeignKey(Branch, on_delete=models.CASCADE, related_name="sites")
+    name = models.CharField(max_length=255)
+    latitude = models.DecimalField(
+        max_digits=12, decimal_places=9, null=True, blank=True
+    )
+    longitude = models.DecimalField(
+        max_digits=12, decimal_places=9, null=True, blank=True
+    )
+    radius_meters = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        help_text="Radius of a circular site. Defaults to the branch threshold.",
+    )
+    polygon = models.JSONField(
+        default=list,
+        blank=True,
+        help_text="Polygon vertices as [[latitude, longitude], ...]. Overrides the circle.",
+    )
+    is_active = models.BooleanField(default=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["branch", "name"]
+        unique_together = ("branch", "name")
+        verbose_name = "Branch Site"
+        verbose_name_plural = "Branch Sites"
+
+    def __str__(self) -> str:
+        return f"{self.name} ({self.branch.code})"
+
+    def clean(self) -> None:
+        if self.polygon:
+            try:
+                points = [(float(lat), float(lon)) for lat, lon in self.polygon]
+            except (TypeError, ValueError):
+                raise ValidationError(
+                    {"polygon": "Use a list of [latitude, longitude] pairs."}
+                )
+            if len(points) < 3:
+                raise ValidationError({"polygon": "A polygon needs at least 3 points."})
+            if any(abs(lat) > 90 or abs(lon) > 180 for lat, lon in points):
+                raise ValidationError({"polygon": "Coordinates are out of range."})
+        elif self.latitude is None or self.longitude is None:
+            raise ValidationError(
+                "Give either a latitude/longitude for a circular site or a polygon."
+            )
+
+
 class BranchEmployeeAssignment(models.Model):
     class AssignmentRole(models.TextChoices):
         SUPERVISOR = "supervisor", "Supervisor"
@@ -0,0 +1,17 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.attendance.geofence import invalidate_geofence_index
+from apps.branches.models import Branch, BranchSite
+
+
+@receiver(post_save, sender=Branch)
+@receiver(post_save, sender=BranchSite)
+def invalidate_geofences_on_save(sender, instance, **kwargs):  # type: ignore[override]
+    invalidate_geofence_index()
+
+
+@receiver(post_delete, sender=Branch)
+@receiver(post_delete, sender=BranchSite)
+def invalidate_geofences_on_delete(sender, instance, **kwargs):  # type: ignore[override]
+    invalidate_geofence_index()
@@ -0,0 +1,135 @@
+"""
+Aggregated statistics for the role dashboards.
+
+Each ``*_stats`` method collapses every status breakdown for one table into a
+single conditional-aggregate query and returns a small typed result object.
+Callers narrow the scope by passing an already filtered queryset.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional
+
+from django.db.models import Avg, Count, Q, QuerySet
+
+from apps.absenteeism.models import AbsenteeismRequest
+from apps.attendance.models import Attendance
+from apps.evaluations.models import PerformanceAssessment
+
+
+@dataclass(frozen=True)
+class AttendanceStats:
+    total: int = 0
+    approved: int = 0
+    pending: int = 0
+    rejected: int = 0
+    today: int = 0
+
+
+@dataclass(frozen=True)
+class AssessmentStats:
+    total: int = 0
+    draft: int = 0
+    submitted: int = 0
+    reviewed: int = 0
+    pending_self_assessment: int = 0
+    awaiting_review: int = 0
+    average_supervisor_score: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class AbsenceStats:
+    total: int = 0
+    pending: int = 0
+    approved: int = 0
+    rejected: int = 0
+    cancelled: int = 0
+
+
+class DashboardStatsService:
+    """Service for computing dashboard statistics in one query per table"""
+
+    @staticmethod
+    def attendance_stats(
+        queryset: Optional[QuerySet] = None, today: Optional[date] = None
+    ) -> AttendanceStats:
+        """
+        Return attendance totals by approval status.
+
+        Args:
+            queryset: Attendance queryset to summarise (defaults to all rows)
+            today: When given, also count check-ins made on this date
+
+        Returns:
+            AttendanceStats instance
+        """
+        if queryset is None:
+            queryset = Attendance.objects.all()
+
+        status = Attendance.ApprovalStatus
+        aggregates = {
+            "total": Count("id"),
+            "approved": Count("id", filter=Q(approval_status=status.APPROVED)),
+            "pending": Count("id", filter=Q(approval_status=status.PENDING)),
+            "rejected": Count("id", filter=Q(approval_status=status.REJECTED)),
+        }
+        if today is not None:
+            aggregates["today"] = Count("id", filter=Q(check_in_date=today))
+
+        return AttendanceStats(**queryset.aggregate(**aggregates))
+
+    @staticmethod
+    def assessment_stats(queryset: Optional[QuerySet] = None) -> AssessmentStats:
+        """
+        Return assessment totals by workflow status plus the average score.
+
+        Args:
+            queryset: PerformanceAssessment queryset to summarise
+
+        Returns:
+            AssessmentStats instance
+        """
+        if queryset is None:
+            queryset = PerformanceAssessment.objects.all()
+
+        status = PerformanceAssessment.Status
+        result = queryset.aggregate(
+            total=Count("id"),
+            draft=Count("id", filter=Q(status=status.DRAFT)),
+            submitted=Count("id", filter=Q(status=status.SUBMITTED)),
+            reviewed=Count("id", filter=Q(status=status.REVIEWED)),
+            pending_self_assessment=Count(
+                "id", filter=Q(status=status.DRAFT, intern_score__isnull=True)
+            ),
+            awaiting_review=Count(
+                "id", filter=Q(status=status.SUBMITTED, supervisor_score__isnull=True)
+            ),
+            average_supervisor_score=Avg("supervisor_score"),
+        )
+        return AssessmentStats(**result)
+
+    @staticmethod
+    def absence_stats(queryset: Optional[QuerySet] = None) -> AbsenceStats:
+        """
+        Return absence request totals by status.
+
+        Args:
+            queryset: AbsenteeismRequest queryset to summarise
+
+        Returns:
+            AbsenceStats instance
+        """
+        if queryset is None:
+            queryset = AbsenteeismRequest.objects.all()
+
+        status = AbsenteeismRequest.Status
+        result = queryset.aggregate(
+            total=Count("id"),
+            pending=Count("id", filter=Q(status=status.PENDING)),
+            approved=Count("id", filter=Q(status=status.APPROVED)),
+            rejected=Count("id", filter=Q(status=status.REJECTED)),
+            cancelled=Count("id", filter=Q(status=status.CANCELLED)),
+        )
+        return AbsenceStats(**result)
@@ -3,7 +3,6 @@ from __future__ import annotations
 from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib.auth.decorators import login_required
 from django.utils import timezone
-from django.db.models import Count, Avg, Q
 
 from apps.accounts.decorators import (
     admin_required,
@@ -15,11 +14,13 @@ from apps.accounts.decorators import (
 from apps.interns.models import InternProfile
 from apps.supervisors.models import EmployeeProfile
 from apps.attendance.models import Attendance
+from apps.attendance.rollups import AttendanceRollupService
 from apps.evaluations.models import PerformanceAssessment
 from apps.absenteeism.models import AbsenteeismRequest
 from apps.branches.models import Branch
 from apps.schools.models import School
 from apps.accounts.models import User
+from apps.dashboards.services import DashboardStatsService
 
 
 @login_required
@@ -48,49 +49,20 @@ def intern_dashboard(request):
     today = timezone.localdate()
     intern_profile = get_object_or_404(InternProfile, user=request.user)
 
-    # Attendance statistics
-    total_attendance = Attendance.objects.filter(intern=intern_profile).count()
-    approved_attendance = Attendance.objects.filter(
-        intern=intern_profile, approval_status="approved"
-    ).count()
-    pending_attendance = Attendance.objects.filter(
-        intern=intern_profile, approval_status="pending"
-    ).count()
-    rejected_attendance = Attendance.objects.filter(
-        intern=intern_profile, approval_status="rejected"
-    ).count()
-
-    # Check if marked attendance today
-    has_checked_in_today = Attendance.objects.filter(
-        intern=intern_profile, check_in_time__date=today
-    ).exists()
-
-    # Assessment statistics
-    total_assessments = PerformanceAssessment.objects.filter(
-        intern=intern_profile
-    ).count()
-    pending_self_assessments = PerformanceAssessment.objects.filter(
-        intern=intern_profile, status="draft", intern_score__isnull=True
-    ).count()
-    reviewed_assessments = PerformanceAssessment.objects.filter(
-        intern=intern_profile, status="reviewed"
-    ).count()
-
-    # Average supervisor score
-    avg_score = PerformanceAssessment.objects.filter(
-        intern=intern_profile, supervisor_score__isnull=False
-    ).aggregate(Avg("supervisor_score"))["supervisor_score__avg"]
-
-    # Absenteeism statistics
-    total_absence_requests = AbsenteeismRequest.objects.filter(
-        intern=intern_profile
-    ).count()
-    pending_absence_requests = AbsenteeismRequest.objects.filter(
-        intern=intern_profile, status="pending"
-    ).count()
-    approved_absence_requests = AbsenteeismRequest.objects.filter(
-        intern=intern_profile, status="approved"
-    ).count()
+    # Status breakdowns, one query per table
+    attendance_stats = DashboardStatsService.attendance_stats(
+        Attendance.objects.filter(intern=intern_profile), today=today
+    )
+    assessment_stats = DashboardStatsService.assessment_stats(
+        PerformanceAssessment.objects.filter(intern=intern_profile)
+    )
+    absence_stats = DashboardStatsService.absence_stats(
+        AbsenteeismRequest.objects.filter(intern=intern_profile)
+    )
+    avg_score = assessment_stats.average_supervisor_score
+    this_month = AttendanceRollupService.monthly_hours(
+        [intern_profile.id], start=today.replace(day=1), end=today
+    ).get(intern_profile.id)
 
     # Recent assessments (last 3)
     recent_assessments = PerformanceAssessment.objects.filter(
@@ -105,21 +77,22 @@ def intern_dashboard(request):
     context = {
         "today": today,
         "intern_profile": intern_profile,
-        "has_checked_in_today": has_checked_in_today,
+        "has_checked_in_today": attendance_stats.today > 0,
         # Attendance stats
-        "total_attendance": total_attendance,
-        "approved_attendance": approved_attendance,
-        "pending_attendance": pending_attendance,
-        "rejected_attendance": rejected_attendance,
+        "total_attendance": attendance_stats.total,
+        "approved_attendance": attendance_stats.approved,
+        "pending_attendance": attendance_stats.pending,
+        "rejected_attendance": attendance_stats.rejected,
+        "hours_this_month": this_month[0].hours if this_month else 0,
         # Assessment stats
-        "total_assessments": total_assessments,
-        "pending_self_assessments": pending_self_assessments,
-        "reviewed_assessments": reviewed_assessments,
+        "total_assessments": assessment_stats.total,
+        "pending_self_assessments": assessment_stats.pending_self_assessment,
+        "reviewed_assessments": assessment_stats.reviewed,
         "average_score": round(avg_score, 1) if avg_score else None,
         # Absence stats
-        "total_absence_requests": total_absence_requests,
-        "pending_absence_requests": pending_absence_requests,
-        "approved_absence_requests": approved_absence_requests,
+        "total_absence_requests": absence_stats.total,
+        "pending_absence_requests": absence_stats.pending,
+        "approved_absence_requests": absence_stats.approved,
         # Recent items
         "recent_assessments": recent_assessments,
         "recent_absence_requests": recent_absence_requests,
@@ -135,23 +108,21 @@ def supervisor_dashboard(request):
     employee_profile = get_object_or_404(EmployeeProfile, user=request.user)
 
     # Get assigned interns
-    my_interns = InternProfile.objects.filter(internal_supervisor=employee_profile)
+    my_interns = InternProfile.objects.filter(
+        internal_supervisor=employee_profile
+    ).select_related("user", "school", "branch")
     intern_count = my_interns.count()
 
-    # Pending attendance approvals
-    pending_attendance = Attendance.objects.filter(
-        intern__internal_supervisor=employee_profile, approval_status="pending"
-    ).count()
-
-    # Pending assessments (submitted, awaiting supervisor review)
-    pending_assessments = PerformanceAssessment.objects.filter(
-        assessed_by=employee_profile, status="submitted", supervisor_score__isnull=True
-    ).count()
-
-    # Pending absence requests
-    pending_absences = AbsenteeismRequest.objects.filter(
-        intern__internal_supervisor=employee_profile, status="pending"
-    ).count()
+    # Pending items for this supervisor's interns
+    attendance_stats = DashboardStatsService.attendance_stats(
+        Attendance.objects.filter(intern__internal_supervisor=employee_profile)
+    )
+    assessment_stats = DashboardStatsService.assessment_stats(
+        PerformanceAssessment.objects.filter(assessed_by=employee_profile)
+    )
+    absence_stats = DashboardStatsService.absence_stats(
+        AbsenteeismRequest.objects.filter(intern__internal_supervisor=employee_profile)
+    )
 
     # Recent activities
     recent_attendance = (
@@ -183,9 +154,9 @@ def supervisor_dashboard(request):
         "employee_profile": employee_profile,
         "intern_count": intern_count,
         "my_interns": my_interns[:10],  # Show first 10
-        "pending_attendance": pending_attendance,
-        "pending_assessments": pending_assessments,
-        "pending_absences": pending_absences,
+        "pending_attendance": attendance_stats.pending,
+        "pending_assessments": assessment_stats.awaiting_review,
+        "pending_absences": absence_stats.pending,
         "recent_attendance": recent_attendance,
         "recent_assessments": recent_assessments,
         "recent_absences": recent_absences,
@@ -205,14 +176,11 @@ def manager_dashboard(request):
         user__role__in=["supervisor", "manager"]
     ).count()
     total_branches = Branch.objects.count()
-    total_assessments = PerformanceAssessment.objects.count()
 
-    # Pending items across system
-    pending_attendance = Attendance.objects.filter(approval_status="pending").count()
-    pending_assessments = PerformanceAssessment.objects.filter(
-        status="submitted", supervisor_score__isnull=True
-    ).count()
-    pending_absences = AbsenteeismRequest.objects.filter(status="pending").count()
+    # Status breakdowns across the system
+    attendance_stats = DashboardStatsService.attendance_stats()
+    assessment_stats = DashboardStatsService.assessment_stats()
+    absence_stats = DashboardStatsService.absence_stats()
 
     # Active interns (with recent attendance)
     active_interns = (
@@ -241,11 +209,11 @@ def manager_dashboard(request):
         "total_interns": total_interns,
         "total_supervisors": total_supervisors,
         "total_branches": total_branches,
-        "total_assessments": total_assessments,
+        "total_assessments": assessment_stats.total,
         "active_interns": active_interns,
-        "pending_attendance": pending_attendance,
-        "pending_assessments": pending_assessments,
-        "pending_absences": pending_absences,
+        "pending_attendance": attendance_stats.pending,
+        "pending_assessments": assessment_stats.awaiting_review,
+        "pending_absences": absence_stats.pending,
         "recent_attendance": recent_attendance,
         "recent_assessments": recent_assessments,
         "recent_absences": recent_absences,
@@ -267,16 +235,9 @@ def admin_dashboard(request):
     total_schools = School.objects.count()
 
     # Activity statistics
-    total_attendance = Attendance.objects.count()
-    total_assessments = PerformanceAssessment.objects.count()
-    total_absences = AbsenteeismRequest.objects.count()
-
-    # Pending items
-    pending_attendance = Attendance.objects.filter(approval_status="pending").count()
-    pending_assessments = PerformanceAssessment.objects.filter(
-        status="submitted", supervisor_score__isnull=True
-    ).count()
-    pending_absences = AbsenteeismRequest.objects.filter(status="pending").count()
+    attendance_stats = DashboardStatsService.attendance_stats()
+    assessment_stats = DashboardStatsService.assessment_stats()
+    absence_stats = DashboardStatsService.absence_stats()
 
     # Recent activity across the system
     recent_users = User.objects.order_by("-date_joined")[:5]
@@ -299,12 +260,12 @@ def admin_dashboard(request):
         "total_supervisors": total_supervisors,
         "total_branches": total_branches,
         "total_schools": total_schools,
-        "total_attendance": total_attendance,
-        "total_assessments": total_assessments,
-        "total_absences": total_absences,
-        "pending_attendance": pending_attendance,
-        "pending_assessments": pending_assessments,
-        "pending_absences": pending_absences,
+        "total_attendance": attendance_stats.total,
+        "total_assessments": assessment_stats.total,
+        "total_absences": absence_stats.total,
+        "pending_attendance": attendance_stats.pending,
+        "pending_assessments": assessment_stats.awaiting_review,
+        "pending_absences": absence_stats.pending,
         "active_sessions": active_sessions,
         "recent_users": recent_users,
         "recent_attendance": recent_attendance,
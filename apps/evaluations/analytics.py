@@ -0,0 +1,277 @@
+"""
+Score-trend analytics for performance assessments.
+
+Week-over-week changes, rolling means and the self-vs-supervisor gap are
+computed with window functions over the scored assessments of many interns
+in one query. Cohort percentiles rank each intern's average supervisor score
+against the other interns of their branch, again in one windowed query.
+
+Trends are cached per intern and cohort percentiles per branch; both are
+dropped when an assessment is saved or deleted (see
+``apps.evaluations.signals``), so dashboards and reports read assessment
+history only after it changes.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from typing import Dict, Iterable, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Avg, F, FloatField, RowRange, Window
+from django.db.models.functions import Cast, CumeDist, Lag
+
+from apps.evaluations.models import PerformanceAssessment
+from apps.interns.models import InternProfile
+
+CACHE_TIMEOUT = getattr(settings, "ASSESSMENT_ANALYTICS_CACHE_TIMEOUT", 3600)
+DEFAULT_ROLLING_WEEKS = 4
+
+TREND_KEY = "evaluations:score_trend:{intern_id}"
+COHORT_KEY = "evaluations:cohort_percentiles:{branch_id}"
+
+
+@dataclass(frozen=True)
+class WeeklyScore:
+    """One scored assessment with its trend figures"""
+
+    week_number: int
+    supervisor_score: int
+    intern_score: Optional[int]
+    # Change from the previous scored week, None for the first
+    change: Optional[int]
+    rolling_mean: float
+    # Self score minus supervisor score, None without a self score
+    gap: Optional[int]
+
+
+@dataclass(frozen=True)
+class ScoreTrend:
+    """Score history and summary figures for one intern"""
+
+    intern_id: int
+    weeks: Tuple[WeeklyScore, ...] = ()
+    average_score: Optional[float] = None
+    average_gap: Optional[float] = None
+    # Share of the branch cohort scoring at or below this intern, 0-100
+    percentile: Optional[float] = None
+
+    @property
+    def latest(self) -> Optional[WeeklyScore]:
+        return self.weeks[-1] if self.weeks else None
+
+    @property
+    def direction(self) -> str:
+        """``up``, ``down`` or ``flat`` for the latest week-over-week change"""
+        change = self.latest.change if self.latest else None
+        if not change:
+            return "flat"
+        return "up" if change > 0 else "down"
+
+
+def _rolling_weeks() -> int:
+    return getattr(settings, "ASSESSMENT_TREND_WEEKS", DEFAULT_ROLLING_WEEKS)
+
+
+class ScoreAnalyticsService:
+    """Service computing and caching assessment score trends"""
+
+    @staticmethod
+    def trends(profiles: Iterable[InternProfile]) -> Dict[int, ScoreTrend]:
+        """
+        Score trends for many interns, with cohort percentiles.
+
+        Cached trends and percentiles are fetched with one cache round-trip
+        each; misses cost one windowed query for all missing interns and one
+        for all missing branches.
+
+        Args:
+            profiles: InternProfile instances
+
+        Returns:
+            Mapping of intern id to ScoreTrend
+        """
+        profiles = list(profiles)
+        trend_keys = {
+            profile.id: TREND_KEY.format(intern_id=profile.id) for profile in profiles
+        }
+        cached = cache.get_many(trend_keys.values())
+        trends = {
+            intern_id: cached[key]
+            for intern_id, key in trend_keys.items()
+            if key in cached
+        }
+        missing = [intern_id for intern_id in trend_keys if intern_id not in trends]
+        if missing:
+            computed = ScoreAnalyticsService._compute_trends(missing)
+            cache.set_many(
+                {trend_keys[intern_id]: trend for intern_id, trend in computed.items()},
+                CACHE_TIMEOUT,
+            )
+            trends.update(computed)
+
+        percentiles = ScoreAnalyticsService.cohort_percentiles(
+            {profile.branch_id for profile in profiles if profile.branch_id}
+        )
+        return {
+            intern_id: replace(trend, percentile=percentiles.get(intern_id))
+            for intern_id, trend in trends.items()
+        }
+
+    @staticmethod
+    def trend(profile: InternProfile) -> ScoreTrend:
+        """Score trend for one intern, see ``trends``."""
+        return ScoreAnalyticsService.trends([profile])[profile.id]
+
+    @staticmethod
+    def cohort_percentiles(branch_ids: Iterable[int]) -> Dict[int, float]:
+        """
+        Percentile of each intern's average supervisor score in their branch.
+
+        Args:
+            branch_ids: Branches whose cohorts to rank
+
+        Returns:
+            Mapping of intern id to percentile (0-100) for scored interns
+        """
+        cohort_keys = {
+            branch_id: COHORT_KEY.format(branch_id=branch_id)
+            for branch_id in branch_ids
+        }
+        cached = cache.get_many(cohort_keys.values())
+        percentiles: Dict[int, float] = {}
+        missing = []
+        for branch_id, key in cohort_keys.items():
+            if key in cached:
+                percentiles.update(cached[key])
+            else:
+                missing.append(branch_id)
+        if not missing:
+            return percentiles
+
+        computed: Dict[int, Dict[int, float]] = {branch_id: {} for branch_id in missing}
+        rows = (
+            InternProfile.objects.filter(
+                branch_id__in=missing, assessments__supervisor_score__isnull=False
+            )
+            .order_by()
+            .values("id", "branch_id")
+            .annotate(average=Avg("assessments__supervisor_score"))
+            .annotate(
+                percentile=Window(
+                    CumeDist(), partition_by=F("branch_id"), order_by=F("average").asc()
+                )
+            )
+            .values_list("id", "branch_id", "percentile")
+        )
+        for intern_id, branch_id, percentile in rows:
+            computed[branch_id][intern_id] = round(percentile * 100, 1)
+
+        cache.set_many(
+            {cohort_keys[branch_id]: ranks for branch_id, ranks in computed.items()},
+            CACHE_TIMEOUT,
+        )
+        for ranks in computed.values():
+            percentiles.update(ranks)
+        return percentiles
+
+    @staticmethod
+    def _compute_trends(intern_ids) -> Dict[int, ScoreTrend]:
+        by_intern = {"partition_by": F("intern_id")}
+        in_week_order = {**by_intern, "order_by": F("week_number").asc()}
+        gap = F("intern_score") - F("supervisor_score")
+        rows = (
+            PerformanceAssessment.objects.filter(
+                intern_id__in=intern_ids, supervisor_score__isnull=False
+            )
+            .annotate(
+                previous_score=Window(Lag("supervisor_score"), **in_week_order),
+                rolling_mean=Window(
+                    Avg(Cast("supervisor_score", FloatField())),
+                    frame=RowRange(start=-(_rolling_weeks() - 1), end=0),
+                    **in_week_order,
+                ),
+                average_score=Window(
+                    Avg(Cast("supervisor_score", FloatField())), **by_intern
+                ),
+                average_gap=Window(Avg(Cast(gap, FloatField())), **by_intern),
+            )
+            .order_by("intern_id", "week_number")
+            .values_list(
+                "intern_id",
+                "week_number",
+                "supervisor_score",
+                "intern_score",
+                "previous_score",
+                "rolling_mean",
+                "average_score",
+                "average_gap",
+            )
+        )
+
+        weeks: Dict[int, list] = {intern_id: [] for intern_id in intern_ids}
+        averages: Dict[int, Tuple[Optional[float], Optional[float]]] = {}
+        for (
+            intern_id,
+            week_number,
+            supervisor_score,
+            intern_score,
+            previous_score,
+            rolling_mean,
+            average_score,
+            average_gap,
+        ) in rows:
+            weeks[intern_id].append(
+                WeeklyScore(
+                    week_number=week_number,
+                    supervisor_score=supervisor_score,
+                    intern_score=intern_score,
+                    change=(
+                        supervisor_score - previous_score
+                        if previous_score is not None
+                        else None
+                    ),
+                    rolling_mean=round(rolling_mean, 1),
+                    gap=(
+                        intern_score - supervisor_score
+                        if intern_score is not None
+                        else None
+                    ),
+                )
+            )
+            averages[intern_id] = (
+                round(average_score, 1),
+                round(average_gap, 1) if average_gap is not None else None,
+            )
+
+        return {
+            intern_id: ScoreTrend(
+                intern_id=intern_id,
+                weeks=tuple(scores),
+                average_score=averages.get(intern_id, (None, None))[0],
+                average_gap=averages.get(intern_id, (None, None))[1],
+            )
+            for intern_id, scores in weeks.items()
+        }
+
+
+def invalidate(intern_ids: Iterable[int], branch_ids: Iterable[int] = ()) -> None:
+    """
+    Drop cached trends for interns and percentiles for their branches.
+
+    As with the notification cache, keys are deleted now and once more on
+    commit.
+    """
+    keys = [TREND_KEY.format(intern_id=intern_id) for intern_id in set(intern_ids)]
+    keys += [
+        COHORT_KEY.format(branch_id=branch_id)
+        for branch_id in set(branch_ids)
+        if branch_id
+    ]
+    if not keys:
+        return
+
+    cache.delete_many(keys)
+    transaction.on_commit(lambda: cache.delete_many(keys))
@@ -5,3 +5,9 @@ class EvaluationsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.evaluations"
     verbose_name = "Evaluations"
+
+    def ready(self) -> None:
+        # Import signal handlers that keep the score analytics cache current.
+        from . import signals  # noqa: F401
+
+        return super().ready()
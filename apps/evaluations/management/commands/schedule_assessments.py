@@ -0,0 +1,68 @@
+"""
+Management command to create the next draft assessment for due interns
+
+Schedule it daily or weekly from cron, e.g.:
+    0 7 * * 1 python manage.py schedule_assessments
+"""
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+from apps.evaluations.scheduler import FREQUENCY_DAYS, AssessmentScheduler
+
+
+class Command(BaseCommand):
+    help = (
+        "Create draft assessments for active interns whose last assessment is "
+        "at least one DEFAULT_ASSESSMENT_FREQUENCY period old"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--date",
+            type=str,
+            help="Assessment date (YYYY-MM-DD, defaults to today)",
+        )
+        parser.add_argument(
+            "--frequency",
+            choices=list(FREQUENCY_DAYS),
+            help="Override DEFAULT_ASSESSMENT_FREQUENCY",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report how many interns are due",
+        )
+
+    def handle(self, *args, **options):
+        day = timezone.localdate()
+        if options["date"]:
+            try:
+                day = parse_date(options["date"])
+            except ValueError:
+                day = None
+            if day is None:
+                raise CommandError("--date must be a date in YYYY-MM-DD format.")
+
+        start_time = time.time()
+        try:
+            result = AssessmentScheduler.schedule(
+                day, frequency=options["frequency"], dry_run=options["dry_run"]
+            )
+        except ValueError as exc:
+            raise CommandError(str(exc))
+        duration = time.time() - start_time
+
+        if options["dry_run"]:
+            summary = f"{result.due} intern(s) due for an assessment"
+        else:
+            summary = (
+                f"Created {result.created} draft assessment(s) for "
+                f"{result.due} due intern(s)"
+            )
+        self.stdout.write(
+            self.style.SUCCESS(f"{summary} on {day:%Y-%m-%d} in {duration:.1f} seconds")
+        )
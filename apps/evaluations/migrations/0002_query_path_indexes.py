@@ -0,0 +1,38 @@
+# Generated by Django 4.2.11 on 2026-10-17 03:21
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('supervisors', '0001_initial'),
+        ('interns', '0003_populate_intern_types'),
+        ('evaluations', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='performanceassessment',
+            index=models.Index(fields=['assessed_by', 'status'], name='assessment_assessor_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='performanceassessment',
+            index=models.Index(fields=['intern', 'status'], name='assessment_intern_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='performanceassessment',
+            index=models.Index(condition=models.Q(('status', 'submitted')), fields=['assessed_by', '-assessment_date'], name='assessment_submitted_idx'),
+        ),
+        migrations.AlterField(
+            model_name='performanceassessment',
+            name='assessed_by',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='performed_assessments', to='supervisors.employeeprofile'),
+        ),
+        migrations.AlterField(
+            model_name='performanceassessment',
+            name='intern',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='assessments', to='interns.internprofile'),
+        ),
+    ]
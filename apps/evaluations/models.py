@@ -10,10 +10,12 @@ class PerformanceAssessment(models.Model):
         SUBMITTED = "submitted", "Submitted"
         REVIEWED = "reviewed", "Reviewed"
 
+    # Lookups on both foreign keys are served by the composite indexes in Meta
     intern = models.ForeignKey(
         "interns.InternProfile",
         on_delete=models.CASCADE,
         related_name="assessments",
+        db_index=False,
     )
     assessed_by = models.ForeignKey(
         "supervisors.EmployeeProfile",
@@ -21,6 +23,7 @@ class PerformanceAssessment(models.Model):
         null=True,
         blank=True,
         related_name="performed_assessments",
+        db_index=False,
     )
     assessment_date = models.DateField(default=timezone.localdate)
     period_start = models.DateField(null=True, blank=True)
@@ -55,6 +58,20 @@ class PerformanceAssessment(models.Model):
     class Meta:
         ordering = ["-assessment_date", "intern__user__last_name"]
         unique_together = ("intern", "week_number")
+        indexes = [
+            # Supervisor assessment lists filtered by status
+            models.Index(
+                fields=["assessed_by", "status"], name="assessment_assessor_status_idx"
+            ),
+            # Per-intern status counts on dashboards and reports
+            models.Index(fields=["intern", "status"], name="assessment_intern_status_idx"),
+            # Review queue: submitted self-assessments awaiting the supervisor
+            models.Index(
+                fields=["assessed_by", "-assessment_date"],
+                name="assessment_submitted_idx",
+                condition=models.Q(status="submitted"),
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"Assessment for {self.intern.user.get_full_name()} - Week {self.week_number}"
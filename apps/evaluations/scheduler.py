@@ -0,0 +1,153 @@
+"""
+Scheduled creation of draft assessments.
+
+Instead of supervisors creating each intern's weekly draft by hand, the
+``schedule_assessments`` command creates the next draft for every active
+intern whose latest assessment is at least one ``DEFAULT_ASSESSMENT_FREQUENCY``
+period old. Next week numbers come from one grouped query, drafts are written
+with one ``bulk_create`` and interns are notified in one batch.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Optional
+
+from django.conf import settings
+from django.db.models import Max, Q
+from django.utils import timezone
+
+from apps.evaluations.models import PerformanceAssessment
+from apps.interns.models import InternProfile
+from apps.notifications.services import NotificationService
+
+FREQUENCY_DAYS = {
+    "weekly": 7,
+    "biweekly": 14,
+    "monthly": 28,
+}
+
+
+@dataclass
+class ScheduleResult:
+    """Counts from one scheduler run"""
+
+    due: int = 0
+    created: int = 0
+
+
+class AssessmentScheduler:
+    """Service creating the next draft assessment for due interns"""
+
+    @staticmethod
+    def interval_days(frequency: Optional[str] = None) -> int:
+        """
+        Days between scheduled assessments for a frequency name.
+
+        Raises:
+            ValueError: If the frequency is not one of ``FREQUENCY_DAYS``
+        """
+        frequency = frequency or getattr(
+            settings, "DEFAULT_ASSESSMENT_FREQUENCY", "weekly"
+        )
+        try:
+            return FREQUENCY_DAYS[frequency]
+        except KeyError:
+            raise ValueError(
+                f"Unknown assessment frequency {frequency!r}; "
+                f"expected one of {', '.join(FREQUENCY_DAYS)}."
+            ) from None
+
+    @staticmethod
+    def due_interns(day: date, interval_days: int):
+        """
+        Active interns whose next assessment is due on ``day``.
+
+        One grouped query annotates each intern's latest week number and
+        assessment date; interns without assessments are always due.
+
+        Returns:
+            Values queryset of ``id``, ``internal_supervisor_id``,
+            ``start_date`` and ``last_week``
+        """
+        return (
+            InternProfile.objects.filter(
+                Q(end_date__isnull=True) | Q(end_date__gte=day),
+                start_date__lte=day,
+                user__is_active=True,
+            )
+            .order_by()
+            .annotate(
+                last_week=Max("assessments__week_number"),
+                last_date=Max("assessments__assessment_date"),
+            )
+            .filter(
+                Q(last_date__isnull=True)
+                | Q(last_date__lte=day - timedelta(days=interval_days))
+            )
+            .values("id", "internal_supervisor_id", "start_date", "last_week")
+        )
+
+    @staticmethod
+    def schedule(
+        day: Optional[date] = None,
+        frequency: Optional[str] = None,
+        dry_run: bool = False,
+    ) -> ScheduleResult:
+        """
+        Create and announce the next draft assessment for every due intern.
+
+        Drafts are assigned to the intern's internal supervisor and cover the
+        period ending on ``day``. A draft that already exists for the same
+        intern and week (e.g. from a concurrent run) is skipped by the
+        ``(intern, week_number)`` unique constraint, and only drafts this run
+        created are notified.
+
+        Args:
+            day: Assessment date (defaults to today)
+            frequency: Frequency name (defaults to DEFAULT_ASSESSMENT_FREQUENCY)
+            dry_run: Count due interns without creating anything
+
+        Returns:
+            ScheduleResult with due and created counts
+        """
+        day = day or timezone.localdate()
+        interval_days = AssessmentScheduler.interval_days(frequency)
+        due = list(AssessmentScheduler.due_interns(day, interval_days))
+        result = ScheduleResult(due=len(due))
+        if dry_run or not due:
+            return result
+
+        period_start = day - timedelta(days=interval_days - 1)
+        started = timezone.now()
+        PerformanceAssessment.objects.bulk_create(
+            [
+                PerformanceAssessment(
+                    intern_id=row["id"],
+                    assessed_by_id=row["internal_supervisor_id"],
+                    week_number=(row["last_week"] or 0) + 1,
+                    assessment_date=day,
+                    period_start=max(period_start, row["start_date"]),
+                    period_end=day,
+                    status=PerformanceAssessment.Status.DRAFT,
+                )
+                for row in due
+            ],
+            batch_size=500,
+            ignore_conflicts=True,
+        )
+
+        # ignore_conflicts leaves primary keys unset, so read back this
+        # run's drafts for the notification links
+        created = list(
+            PerformanceAssessment.objects.filter(
+                intern_id__in=[row["id"] for row in due],
+                assessment_date=day,
+                status=PerformanceAssessment.Status.DRAFT,
+                created_at__gte=started,
+            ).select_related("intern__user")
+        )
+        NotificationService.notify_assessments_scheduled(created)
+        result.created = len(created)
+        return result
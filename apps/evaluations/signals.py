@@ -0,0 +1,23 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.evaluations import analytics
+from apps.evaluations.models import PerformanceAssessment
+from apps.interns.models import InternProfile
+
+
+def _invalidate_for(assessment: PerformanceAssessment) -> None:
+    branch_ids = InternProfile.objects.filter(pk=assessment.intern_id).values_list(
+        "branch_id", flat=True
+    )
+    analytics.invalidate([assessment.intern_id], branch_ids)
+
+
+@receiver(post_save, sender=PerformanceAssessment)
+def invalidate_analytics_on_save(sender, instance, **kwargs):  # type: ignore[override]
+    _invalidate_for(instance)
+
+
+@receiver(post_delete, sender=PerformanceAssessment)
+def invalidate_analytics_on_delete(sender, instance, **kwargs):  # type: ignore[override]
+    _invalidate_for(instance)
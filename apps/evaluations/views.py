@@ -6,8 +6,10 @@ from django.http import HttpResponseForbidden
 from django.shortcuts import get_object_or_404, redirect, render
 from django.utils import timezone
 
+from apps.accounts.access import can_supervise
 from apps.accounts.decorators import intern_required, supervisor_or_above
 from apps.notifications.services import NotificationService
+from apps.evaluations.analytics import ScoreAnalyticsService
 from apps.evaluations.forms import (
     CreateAssessmentForm,
     InternSelfAssessmentForm,
@@ -35,16 +37,8 @@ def my_assessments(request):
         status="reviewed", supervisor_score__isnull=False
     ).count()
 
-    # Calculate average score
-    average_score = None
-    if reviewed_count > 0:
-        total_score = sum(
-            [
-                a.supervisor_score
-                for a in assessments.filter(supervisor_score__isnull=False)
-            ]
-        )
-        average_score = total_score / reviewed_count
+    # Trend figures come from the cached analytics, not a rescan
+    score_trend = ScoreAnalyticsService.trend(intern_profile)
 
     return render(
         request,
@@ -55,7 +49,8 @@ def my_assessments(request):
             "completed_count": completed_count,
             "pending_count": pending_count,
             "reviewed_count": reviewed_count,
-            "average_score": average_score,
+            "average_score": score_trend.average_score,
+            "score_trend": score_trend,
         },
     )
 
@@ -143,26 +138,15 @@ def assessment_list(request):
 @supervisor_or_above
 def create_assessment(request, intern_id):
     """Create a new assessment for an intern"""
-    from apps.accounts.models import User
-
     intern_profile = get_object_or_404(InternProfile, id=intern_id)
 
     # Check permission
-    if not request.user.is_superuser and request.user.role not in [
-        User.Roles.MANAGER,
-        User.Roles.ADMIN,
-    ]:
-        try:
-            employee_profile = EmployeeProfile.objects.get(user=request.user)
-            if intern_profile not in employee_profile.assigned_interns.all():
-                messages.error(
-                    request,
-                    "You can only create assessments for your assigned interns.",
-                )
-                return redirect("evaluations:assessment_list")
-        except EmployeeProfile.DoesNotExist:
-            messages.error(request, "You do not have permission to create assessments.")
-            return redirect("evaluations:assessment_list")
+    if not can_supervise(request.user, intern_profile):
+        messages.error(
+            request,
+            "You can only create assessments for your assigned interns.",
+        )
+        return redirect("evaluations:assessment_list")
 
     if request.method == "POST":
         form = CreateAssessmentForm(request.POST)
@@ -216,23 +200,12 @@ def create_assessment(request, intern_id):
 @supervisor_or_above
 def assess_intern(request, assessment_id):
     """View for supervisor to assess an intern"""
-    from apps.accounts.models import User
-
     assessment = get_object_or_404(PerformanceAssessment, id=assessment_id)
 
     # Check permission
-    if not request.user.is_superuser and request.user.role not in [
-        User.Roles.MANAGER,
-        User.Roles.ADMIN,
-    ]:
-        try:
-            employee_profile = EmployeeProfile.objects.get(user=request.user)
-            if assessment.intern not in employee_profile.assigned_interns.all():
-                messages.error(request, "You can only assess your assigned interns.")
-                return redirect("evaluations:assessment_list")
-        except EmployeeProfile.DoesNotExist:
-            messages.error(request, "You do not have permission to assess interns.")
-            return redirect("evaluations:assessment_list")
+    if not can_supervise(request.user, assessment.intern_id):
+        messages.error(request, "You can only assess your assigned interns.")
+        return redirect("evaluations:assessment_list")
 
     if request.method == "POST":
         form = SupervisorAssessmentForm(request.POST, instance=assessment)
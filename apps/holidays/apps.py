@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from django.apps import AppConfig
 
 
@@ -5,3 +7,9 @@ class HolidaysConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.holidays"
     verbose_name = "Holidays"
+
+    def ready(self) -> None:
+        # Import signal handlers that keep the working calendar current.
+        from . import signals  # noqa: F401
+
+        return super().ready()
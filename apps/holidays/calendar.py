@@ -0,0 +1,246 @@
+"""
+Working-day calendar for expected attendance.
+
+Expected working days for a period are the configured working weekdays,
+minus full-day holidays (global and branch-specific) and approved absence
+ranges. Weekdays are counted arithmetically per range and holidays with a
+binary search over a sorted per-branch list, so the cost does not depend on
+the length of the period.
+
+The holiday lists are loaded once per process and rebuilt when the holiday
+table changes. The version (row count and latest ``updated_at``) is read from
+the database at most every ``WORKING_CALENDAR_CHECK_SECONDS``, so changes
+reach every worker whatever cache backend is configured; saving or deleting
+a ``Holiday`` makes the saving process check at once (see
+``apps.holidays.signals``).
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Max
+from django.utils import timezone
+
+from apps.absenteeism.models import AbsenteeismRequest
+from apps.holidays.models import Holiday
+
+DEFAULT_WORKING_WEEKDAYS = (0, 1, 2, 3, 4)
+DEFAULT_CALENDAR_CHECK_SECONDS = 30
+
+DateRange = Tuple[date, date]
+
+
+def merge_ranges(
+    ranges: Iterable[DateRange], start: date, end: date
+) -> List[DateRange]:
+    """Clip inclusive date ranges to ``start``..``end`` and merge overlaps."""
+    merged: List[DateRange] = []
+    clipped = (
+        (max(range_start, start), min(range_end, end))
+        for range_start, range_end in ranges
+    )
+    for range_start, range_end in sorted(r for r in clipped if r[0] <= r[1]):
+        if merged and range_start <= merged[-1][1] + timedelta(days=1):
+            merged[-1] = (merged[-1][0], max(merged[-1][1], range_end))
+        else:
+            merged.append((range_start, range_end))
+    return merged
+
+
+class WorkingCalendar:
+    """Counts working days using per-branch sorted holiday lists"""
+
+    def __init__(
+        self,
+        holidays: Iterable[Tuple[Optional[int], date]],
+        weekdays: Optional[Sequence[int]] = None,
+    ):
+        self.weekdays: FrozenSet[int] = frozenset(
+            weekdays
+            if weekdays is not None
+            else getattr(settings, "WORKING_WEEKDAYS", DEFAULT_WORKING_WEEKDAYS)
+        )
+        by_branch: Dict[Optional[int], set] = defaultdict(set)
+        for branch_id, day in holidays:
+            # Holidays on non-working days change nothing
+            if day.weekday() in self.weekdays:
+                by_branch[branch_id].add(day)
+
+        global_days = by_branch.pop(None, set())
+        self._global = sorted(global_days)
+        self._by_branch = {
+            branch_id: sorted(days | global_days)
+            for branch_id, days in by_branch.items()
+        }
+
+    def holidays_for(self, branch_id: Optional[int]) -> List[date]:
+        """Sorted working-day holidays that apply to a branch."""
+        return self._by_branch.get(branch_id, self._global)
+
+    def count_weekdays(self, start: date, end: date) -> int:
+        """Working weekdays between two dates, inclusive."""
+        if end < start:
+            return 0
+        weeks, extra = divmod((end - start).days + 1, 7)
+        first = start.weekday()
+        return weeks * len(self.weekdays) + sum(
+            1 for offset in range(extra) if (first + offset) % 7 in self.weekdays
+        )
+
+    def working_days(
+        self,
+        start: date,
+        end: date,
+        branch_id: Optional[int] = None,
+        excluded: Iterable[DateRange] = (),
+    ) -> int:
+        """
+        Working days between two dates, inclusive.
+
+        Args:
+            start: First day
+            end: Last day
+            branch_id: Branch whose holidays apply (global holidays always do)
+            excluded: Inclusive date ranges to leave out, e.g. approved absences
+
+        Returns:
+            Number of expected working days
+        """
+        if end < start:
+            return 0
+        holidays = self.holidays_for(branch_id)
+
+        def count(range_start: date, range_end: date) -> int:
+            holiday_count = bisect_right(holidays, range_end) - bisect_left(
+                holidays, range_start
+            )
+            return self.count_weekdays(range_start, range_end) - holiday_count
+
+        total = count(start, end)
+        for range_start, range_end in merge_ranges(excluded, start, end):
+            total -= count(range_start, range_end)
+        return total
+
+
+_calendar: Optional[WorkingCalendar] = None
+_calendar_version: Optional[tuple] = None
+_calendar_checked_at: Optional[float] = None
+_calendar_lock = threading.Lock()
+
+
+def calendar_version() -> tuple:
+    """Row count and latest change of the holiday table."""
+    stats = Holiday.objects.aggregate(rows=Count("id"), changed=Max("updated_at"))
+    return stats["rows"], stats["changed"]
+
+
+def _calendar_is_fresh() -> bool:
+    interval = getattr(
+        settings, "WORKING_CALENDAR_CHECK_SECONDS", DEFAULT_CALENDAR_CHECK_SECONDS
+    )
+    return (
+        _calendar is not None
+        and _calendar_checked_at is not None
+        and time.monotonic() - _calendar_checked_at < interval
+    )
+
+
+def get_working_calendar() -> WorkingCalendar:
+    """
+    Return this process's calendar, reloading holidays if they changed.
+
+    The holiday version is re-read from the database at most every
+    ``WORKING_CALENDAR_CHECK_SECONDS``; in between, the calendar is served
+    without queries.
+    """
+    global _calendar, _calendar_version, _calendar_checked_at
+
+    if not _calendar_is_fresh():
+        with _calendar_lock:
+            if not _calendar_is_fresh():
+                version = calendar_version()
+                if _calendar is None or version != _calendar_version:
+                    _calendar = WorkingCalendar(
+                        Holiday.objects.filter(is_full_day=True).values_list(
+                            "branch_id", "date"
+                        )
+                    )
+                    _calendar_version = version
+                _calendar_checked_at = time.monotonic()
+    return _calendar
+
+
+def invalidate_working_calendar() -> None:
+    """Make this process re-check the holiday version, now and after commit."""
+
+    def expire() -> None:
+        global _calendar_checked_at
+        _calendar_checked_at = None
+
+    expire()
+    transaction.on_commit(expire)
+
+
+class ExpectedAttendanceService:
+    """Service computing expected working days for interns"""
+
+    @staticmethod
+    def expected_days(
+        profiles: Iterable, until: Optional[date] = None
+    ) -> Dict[int, int]:
+        """
+        Expected working days for each intern up to ``until``.
+
+        The period runs from the intern's ``start_date`` to the earlier of
+        ``end_date`` and ``until`` (default today). Approved absences for all
+        interns are loaded with one query; holidays come from the cached
+        calendar.
+
+        Args:
+            profiles: InternProfile instances
+            until: Last day to count (defaults to today)
+
+        Returns:
+            Mapping of intern id to expected working days
+        """
+        profiles = list(profiles)
+        until = until or timezone.localdate()
+        calendar = get_working_calendar()
+
+        absences: Dict[int, List[DateRange]] = defaultdict(list)
+        dated = [profile.id for profile in profiles if profile.start_date]
+        if dated:
+            for intern_id, start, end in AbsenteeismRequest.objects.filter(
+                intern_id__in=dated,
+                status=AbsenteeismRequest.Status.APPROVED,
+            ).values_list("intern_id", "start_date", "end_date"):
+                absences[intern_id].append((start, end))
+
+        expected = {}
+        for profile in profiles:
+            if not profile.start_date:
+                expected[profile.id] = 0
+                continue
+            end = min(profile.end_date, until) if profile.end_date else until
+            expected[profile.id] = calendar.working_days(
+                profile.start_date,
+                end,
+                branch_id=profile.branch_id,
+                excluded=absences[profile.id],
+            )
+        return expected
+
+    @staticmethod
+    def attendance_rate(approved_days: int, expected_days: int) -> float:
+        """Approved check-ins as a percentage of expected days, capped at 100."""
+        if expected_days <= 0:
+            return 0.0
+        return min(approved_days / expected_days * 100, 100.0)
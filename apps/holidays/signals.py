@@ -0,0 +1,15 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.holidays.calendar import invalidate_working_calendar
+from apps.holidays.models import Holiday
+
+
+@receiver(post_save, sender=Holiday)
+def invalidate_calendar_on_save(sender, instance, **kwargs):  # type: ignore[override]
+    invalidate_working_calendar()
+
+
+@receiver(post_delete, sender=Holiday)
+def invalidate_calendar_on_delete(sender, instance, **kwargs):  # type: ignore[override]
+    invalidate_working_calendar()
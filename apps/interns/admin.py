@@ -1,6 +1,9 @@
 from django.contrib import admin
+from django.http import StreamingHttpResponse
+from django.utils import timezone
 
 from apps.interns.models import InternProfile, InternType
+from apps.reports.bulk import BulkReportService
 
 
 @admin.register(InternType)
@@ -28,3 +31,18 @@ class InternProfileAdmin(admin.ModelAdmin):
         "user__last_name",
         "school__name",
     )
+    actions = ["export_performance_reports"]
+
+    @admin.action(description="Download performance reports (ZIP)")
+    def export_performance_reports(self, request, queryset):
+        # Runs inside a web worker; large exports belong to the
+        # export_intern_reports command, which uses every CPU
+        response = StreamingHttpResponse(
+            BulkReportService.iter_zip(
+                queryset, workers=BulkReportService.request_workers()
+            ),
+            content_type="application/zip",
+        )
+        filename = f"Performance_Reports_{timezone.localdate():%Y%m%d}.zip"
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
@@ -0,0 +1,32 @@
+"""
+Management command to refresh the intern summary materialized view
+
+Schedule it from cron, e.g. every 15 minutes:
+    */15 * * * * python manage.py refresh_intern_summaries
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.interns.summary import InternSummaryService
+
+
+class Command(BaseCommand):
+    help = "Refresh the per-intern totals behind the intern list and leaderboard"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--blocking",
+            action="store_true",
+            help="Use a plain refresh, which locks out readers until it finishes",
+        )
+
+    def handle(self, *args, **options):
+        start_time = time.time()
+        InternSummaryService.refresh(concurrently=not options["blocking"])
+        duration = time.time() - start_time
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Refreshed intern summaries in {duration:.1f} seconds")
+        )
@@ -0,0 +1,104 @@
+# Generated by Django 4.2.11 on 2026-10-17 04:22
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+# Each source table is aggregated in its own subquery before the join, so
+# attendance rows never multiply assessment counts (and vice versa).
+CREATE_SUMMARY_VIEW = """
+CREATE MATERIALIZED VIEW interns_internsummary AS
+SELECT
+    p.id AS intern_id,
+    COALESCE(a.total_assessments, 0) AS total_assessments,
+    COALESCE(a.reviewed_assessments, 0) AS reviewed_assessments,
+    a.avg_score,
+    a.avg_self_score,
+    COALESCE(t.total_attendance, 0) AS total_attendance,
+    COALESCE(t.approved_attendance, 0) AS approved_attendance,
+    COALESCE(d.approved_minutes, 0) AS approved_minutes,
+    COALESCE(d.on_time_days, 0) AS on_time_days,
+    COALESCE(r.total_absences, 0) AS total_absences,
+    COALESCE(r.approved_absence_days, 0) AS approved_absence_days,
+    now() AS refreshed_at
+FROM interns_internprofile p
+LEFT JOIN (
+    SELECT
+        intern_id,
+        COUNT(*)::integer AS total_assessments,
+        (COUNT(*) FILTER (WHERE status = 'reviewed'))::integer AS reviewed_assessments,
+        AVG(supervisor_score)::double precision AS avg_score,
+        AVG(intern_score)::double precision AS avg_self_score
+    FROM evaluations_performanceassessment
+    GROUP BY intern_id
+) a ON a.intern_id = p.id
+LEFT JOIN (
+    SELECT
+        intern_id,
+        COUNT(*)::integer AS total_attendance,
+        (COUNT(*) FILTER (WHERE approval_status = 'approved'))::integer AS approved_attendance
+    FROM attendance_attendance
+    GROUP BY intern_id
+) t ON t.intern_id = p.id
+LEFT JOIN (
+    SELECT
+        intern_id,
+        SUM(minutes_worked)::integer AS approved_minutes,
+        (COUNT(*) FILTER (WHERE on_time))::integer AS on_time_days
+    FROM attendance_attendanceday
+    WHERE approval_status = 'approved'
+    GROUP BY intern_id
+) d ON d.intern_id = p.id
+LEFT JOIN (
+    SELECT
+        intern_id,
+        COUNT(*)::integer AS total_absences,
+        (SUM(end_date - start_date + 1) FILTER (WHERE status = 'approved'))::integer
+            AS approved_absence_days
+    FROM absenteeism_absenteeismrequest
+    GROUP BY intern_id
+) r ON r.intern_id = p.id
+WITH DATA;
+
+-- REFRESH MATERIALIZED VIEW CONCURRENTLY requires a unique index
+CREATE UNIQUE INDEX interns_internsummary_intern_uniq
+    ON interns_internsummary (intern_id);
+"""
+
+DROP_SUMMARY_VIEW = "DROP MATERIALIZED VIEW IF EXISTS interns_internsummary;"
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interns', '0003_populate_intern_types'),
+        ('evaluations', '0002_query_path_indexes'),
+        ('attendance', '0008_attendance_sync_event'),
+        ('absenteeism', '0003_query_path_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InternSummary',
+            fields=[
+                ('intern', models.OneToOneField(on_delete=django.db.models.deletion.DO_NOTHING, primary_key=True, related_name='summary', serialize=False, to='interns.internprofile')),
+                ('total_assessments', models.IntegerField()),
+                ('reviewed_assessments', models.IntegerField()),
+                ('avg_score', models.FloatField(null=True)),
+                ('avg_self_score', models.FloatField(null=True)),
+                ('total_attendance', models.IntegerField()),
+                ('approved_attendance', models.IntegerField()),
+                ('approved_minutes', models.IntegerField()),
+                ('on_time_days', models.IntegerField()),
+                ('total_absences', models.IntegerField()),
+                ('approved_absence_days', models.IntegerField()),
+                ('refreshed_at', models.DateTimeField()),
+            ],
+            options={
+                'verbose_name': 'Intern Summary',
+                'verbose_name_plural': 'Intern Summaries',
+                'db_table': 'interns_internsummary',
+                'managed': False,
+            },
+        ),
+        migrations.RunSQL(CREATE_SUMMARY_VIEW, DROP_SUMMARY_VIEW),
+    ]
@@ -74,3 +74,52 @@ class InternProfile(models.Model):
         if self.end_date and not self.start_date:
             return today <= self.end_date
         return True
+
+
+class InternSummary(models.Model):
+    """
+    Per-intern totals read from the ``interns_internsummary`` materialized view.
+
+    Each source table is aggregated on its own before joining, so totals are
+    not multiplied by the other joins. The view is refreshed concurrently by
+    ``refresh_intern_summaries``; interns created since the last refresh have
+    no row yet.
+    """
+
+    intern = models.OneToOneField(
+        InternProfile,
+        on_delete=models.DO_NOTHING,
+        primary_key=True,
+        related_name="summary",
+    )
+    total_assessments = models.IntegerField()
+    reviewed_assessments = models.IntegerField()
+    avg_score = models.FloatField(null=True)
+    avg_self_score = models.FloatField(null=True)
+    total_attendance = models.IntegerField()
+    approved_attendance = models.IntegerField()
+    approved_minutes = models.IntegerField()
+    on_time_days = models.IntegerField()
+    total_absences = models.IntegerField()
+    approved_absence_days = models.IntegerField()
+    refreshed_at = models.DateTimeField()
+
+    class Meta:
+        managed = False
+        db_table = "interns_internsummary"
+        verbose_name = "Intern Summary"
+        verbose_name_plural = "Intern Summaries"
+
+    def __str__(self) -> str:
+        return f"InternSummary(intern={self.intern_id})"
+
+    @property
+    def approved_hours(self) -> float:
+        return round(self.approved_minutes / 60, 1)
+
+    @property
+    def attendance_rate(self) -> float | None:
+        """Share of check-ins that were approved, 0-100"""
+        if not self.total_attendance:
+            return None
+        return round(self.approved_attendance * 100 / self.total_attendance, 1)
@@ -0,0 +1,63 @@
+"""
+Per-intern statistics as correlated subqueries.
+
+Annotating ``Count("assessments")`` and ``Count("attendances")`` on the same
+queryset joins both tables at once, so each intern's rows multiply
+(assessments x attendances) and every count is inflated. Here each related
+table is aggregated in its own ``Subquery`` keyed on ``OuterRef("pk")``: the
+outer query keeps one row per intern, each figure is exact, and PostgreSQL
+evaluates the subqueries only for the rows actually returned, e.g. one page of
+the intern list, through the ``(intern, ...)`` composite indexes.
+"""
+
+from __future__ import annotations
+
+from django.db.models import (
+    Avg,
+    Count,
+    FloatField,
+    IntegerField,
+    OuterRef,
+    QuerySet,
+    Subquery,
+)
+from django.db.models.functions import Coalesce
+
+from apps.attendance.models import Attendance
+from apps.evaluations.models import PerformanceAssessment
+
+
+def _aggregate(queryset: QuerySet, aggregate, output_field):
+    """Scalar subquery of one aggregate over an intern's related rows"""
+    return Subquery(
+        queryset.filter(intern=OuterRef("pk"))
+        .order_by()
+        .values("intern")
+        .annotate(value=aggregate)
+        .values("value"),
+        output_field=output_field,
+    )
+
+
+def _count(queryset: QuerySet):
+    return Coalesce(_aggregate(queryset, Count("pk"), IntegerField()), 0)
+
+
+def annotate_intern_stats(queryset: QuerySet) -> QuerySet:
+    """
+    Annotate an ``InternProfile`` queryset with assessment and attendance figures.
+
+    Adds ``total_assessments``, ``avg_score`` (average supervisor score, None
+    when unscored), ``total_attendance`` and ``approved_attendance``. The
+    queryset may already be filtered, ordered or sliced by the caller.
+    """
+    assessments = PerformanceAssessment.objects.all()
+    attendances = Attendance.objects.all()
+    return queryset.annotate(
+        total_assessments=_count(assessments),
+        avg_score=_aggregate(assessments, Avg("supervisor_score"), FloatField()),
+        total_attendance=_count(attendances),
+        approved_attendance=_count(
+            attendances.filter(approval_status=Attendance.ApprovalStatus.APPROVED)
+        ),
+    )
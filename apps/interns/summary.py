@@ -0,0 +1,135 @@
+"""
+Cohort comparisons backed by the intern summary materialized view.
+
+``InternSummary`` holds per-intern totals and averages across assessments,
+attendance and absences. The intern list and the cohort leaderboard read
+those precomputed figures instead of joining every source table per request.
+The view is refreshed concurrently by ``refresh_intern_summaries`` (run it
+from cron), so readers are never blocked and figures lag by at most one
+refresh interval.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional
+
+from django.db import connection
+from django.db.models import Avg, Count, F, Max, QuerySet, Sum
+
+from apps.interns.models import InternProfile, InternSummary
+
+# Leaderboard grouping: (id lookup, label lookup) on InternSummary
+COHORT_GROUPS = {
+    "branch": ("intern__branch_id", "intern__branch__name"),
+    "school": ("intern__school_id", "intern__school__name"),
+    "intern_type": ("intern__intern_type_id", "intern__intern_type__display_name"),
+}
+DEFAULT_LEADERBOARD_SIZE = 20
+
+
+@dataclass(frozen=True)
+class CohortSummary:
+    """Aggregate figures for one branch, school or intern type"""
+
+    cohort_id: Optional[int]
+    label: str
+    interns: int
+    assessments: int
+    avg_score: Optional[float]
+    total_attendance: int
+    approved_attendance: int
+    approved_hours: float
+    absence_days: int
+
+    @property
+    def attendance_rate(self) -> Optional[float]:
+        if not self.total_attendance:
+            return None
+        return round(self.approved_attendance * 100 / self.total_attendance, 1)
+
+
+class InternSummaryService:
+    """Service refreshing and reading the intern summary view"""
+
+    @staticmethod
+    def refresh(concurrently: bool = True) -> None:
+        """
+        Recompute the materialized view.
+
+        A concurrent refresh swaps in the new rows without locking out
+        readers; a plain refresh is faster but blocks reads until it commits.
+        """
+        table = connection.ops.quote_name(InternSummary._meta.db_table)
+        option = " CONCURRENTLY" if concurrently else ""
+        with connection.cursor() as cursor:
+            cursor.execute(f"REFRESH MATERIALIZED VIEW{option} {table}")
+
+    @staticmethod
+    def last_refreshed() -> Optional[datetime]:
+        return InternSummary.objects.aggregate(latest=Max("refreshed_at"))["latest"]
+
+    @staticmethod
+    def cohorts(interns: QuerySet[InternProfile], group: str) -> List[CohortSummary]:
+        """
+        Aggregate the summaries of ``interns`` by branch, school or type.
+
+        Each summary row is one intern, so the grouped sums are exact.
+
+        Args:
+            interns: InternProfile queryset limiting the interns compared
+            group: One of ``COHORT_GROUPS``
+
+        Returns:
+            CohortSummary rows, best average score first
+        """
+        id_lookup, label_lookup = COHORT_GROUPS[group]
+        rows = (
+            InternSummary.objects.filter(intern__in=interns)
+            .order_by()
+            .values(id_lookup, label_lookup)
+            .annotate(
+                interns=Count("pk"),
+                assessments=Sum("total_assessments"),
+                avg_score=Avg("avg_score"),
+                total_attendance=Sum("total_attendance"),
+                approved_attendance=Sum("approved_attendance"),
+                approved_minutes=Sum("approved_minutes"),
+                absence_days=Sum("approved_absence_days"),
+            )
+            .order_by(F("avg_score").desc(nulls_last=True), label_lookup)
+        )
+        return [
+            CohortSummary(
+                cohort_id=row[id_lookup],
+                label=row[label_lookup] or "Unassigned",
+                interns=row["interns"],
+                assessments=row["assessments"],
+                avg_score=(
+                    round(row["avg_score"], 1) if row["avg_score"] is not None else None
+                ),
+                total_attendance=row["total_attendance"],
+                approved_attendance=row["approved_attendance"],
+                approved_hours=round(row["approved_minutes"] / 60, 1),
+                absence_days=row["absence_days"],
+            )
+            for row in rows
+        ]
+
+    @staticmethod
+    def leaderboard(
+        interns: QuerySet[InternProfile], limit: int = DEFAULT_LEADERBOARD_SIZE
+    ) -> QuerySet[InternSummary]:
+        """
+        Top interns by average supervisor score.
+
+        Ties are broken by approved attendance; unscored interns are left out.
+        """
+        return (
+            InternSummary.objects.filter(intern__in=interns, avg_score__isnull=False)
+            .select_related(
+                "intern__user", "intern__branch", "intern__school", "intern__intern_type"
+            )
+            .order_by("-avg_score", "-approved_attendance", "intern_id")[:limit]
+        )
@@ -8,6 +8,7 @@ app_name = "interns"
 
 urlpatterns = [
     path("", views.intern_list, name="list"),
+    path("leaderboard/", views.cohort_leaderboard, name="leaderboard"),
     path("<int:intern_id>/", views.intern_detail, name="detail"),
     # Emergency contact management
     path(
@@ -1,17 +1,26 @@
 from __future__ import annotations
 
+from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
-from django.db.models import Avg, Count, Q
+from django.core.paginator import Paginator
+from django.db.models import Avg, Q
 from django.shortcuts import get_object_or_404, redirect, render
 from django.utils import timezone
 
+from apps.accounts.access import supervised_interns
 from apps.accounts.decorators import supervisor_or_above
 from apps.absenteeism.models import AbsenteeismRequest
 from apps.attendance.models import Attendance
+from apps.evaluations.analytics import ScoreAnalyticsService
 from apps.evaluations.models import PerformanceAssessment
+from apps.holidays.calendar import ExpectedAttendanceService
 from apps.interns.forms import EmergencyContactForm, InternProfileForm
 from apps.interns.models import InternProfile, InternType
+from apps.interns.stats import annotate_intern_stats
+from apps.interns.summary import COHORT_GROUPS, InternSummaryService
+
+DEFAULT_PAGE_SIZE = 20
 
 
 @login_required
@@ -65,16 +74,6 @@ def intern_list(request):
     if intern_type_filter:
         interns = interns.filter(intern_type_id=intern_type_filter)
 
-    # Annotate with statistics
-    interns = interns.annotate(
-        total_assessments=Count("assessments"),
-        avg_score=Avg("assessments__supervisor_score"),
-        total_attendance=Count("attendances"),
-        approved_attendance=Count(
-            "attendances", filter=Q(attendances__approval_status="approved")
-        ),
-    )
-
     # Get unique branches and schools for filters
     from apps.branches.models import Branch
     from apps.schools.models import School
@@ -82,8 +81,24 @@ def intern_list(request):
     branches = Branch.objects.all()
     schools = School.objects.all()
 
+    # Statistics are correlated subqueries, evaluated only for the interns
+    # on the requested page
+    paginator = Paginator(
+        annotate_intern_stats(interns.order_by("-start_date", "-id")),
+        getattr(settings, "INTERN_LIST_PAGE_SIZE", DEFAULT_PAGE_SIZE),
+    )
+    page_obj = paginator.get_page(request.GET.get("page"))
+
+    # Keep the active filters on the page links
+    filters = request.GET.copy()
+    filters.pop("page", None)
+
     context = {
-        "interns": interns.order_by("-start_date"),
+        "interns": page_obj,
+        "page_obj": page_obj,
+        "paginator": paginator,
+        "is_paginated": page_obj.has_other_pages(),
+        "filter_query": filters.urlencode(),
         "search_query": search_query,
         "status_filter": status_filter,
         "branch_filter": branch_filter,
@@ -92,12 +107,46 @@ def intern_list(request):
         "branches": branches,
         "schools": schools,
         "intern_types": InternType.objects.all(),
-        "total_count": interns.count(),
+        "total_count": paginator.count,
     }
 
     return render(request, "interns/intern_list.html", context)
 
 
+@login_required
+@supervisor_or_above
+def cohort_leaderboard(request):
+    """Compare cohorts by branch, school or intern type and rank interns"""
+    group = request.GET.get("group", "branch")
+    if group not in COHORT_GROUPS:
+        group = "branch"
+
+    # Supervisors compare only their assigned interns
+    interns = supervised_interns(request.user)
+    cohorts = InternSummaryService.cohorts(interns, group)
+
+    cohort_filter = request.GET.get("cohort", "")
+    if cohort_filter.isdigit():
+        interns = interns.filter(**{f"{group}_id": int(cohort_filter)})
+    else:
+        cohort_filter = ""
+
+    context = {
+        "group": group,
+        "groups": [
+            ("branch", "Branch"),
+            ("school", "School"),
+            ("intern_type", "Intern Type"),
+        ],
+        "cohorts": cohorts,
+        "cohort_filter": cohort_filter,
+        "leaders": InternSummaryService.leaderboard(interns),
+        "refreshed_at": InternSummaryService.last_refreshed(),
+    }
+
+    return render(request, "interns/cohort_leaderboard.html", context)
+
+
 @login_required
 @supervisor_or_above
 def intern_detail(request, intern_id):
@@ -124,9 +173,8 @@ def intern_detail(request, intern_id):
 
     # Assessment statistics
     total_assessments = assessments.count()
-    avg_supervisor_score = assessments.aggregate(Avg("supervisor_score"))[
-        "supervisor_score__avg"
-    ]
+    score_trend = ScoreAnalyticsService.trend(intern)
+    avg_supervisor_score = score_trend.average_score
     avg_self_score = assessments.aggregate(Avg("intern_score"))["intern_score__avg"]
 
     # Get all attendance records
@@ -142,9 +190,10 @@ def intern_detail(request, intern_id):
     pending_attendance = attendance_records.filter(approval_status="pending").count()
     rejected_attendance = attendance_records.filter(approval_status="rejected").count()
 
-    # Calculate attendance rate
-    attendance_rate = (
-        (approved_attendance / total_attendance * 100) if total_attendance > 0 else 0
+    # Approved check-ins against expected working days
+    expected_days = ExpectedAttendanceService.expected_days([intern])[intern.id]
+    attendance_rate = ExpectedAttendanceService.attendance_rate(
+        approved_attendance, expected_days
     )
 
     # Get absence requests
@@ -193,6 +242,7 @@ def intern_detail(request, intern_id):
         "total_assessments": total_assessments,
         "avg_supervisor_score": avg_supervisor_score,
         "avg_self_score": avg_self_score,
+        "score_trend": score_trend,
         # Attendance data
         "attendance_records": attendance_records[:10],  # Show last 10
         "total_attendance": total_attendance,
@@ -200,6 +250,7 @@ def intern_detail(request, intern_id):
         "pending_attendance": pending_attendance,
         "rejected_attendance": rejected_attendance,
         "attendance_rate": attendance_rate,
+        "expected_days": expected_days,
         # Absence data
         "absence_requests": absence_requests[:10],  # Show last 10
         "total_absences": total_absences,
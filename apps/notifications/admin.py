@@ -1,8 +1,13 @@
 from __future__ import annotations
 
 from django.contrib import admin
+from django.utils import timezone
 
-from apps.notifications.models import Notification, NotificationPreference
+from apps.notifications.models import (
+    Notification,
+    NotificationPreference,
+    OutboundEmail,
+)
 
 
 @admin.register(Notification)
@@ -23,7 +28,13 @@ class NotificationAdmin(admin.ModelAdmin):
         "recipient__first_name",
         "recipient__last_name",
     ]
-    readonly_fields = ["created_at", "updated_at", "read_at", "email_sent_at"]
+    readonly_fields = [
+        "created_at",
+        "updated_at",
+        "read_at",
+        "email_sent_at",
+        "digest_email",
+    ]
     date_hierarchy = "created_at"
 
     fieldsets = (
@@ -39,7 +50,18 @@ class NotificationAdmin(admin.ModelAdmin):
                 )
             },
         ),
-        ("Status", {"fields": ("is_read", "read_at", "email_sent", "email_sent_at")}),
+        (
+            "Status",
+            {
+                "fields": (
+                    "is_read",
+                    "read_at",
+                    "email_sent",
+                    "email_sent_at",
+                    "digest_email",
+                )
+            },
+        ),
         ("Action", {"fields": ("action_url",)}),
         (
             "Related Object",
@@ -82,3 +104,27 @@ class NotificationPreferenceAdmin(admin.ModelAdmin):
         ("In-App Notifications", {"fields": ("in_app_notifications",)}),
         ("Digest Preferences", {"fields": ("daily_digest", "weekly_digest")}),
     )
+
+
+@admin.register(OutboundEmail)
+class OutboundEmailAdmin(admin.ModelAdmin):
+    list_display = [
+        "subject",
+        "to_email",
+        "status",
+        "attempts",
+        "next_attempt_at",
+        "sent_at",
+    ]
+    list_filter = ["status", "created_at"]
+    search_fields = ["subject", "to_email"]
+    readonly_fields = ["notification", "created_at", "updated_at", "sent_at"]
+    date_hierarchy = "created_at"
+    actions = ["retry_now"]
+
+    @admin.action(description="Retry selected emails now")
+    def retry_now(self, request, queryset):
+        updated = queryset.exclude(status=OutboundEmail.Status.SENT).update(
+            status=OutboundEmail.Status.PENDING, next_attempt_at=timezone.now()
+        )
+        self.message_user(request, f"{updated} email(s) queued for retry.")
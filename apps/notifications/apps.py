@@ -7,3 +7,9 @@ class NotificationsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.notifications"
     verbose_name = "Notifications"
+
+    def ready(self) -> None:
+        # Import signal handlers that keep the notification cache current.
+        from . import signals  # noqa: F401
+
+        return super().ready()
@@ -0,0 +1,66 @@
+"""
+Per-user cache for the notification bell shown on every page.
+
+The unread count and the recent-notifications list are stored under
+per-user keys and dropped whenever a user's notifications change (see
+``apps.notifications.signals`` and ``NotificationService.mark_all_as_read``).
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, List
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from apps.notifications.models import Notification
+
+CACHE_TIMEOUT = getattr(settings, "NOTIFICATION_CACHE_TIMEOUT", 300)
+RECENT_LIMIT = 5
+
+UNREAD_COUNT_KEY = "notifications:unread_count:{user_id}"
+RECENT_KEY = "notifications:recent:{user_id}"
+
+
+def get_unread_count(user_id: int) -> int:
+    """Return the cached unread count for a user, querying on a miss."""
+    key = UNREAD_COUNT_KEY.format(user_id=user_id)
+    count = cache.get(key)
+    if count is None:
+        count = Notification.objects.filter(recipient_id=user_id, is_read=False).count()
+        cache.set(key, count, CACHE_TIMEOUT)
+    return count
+
+
+def get_recent_notifications(user_id: int) -> List[Notification]:
+    """Return the cached most recent notifications for a user."""
+    key = RECENT_KEY.format(user_id=user_id)
+    notifications = cache.get(key)
+    if notifications is None:
+        notifications = list(
+            Notification.objects.filter(recipient_id=user_id).order_by("-created_at")[
+                :RECENT_LIMIT
+            ]
+        )
+        cache.set(key, notifications, CACHE_TIMEOUT)
+    return notifications
+
+
+def invalidate(user_ids: Iterable[int]) -> None:
+    """
+    Drop cached notification data for the given users.
+
+    Keys are cleared immediately and again once the surrounding transaction
+    commits, so a concurrent request cannot re-cache pre-commit values.
+    """
+    keys = []
+    for user_id in set(user_ids):
+        keys.append(UNREAD_COUNT_KEY.format(user_id=user_id))
+        keys.append(RECENT_KEY.format(user_id=user_id))
+
+    if not keys:
+        return
+
+    cache.delete_many(keys)
+    transaction.on_commit(lambda: cache.delete_many(keys))
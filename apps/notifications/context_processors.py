@@ -4,25 +4,28 @@ Context processor to add notification data to all templates.
 
 from __future__ import annotations
 
-from apps.notifications.models import Notification
+from django.utils.functional import SimpleLazyObject
+
+from apps.notifications import cache as notification_cache
 
 
 def notifications_context(request):
     """
     Add notification data to template context.
+
+    Values are lazy and served from the per-user notification cache, so
+    pages that never render the bell do not touch the database.
     """
     if request.user.is_authenticated:
-        unread_count = Notification.objects.filter(
-            recipient=request.user, is_read=False
-        ).count()
-
-        recent_notifications = Notification.objects.filter(
-            recipient=request.user
-        ).order_by("-created_at")[:5]
+        user_id = request.user.pk
 
         return {
-            "unread_notifications_count": unread_count,
-            "recent_notifications": recent_notifications,
+            "unread_notifications_count": SimpleLazyObject(
+                lambda: notification_cache.get_unread_count(user_id)
+            ),
+            "recent_notifications": SimpleLazyObject(
+                lambda: notification_cache.get_recent_notifications(user_id)
+            ),
         }
 
     return {
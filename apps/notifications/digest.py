@@ -0,0 +1,191 @@
+"""
+Daily and weekly notification digests.
+
+Users who enable ``daily_digest`` or ``weekly_digest`` do not get one email per
+notification; instead the ``send_notification_digests`` command (run from
+cron) collects their unsent notifications and queues a single digest email
+per user in the outbox.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import groupby
+from typing import List, Optional, Tuple
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Case, Exists, OuterRef, QuerySet, Value, When
+from django.template.loader import render_to_string
+from django.utils import timezone
+from django.utils.html import strip_tags
+
+from apps.notifications.models import Notification, OutboundEmail
+from apps.notifications.outbox import OutboxService
+from apps.notifications.services import NotificationService
+
+DAILY = "daily"
+WEEKLY = "weekly"
+
+DIGEST_TEMPLATE = "notifications/email/digest_email.html"
+
+
+@dataclass
+class DigestResult:
+    """Counts from one digest run"""
+
+    users: int = 0
+    notifications: int = 0
+
+
+class DigestService:
+    """Service for building notification digest emails"""
+
+    @staticmethod
+    def pending_notifications(
+        period: str, now: Optional[datetime] = None
+    ) -> QuerySet:
+        """
+        Notifications due in a digest for the given period.
+
+        Covers every notification created before ``now`` for subscribers of
+        that period that was created with ``send_email`` and is still unread,
+        and has not been emailed, queued individually, or included in an
+        earlier digest. A late or skipped run therefore catches up, while
+        in-app-only events and history from before the user subscribed (which
+        was already queued one by one) stay out. Users subscribed to both
+        digests only receive the daily one.
+
+        Args:
+            period: "daily" or "weekly"
+            now: Only notifications created before this are included
+                (defaults to now)
+
+        Returns:
+            Notification queryset ordered by recipient, then creation time
+        """
+        now = now or timezone.now()
+        subscribers = (
+            {"recipient__notification_preferences__daily_digest": True}
+            if period == DAILY
+            else {
+                "recipient__notification_preferences__weekly_digest": True,
+                "recipient__notification_preferences__daily_digest": False,
+            }
+        )
+
+        return (
+            Notification.objects.filter(
+                created_at__lt=now,
+                email_requested=True,
+                is_read=False,
+                email_sent=False,
+                digest_email__isnull=True,
+                recipient__is_active=True,
+                **subscribers,
+            )
+            .exclude(recipient__email="")
+            .exclude(
+                Exists(OutboundEmail.objects.filter(notification_id=OuterRef("pk")))
+            )
+            .select_related("recipient", "recipient__notification_preferences")
+            .order_by("recipient_id", "created_at")
+        )
+
+    @staticmethod
+    def send_digests(
+        period: str,
+        now: Optional[datetime] = None,
+        chunk_size: int = 200,
+    ) -> DigestResult:
+        """
+        Queue one digest email per subscriber for the given period.
+
+        Notifications are streamed from the database grouped by recipient;
+        digests are written to the outbox in chunks of ``chunk_size`` users,
+        each chunk costing one INSERT and one UPDATE.
+
+        Args:
+            period: "daily" or "weekly"
+            now: Only notifications created before this are included
+                (defaults to now)
+            chunk_size: Number of digests queued per batch
+
+        Returns:
+            DigestResult with the number of users and notifications covered
+        """
+        result = DigestResult()
+        pending: List[Tuple[OutboundEmail, List[int]]] = []
+
+        notifications = DigestService.pending_notifications(period, now).iterator(
+            chunk_size=2000
+        )
+        for _, group in groupby(notifications, key=lambda n: n.recipient_id):
+            items = [
+                notification
+                for notification in group
+                if NotificationService._should_send_email(
+                    notification, notification.recipient.notification_preferences
+                )
+            ]
+            if not items:
+                continue
+
+            pending.append(
+                (DigestService.build_digest_email(items, period), [n.id for n in items])
+            )
+            result.users += 1
+            result.notifications += len(items)
+
+            if len(pending) >= chunk_size:
+                DigestService._queue(pending)
+                pending = []
+
+        if pending:
+            DigestService._queue(pending)
+
+        return result
+
+    @staticmethod
+    def build_digest_email(
+        notifications: List[Notification], period: str
+    ) -> OutboundEmail:
+        """Render an unsaved digest email for one recipient's notifications"""
+        recipient = notifications[0].recipient
+        html_message = render_to_string(
+            DIGEST_TEMPLATE,
+            {
+                "user": recipient,
+                "notifications": notifications,
+                "period": period,
+                "site_url": getattr(settings, "SITE_URL", "") or "http://localhost:8000",
+            },
+        )
+        count = len(notifications)
+        subject = (
+            f"[IMS] Your {period} digest: {count} "
+            f"notification{'s' if count != 1 else ''}"
+        )
+        return OutboundEmail(
+            to_email=recipient.email,
+            subject=subject,
+            body_text=strip_tags(html_message),
+            body_html=html_message,
+        )
+
+    @staticmethod
+    def _queue(pending: List[Tuple[OutboundEmail, List[int]]]) -> None:
+        """Insert a chunk of digests and link their notifications to them"""
+        with transaction.atomic():
+            emails = OutboxService.enqueue_many([email for email, _ in pending])
+            Notification.objects.filter(
+                id__in=[pk for _, ids in pending for pk in ids]
+            ).update(
+                digest_email=Case(
+                    *[
+                        When(id__in=ids, then=Value(email.id))
+                        for email, (_, ids) in zip(emails, pending)
+                    ]
+                )
+            )
@@ -0,0 +1,63 @@
+"""
+Management command that delivers queued outbound email
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.notifications.outbox import OutboxService
+
+
+class Command(BaseCommand):
+    help = "Send queued emails from the outbox, retrying failures with backoff"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=None,
+            help="Emails sent per SMTP connection (defaults to EMAIL_OUTBOX_BATCH_SIZE)",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Drain the currently due emails and exit instead of polling",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=5.0,
+            help="Seconds to wait between polls when the outbox is empty",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        totals = {"sent": 0, "retried": 0, "failed": 0}
+
+        try:
+            while True:
+                result = OutboxService.process_batch(batch_size)
+                totals["sent"] += result.sent
+                totals["retried"] += result.retried
+                totals["failed"] += result.failed
+
+                if result.processed:
+                    self.stdout.write(
+                        f"Sent {result.sent}, retrying {result.retried}, "
+                        f"failed {result.failed}"
+                    )
+                    continue
+
+                if options["once"]:
+                    break
+                time.sleep(options["interval"])
+        except KeyboardInterrupt:
+            self.stdout.write("Stopping outbox worker")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Outbox done: {totals['sent']} sent, {totals['retried']} "
+                f"scheduled for retry, {totals['failed']} failed"
+            )
+        )
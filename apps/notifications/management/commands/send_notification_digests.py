@@ -0,0 +1,39 @@
+"""
+Management command that queues daily or weekly notification digests
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.notifications.digest import DAILY, WEEKLY, DigestService
+
+
+class Command(BaseCommand):
+    help = (
+        "Queue one digest email per subscriber covering their unsent "
+        "notifications. Schedule daily and weekly runs from cron."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--period",
+            choices=[DAILY, WEEKLY],
+            default=DAILY,
+            help="Digest period to build (default: daily)",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=200,
+            help="Number of digests written to the outbox per batch",
+        )
+
+    def handle(self, *args, **options):
+        result = DigestService.send_digests(
+            options["period"], chunk_size=options["chunk_size"]
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Queued {result.users} {options['period']} digest(s) covering "
+                f"{result.notifications} notification(s)"
+            )
+        )
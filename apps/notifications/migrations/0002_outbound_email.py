@@ -0,0 +1,40 @@
+# Generated by Django 4.2.11 on 2026-10-17 03:11
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutboundEmail',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('to_email', models.EmailField(help_text='Recipient email address', max_length=254)),
+                ('from_email', models.CharField(blank=True, help_text='Sender address (defaults to DEFAULT_FROM_EMAIL)', max_length=255)),
+                ('subject', models.CharField(max_length=255)),
+                ('body_text', models.TextField(help_text='Plain text body')),
+                ('body_html', models.TextField(blank=True, help_text='Optional HTML alternative')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('sending', 'Sending'), ('sent', 'Sent'), ('failed', 'Failed')], default='pending', max_length=20)),
+                ('attempts', models.PositiveIntegerField(default=0, help_text='Number of delivery attempts made')),
+                ('next_attempt_at', models.DateTimeField(default=django.utils.timezone.now, help_text='Earliest time the worker may try to deliver this email')),
+                ('last_error', models.TextField(blank=True, help_text='Error from the most recent failed attempt')),
+                ('sent_at', models.DateTimeField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('notification', models.ForeignKey(blank=True, help_text='Notification this email delivers, if any', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='outbound_emails', to='notifications.notification')),
+            ],
+            options={
+                'verbose_name': 'Outbound Email',
+                'verbose_name_plural': 'Outbound Emails',
+                'ordering': ['next_attempt_at', 'id'],
+                'indexes': [models.Index(fields=['status', 'next_attempt_at'], name='notificatio_status_36aace_idx')],
+            },
+        ),
+    ]
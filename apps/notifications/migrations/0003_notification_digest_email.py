@@ -0,0 +1,19 @@
+# Generated by Django 4.2.11 on 2026-10-17 03:16
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0002_outbound_email'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notification',
+            name='digest_email',
+            field=models.ForeignKey(blank=True, help_text='Digest email this notification was included in', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='digest_notifications', to='notifications.outboundemail'),
+        ),
+    ]
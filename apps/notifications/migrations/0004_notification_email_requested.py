@@ -0,0 +1,18 @@
+# Generated by Django 4.2.11 on 2026-10-17 05:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0003_notification_digest_email'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notification',
+            name='email_requested',
+            field=models.BooleanField(default=False, help_text='Whether the event asked for an email, individually or in a digest'),
+        ),
+    ]
@@ -3,6 +3,7 @@ from __future__ import annotations
 from django.db import models
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
+from django.utils import timezone
 
 from apps.accounts.models import User
 
@@ -88,6 +89,11 @@ class Notification(models.Model):
     )
     related_object = GenericForeignKey("content_type", "object_id")
 
+    email_requested = models.BooleanField(
+        default=False,
+        help_text="Whether the event asked for an email, individually or in a digest",
+    )
+
     email_sent = models.BooleanField(
         default=False,
         help_text="Whether an email notification was sent",
@@ -99,6 +105,15 @@ class Notification(models.Model):
         help_text="When the email was sent",
     )
 
+    digest_email = models.ForeignKey(
+        "OutboundEmail",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="digest_notifications",
+        help_text="Digest email this notification was included in",
+    )
+
     created_at = models.DateTimeField(
         auto_now_add=True,
         help_text="When the notification was created",
@@ -194,3 +209,91 @@ class NotificationPreference(models.Model):
 
     def __str__(self):
         return f"Notification Preferences for {self.user.get_full_name()}"
+
+
+class OutboundEmail(models.Model):
+    """
+    Email waiting to be delivered by the outbox worker.
+
+    Rows are written in the same transaction as the event that triggered them,
+    so a rolled back request never sends mail, and SMTP latency stays out of
+    the request thread.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pending"
+        SENDING = "sending", "Sending"
+        SENT = "sent", "Sent"
+        FAILED = "failed", "Failed"
+
+    notification = models.ForeignKey(
+        Notification,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="outbound_emails",
+        help_text="Notification this email delivers, if any",
+    )
+
+    to_email = models.EmailField(
+        help_text="Recipient email address",
+    )
+
+    from_email = models.CharField(
+        max_length=255,
+        blank=True,
+        help_text="Sender address (defaults to DEFAULT_FROM_EMAIL)",
+    )
+
+    subject = models.CharField(
+        max_length=255,
+    )
+
+    body_text = models.TextField(
+        help_text="Plain text body",
+    )
+
+    body_html = models.TextField(
+        blank=True,
+        help_text="Optional HTML alternative",
+    )
+
+    status = models.CharField(
+        max_length=20,
+        choices=Status.choices,
+        default=Status.PENDING,
+    )
+
+    attempts = models.PositiveIntegerField(
+        default=0,
+        help_text="Number of delivery attempts made",
+    )
+
+    next_attempt_at = models.DateTimeField(
+        default=timezone.now,
+        help_text="Earliest time the worker may try to deliver this email",
+    )
+
+    last_error = models.TextField(
+        blank=True,
+        help_text="Error from the most recent failed attempt",
+    )
+
+    sent_at = models.DateTimeField(
+        null=True,
+        blank=True,
+    )
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["next_attempt_at", "id"]
+        verbose_name = "Outbound Email"
+        verbose_name_plural = "Outbound Emails"
+        indexes = [
+            models.Index(fields=["status", "next_attempt_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.subject} -> {self.to_email} ({self.status})"
@@ -0,0 +1,253 @@
+"""
+Persistent outbound email queue.
+
+Request handlers call ``OutboxService.enqueue`` which only inserts a row; the
+``process_email_outbox`` management command drains the queue in batches over
+a single reused SMTP connection, retrying failures with exponential backoff.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import List, Optional
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from apps.notifications.models import Notification, OutboundEmail
+
+logger = logging.getLogger(__name__)
+
+
+def _batch_size() -> int:
+    return getattr(settings, "EMAIL_OUTBOX_BATCH_SIZE", 50)
+
+
+def _max_attempts() -> int:
+    return getattr(settings, "EMAIL_OUTBOX_MAX_ATTEMPTS", 5)
+
+
+def _retry_delay(attempts: int) -> timedelta:
+    """Exponential backoff: base, 2*base, 4*base, ... capped at one day."""
+    base = getattr(settings, "EMAIL_OUTBOX_RETRY_BASE_SECONDS", 60)
+    return timedelta(seconds=min(base * 2 ** max(attempts - 1, 0), 86400))
+
+
+def _sending_timeout() -> timedelta:
+    """How long a claimed row may stay in SENDING before it is reclaimed."""
+    return timedelta(seconds=getattr(settings, "EMAIL_OUTBOX_SENDING_TIMEOUT", 600))
+
+
+@dataclass
+class OutboxResult:
+    """Counts from one worker batch"""
+
+    sent: int = 0
+    retried: int = 0
+    failed: int = 0
+
+    @property
+    def processed(self) -> int:
+        return self.sent + self.retried + self.failed
+
+
+class OutboxService:
+    """Service for queueing and delivering outbound email"""
+
+    @staticmethod
+    def enqueue(
+        to_email: str,
+        subject: str,
+        body_text: str,
+        body_html: str = "",
+        notification: Optional[Notification] = None,
+        from_email: str = "",
+    ) -> OutboundEmail:
+        """
+        Queue an email for delivery by the outbox worker.
+
+        Args:
+            to_email: Recipient address
+            subject: Email subject
+            body_text: Plain text body
+            body_html: Optional HTML alternative
+            notification: Notification to mark as emailed once delivered
+            from_email: Optional sender (defaults to DEFAULT_FROM_EMAIL)
+
+        Returns:
+            Created OutboundEmail instance
+        """
+        return OutboundEmail.objects.create(
+            to_email=to_email,
+            subject=subject[:255],
+            body_text=body_text,
+            body_html=body_html,
+            notification=notification,
+            from_email=from_email,
+        )
+
+    @staticmethod
+    def enqueue_many(emails: List[OutboundEmail]) -> List[OutboundEmail]:
+        """
+        Queue several unsaved OutboundEmail instances with one INSERT.
+
+        Args:
+            emails: Unsaved OutboundEmail instances
+
+        Returns:
+            The created OutboundEmail instances
+        """
+        if not emails:
+            return []
+        return OutboundEmail.objects.bulk_create(emails)
+
+    @staticmethod
+    def claim_batch(batch_size: Optional[int] = None) -> List[OutboundEmail]:
+        """
+        Claim due emails for this worker.
+
+        Rows are locked with ``SKIP LOCKED`` and flipped to SENDING so several
+        workers can drain the queue concurrently without double delivery.
+        Rows stuck in SENDING (for example after a crash) are reclaimed once
+        EMAIL_OUTBOX_SENDING_TIMEOUT has passed. Claiming counts as an
+        attempt, so a message that keeps crashing its worker is marked FAILED
+        after EMAIL_OUTBOX_MAX_ATTEMPTS instead of being retried forever.
+        """
+        now = timezone.now()
+        due = Q(status=OutboundEmail.Status.PENDING, next_attempt_at__lte=now) | Q(
+            status=OutboundEmail.Status.SENDING,
+            updated_at__lt=now - _sending_timeout(),
+        )
+
+        with transaction.atomic():
+            claimed = list(
+                OutboundEmail.objects.select_for_update(skip_locked=True)
+                .filter(due)
+                .order_by("next_attempt_at", "id")[: batch_size or _batch_size()]
+            )
+            # Only rows abandoned mid-send can have used up their attempts
+            exhausted = [
+                email.id for email in claimed if email.attempts >= _max_attempts()
+            ]
+            if exhausted:
+                logger.error(
+                    "Giving up on emails %s abandoned while sending", exhausted
+                )
+                OutboundEmail.objects.filter(id__in=exhausted).update(
+                    status=OutboundEmail.Status.FAILED,
+                    last_error="Worker stopped while sending",
+                    updated_at=now,
+                )
+
+            batch = [email for email in claimed if email.id not in exhausted]
+            if batch:
+                OutboundEmail.objects.filter(id__in=[email.id for email in batch]).update(
+                    status=OutboundEmail.Status.SENDING,
+                    attempts=F("attempts") + 1,
+                    updated_at=now,
+                )
+                for email in batch:
+                    email.attempts += 1
+        return batch
+
+    @staticmethod
+    def process_batch(batch_size: Optional[int] = None) -> OutboxResult:
+        """
+        Deliver one batch of due emails over a single mail connection.
+
+        Args:
+            batch_size: Maximum number of emails to send (defaults to
+                EMAIL_OUTBOX_BATCH_SIZE)
+
+        Returns:
+            OutboxResult with sent/retried/failed counts
+        """
+        result = OutboxResult()
+        batch = OutboxService.claim_batch(batch_size)
+        if not batch:
+            return result
+
+        sent_ids = []
+        connection = get_connection(fail_silently=False)
+        try:
+            connection.open()
+        except Exception as exc:
+            # No connection means nothing in the batch can go out; retry later
+            logger.warning("Email outbox could not connect: %s", exc)
+            for email in batch:
+                OutboxService._record_failure(email, exc, result)
+            return result
+
+        try:
+            for email in batch:
+                try:
+                    sent = connection.send_messages([OutboxService._build_message(email)])
+                    if not sent:
+                        raise RuntimeError("Email backend accepted no messages")
+                except Exception as exc:
+                    OutboxService._record_failure(email, exc, result)
+                else:
+                    sent_ids.append(email.id)
+        finally:
+            connection.close()
+
+        if sent_ids:
+            now = timezone.now()
+            OutboundEmail.objects.filter(id__in=sent_ids).update(
+                status=OutboundEmail.Status.SENT,
+                sent_at=now,
+                last_error="",
+                updated_at=now,
+            )
+            Notification.objects.filter(
+                Q(outbound_emails__id__in=sent_ids) | Q(digest_email_id__in=sent_ids)
+            ).update(email_sent=True, email_sent_at=now)
+            result.sent = len(sent_ids)
+
+        return result
+
+    @staticmethod
+    def _build_message(email: OutboundEmail) -> EmailMultiAlternatives:
+        message = EmailMultiAlternatives(
+            subject=email.subject,
+            body=email.body_text,
+            from_email=email.from_email or settings.DEFAULT_FROM_EMAIL,
+            to=[email.to_email],
+        )
+        if email.body_html:
+            message.attach_alternative(email.body_html, "text/html")
+        return message
+
+    @staticmethod
+    def _record_failure(
+        email: OutboundEmail, exc: Exception, result: OutboxResult
+    ) -> None:
+        # The attempt was already counted when the row was claimed
+        attempts = email.attempts
+        if attempts >= _max_attempts():
+            status = OutboundEmail.Status.FAILED
+            next_attempt_at = email.next_attempt_at
+            result.failed += 1
+            logger.error(
+                "Giving up on email %s to %s after %s attempts: %s",
+                email.id,
+                email.to_email,
+                attempts,
+                exc,
+            )
+        else:
+            status = OutboundEmail.Status.PENDING
+            next_attempt_at = timezone.now() + _retry_delay(attempts)
+            result.retried += 1
+
+        OutboundEmail.objects.filter(id=email.id).update(
+            status=status,
+            next_attempt_at=next_attempt_at,
+            last_error=str(exc)[:2000],
+            updated_at=timezone.now(),
+        )
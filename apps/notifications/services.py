@@ -4,17 +4,29 @@ Notification service for creating and sending notifications.
 
 from __future__ import annotations
 
+import logging
 from typing import Optional, List
 from django.contrib.contenttypes.models import ContentType
 from apps.accounts.services import EmailService
 from django.template.loader import render_to_string
-from django.conf import settings
+from django.db import transaction
 from django.utils import timezone
 from django.urls import reverse
 
-from apps.notifications.models import Notification, NotificationPreference
+from apps.notifications import cache as notification_cache
+from apps.notifications.models import (
+    Notification,
+    NotificationPreference,
+    OutboundEmail,
+)
+from apps.notifications.outbox import OutboxService
 from apps.accounts.models import User
 
+logger = logging.getLogger(__name__)
+
+# Recipients written per INSERT by create_bulk_notifications
+BULK_BATCH_SIZE = 500
+
 
 class NotificationService:
     """Service for managing notifications"""
@@ -53,6 +65,7 @@ class NotificationService:
             "notification_type": notification_type,
             "category": category,
             "action_url": action_url,
+            "email_requested": send_email,
         }
 
         # Add related object if provided
@@ -79,10 +92,15 @@ class NotificationService:
         category: str = "general",
         action_url: str = "",
         send_email: bool = False,
+        batch_size: int = BULK_BATCH_SIZE,
     ) -> List[Notification]:
         """
         Create notifications for multiple users at once.
 
+        Recipients are processed in chunks: each chunk costs one INSERT for
+        the notifications and, when emailing, one preference lookup and one
+        INSERT into the email outbox, whatever the number of recipients.
+
         Args:
             recipients: List of users to receive notification
             title: Short title
@@ -91,35 +109,81 @@ class NotificationService:
             category: Category (attendance, assessment, etc.)
             action_url: Optional URL to navigate to
             send_email: Whether to send email notifications
+            batch_size: Number of recipients written per chunk
 
         Returns:
             List of created Notification instances
         """
-        notifications = []
-        for recipient in recipients:
-            notification = NotificationService.create_notification(
+        notifications = [
+            Notification(
                 recipient=recipient,
                 title=title,
                 message=message,
                 notification_type=notification_type,
                 category=category,
                 action_url=action_url,
-                send_email=send_email,
             )
-            notifications.append(notification)
+            for recipient in recipients
+        ]
+        return NotificationService.save_bulk_notifications(
+            notifications, send_email=send_email, batch_size=batch_size
+        )
+
+    @staticmethod
+    def save_bulk_notifications(
+        notifications: List[Notification],
+        send_email: bool = False,
+        batch_size: int = BULK_BATCH_SIZE,
+    ) -> List[Notification]:
+        """
+        Insert prepared notifications, queueing their emails in bulk.
 
-        return notifications
+        Use this when each recipient needs a different message. Each chunk of
+        ``batch_size`` costs one INSERT for the notifications and, when
+        emailing, one preference lookup and one outbox INSERT. The
+        notifications' ``recipient`` must already be loaded.
+
+        Args:
+            notifications: Unsaved Notification instances
+            send_email: Whether to send email notifications
+            batch_size: Number of notifications written per chunk
+
+        Returns:
+            List of created Notification instances
+        """
+        saved = []
+        for notification in notifications:
+            notification.email_requested = send_email
+
+        for offset in range(0, len(notifications), batch_size):
+            chunk = notifications[offset : offset + batch_size]
+            with transaction.atomic():
+                created = Notification.objects.bulk_create(chunk)
+
+                if send_email:
+                    NotificationService._queue_bulk_emails(created)
+
+            # bulk_create skips post_save, so refresh the bell data ourselves
+            notification_cache.invalidate(
+                [notification.recipient_id for notification in chunk]
+            )
+            saved.extend(created)
+
+        return saved
 
     @staticmethod
     def _send_email_notification(notification: Notification) -> bool:
         """
-        Send email notification to user.
+        Queue an email notification for the outbox worker.
+
+        The email is rendered now but delivered by the process_email_outbox
+        command, which also sets email_sent/email_sent_at once it goes out.
 
         Args:
             notification: Notification instance to send
 
         Returns:
-            True if email sent successfully, False otherwise
+            True if the email was queued, False otherwise
         """
         try:
             # Check user preferences
@@ -131,35 +195,83 @@ class NotificationService:
             if not NotificationService._should_send_email(notification, preferences):
                 return False
 
-            # Prepare email context
-            context = {
-                "notification": notification,
-                "user": notification.recipient,
-                "site_url": (
-                    settings.SITE_URL
-                    if hasattr(settings, "SITE_URL")
-                    else "http://localhost:8000"
-                ),
-            }
+            # Digest subscribers get this in their next digest instead
+            if NotificationService._wants_digest(preferences):
+                return False
+
+            if not notification.recipient.email:
+                return False
 
-            # Send email using EmailService
-            success = EmailService.send_notification_email(
+            subject, body_text, body_html = EmailService.render_notification_email(
                 recipient=notification.recipient,
                 notification=notification,
-                context=context,
             )
+            OutboxService.enqueue(
+                to_email=notification.recipient.email,
+                subject=subject,
+                body_text=body_text,
+                body_html=body_html,
+                notification=notification,
+            )
+            return True
+
+        except Exception:
+            logger.exception(
+                "Error queueing email for notification %s", notification.pk
+            )
+            return False
 
-            if success:
-                # Mark as sent
-                notification.email_sent = True
-                notification.email_sent_at = timezone.now()
-                notification.save(update_fields=["email_sent", "email_sent_at"])
+    @staticmethod
+    def _queue_bulk_emails(notifications: List[Notification]) -> int:
+        """
+        Queue emails for freshly created notifications in a single batch.
 
-            return success
+        Preferences for every recipient are loaded with one query; missing
+        rows are created together so later lookups find them.
 
-        except Exception as e:
-            print(f"Error sending email notification: {e}")
-            return False
+        Returns:
+            Number of emails queued
+        """
+        user_ids = [notification.recipient_id for notification in notifications]
+        preferences = {
+            preference.user_id: preference
+            for preference in NotificationPreference.objects.filter(user_id__in=user_ids)
+        }
+        missing = [
+            NotificationPreference(user_id=user_id)
+            for user_id in set(user_ids) - preferences.keys()
+        ]
+        if missing:
+            NotificationPreference.objects.bulk_create(missing, ignore_conflicts=True)
+            preferences.update({preference.user_id: preference for preference in missing})
+
+        emails = []
+        for notification in notifications:
+            recipient = notification.recipient
+            recipient_preferences = preferences[recipient.pk]
+            if (
+                not recipient.email
+                or not NotificationService._should_send_email(
+                    notification, recipient_preferences
+                )
+                or NotificationService._wants_digest(recipient_preferences)
+            ):
+                continue
+            subject, body_text, body_html = EmailService.render_notification_email(
+                recipient=recipient,
+                notification=notification,
+            )
+            emails.append(
+                OutboundEmail(
+                    notification=notification,
+                    to_email=recipient.email,
+                    subject=subject[:255],
+                    body_text=body_text,
+                    body_html=body_html,
+                )
+            )
+
+        return len(OutboxService.enqueue_many(emails))
 
     @staticmethod
     def _get_or_create_preferences(user: User) -> NotificationPreference:
@@ -185,6 +297,11 @@ class NotificationService:
 
         return category_mapping.get(notification.category, True)
 
+    @staticmethod
+    def _wants_digest(preferences: NotificationPreference) -> bool:
+        """Digest subscribers receive batched emails instead of one per event"""
+        return preferences.daily_digest or preferences.weekly_digest
+
     @staticmethod
     def mark_all_as_read(user: User) -> int:
         """
@@ -199,6 +316,8 @@ class NotificationService:
         count = Notification.objects.filter(recipient=user, is_read=False).update(
             is_read=True, read_at=timezone.now()
         )
+        # update() bypasses post_save, so drop the cached bell data explicitly
+        notification_cache.invalidate([user.pk])
         return count
 
     @staticmethod
@@ -212,7 +331,7 @@ class NotificationService:
         Returns:
             Number of unread notifications
         """
-        return Notification.objects.filter(recipient=user, is_read=False).count()
+        return notification_cache.get_unread_count(user.pk)
 
     @staticmethod
     def get_recent_notifications(user: User, limit: int = 10) -> List[Notification]:
@@ -264,6 +383,46 @@ class NotificationService:
             send_email=True,
         )
 
+    @staticmethod
+    def notify_attendance_decisions(attendances, approver, approved, reason=""):
+        """
+        Notify interns about attendance approved or rejected in one batch.
+
+        Messages match notify_attendance_approved/notify_attendance_rejected;
+        attendances should have ``intern__user`` selected.
+        """
+        attendances = list(attendances)
+        if not attendances:
+            return []
+        content_type = ContentType.objects.get_for_model(attendances[0])
+        action_url = reverse("attendance:my_attendance")
+        notifications = []
+        for attendance in attendances:
+            day = attendance.check_in_time.strftime("%B %d, %Y")
+            if approved:
+                title = "Attendance Approved ✓"
+                message = f"Your attendance for {day} has been approved by {approver.get_full_name()}."
+            else:
+                title = "Attendance Rejected"
+                message = f"Your attendance for {day} was rejected by {approver.get_full_name()}."
+                if reason:
+                    message += f" Reason: {reason}"
+            notifications.append(
+                Notification(
+                    recipient=attendance.intern.user,
+                    title=title,
+                    message=message,
+                    notification_type="success" if approved else "error",
+                    category="attendance",
+                    action_url=action_url,
+                    content_type=content_type,
+                    object_id=attendance.pk,
+                )
+            )
+        return NotificationService.save_bulk_notifications(
+            notifications, send_email=True
+        )
+
     @staticmethod
     def notify_assessment_created(assessment, creator):
         """Notify intern that a new assessment was created"""
@@ -278,6 +437,36 @@ class NotificationService:
             send_email=True,
         )
 
+    @staticmethod
+    def notify_assessments_scheduled(assessments):
+        """
+        Notify interns about scheduled draft assessments in one batch.
+
+        Assessments should have ``intern__user`` selected.
+        """
+        assessments = list(assessments)
+        if not assessments:
+            return []
+        content_type = ContentType.objects.get_for_model(assessments[0])
+        notifications = [
+            Notification(
+                recipient=assessment.intern.user,
+                title="New Assessment Available",
+                message=f"Week {assessment.week_number} assessment is ready for your self-assessment.",
+                notification_type="info",
+                category="assessment",
+                action_url=reverse(
+                    "evaluations:self_assessment", args=[assessment.id]
+                ),
+                content_type=content_type,
+                object_id=assessment.pk,
+            )
+            for assessment in assessments
+        ]
+        return NotificationService.save_bulk_notifications(
+            notifications, send_email=True
+        )
+
     @staticmethod
     def notify_assessment_reviewed(assessment, reviewer):
         """Notify intern that their assessment was reviewed"""
@@ -0,0 +1,15 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.notifications import cache as notification_cache
+from apps.notifications.models import Notification
+
+
+@receiver(post_save, sender=Notification)
+def invalidate_cache_on_save(sender, instance, **kwargs):  # type: ignore[override]
+    notification_cache.invalidate([instance.recipient_id])
+
+
+@receiver(post_delete, sender=Notification)
+def invalidate_cache_on_delete(sender, instance, **kwargs):  # type: ignore[override]
+    notification_cache.invalidate([instance.recipient_id])
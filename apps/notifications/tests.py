@@ -2,12 +2,28 @@
 Tests for notification system including email functionality.
 """
 
-from django.test import TestCase, override_settings
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 from django.contrib.auth import get_user_model
 from django.core import mail
+from django.core.mail import get_connection
+from django.core.cache import cache
 from unittest.mock import patch, MagicMock
 
-from apps.notifications.models import Notification, NotificationPreference
+from apps.notifications.context_processors import notifications_context
+from apps.notifications.models import (
+    Notification,
+    NotificationPreference,
+    OutboundEmail,
+)
+from apps.notifications.digest import DAILY, WEEKLY, DigestService
+from apps.notifications.outbox import OutboxService
 from apps.notifications.services import NotificationService
 from apps.accounts.services import EmailService
 
@@ -193,6 +209,13 @@ class NotificationServiceTest(TestCase):
         )
 
         self.assertIsInstance(notification, Notification)
+        # Delivery happens in the outbox worker, not the request thread
+        self.assertFalse(notification.email_sent)
+        self.assertEqual(len(mail.outbox), 0)
+
+        OutboxService.process_batch()
+        notification.refresh_from_db()
+
         self.assertTrue(notification.email_sent)
         self.assertIsNotNone(notification.email_sent_at)
         self.assertEqual(len(mail.outbox), 1)
@@ -270,11 +293,46 @@ class NotificationServiceTest(TestCase):
         )
 
         self.assertEqual(len(notifications), 2)
+        OutboxService.process_batch()
         self.assertEqual(len(mail.outbox), 2)
 
         for notification in notifications:
+            notification.refresh_from_db()
             self.assertTrue(notification.email_sent)
 
+    def test_bulk_notifications_use_fixed_queries(self):
+        """Bulk fan-out cost does not grow with the number of recipients"""
+        users = [
+            User.objects.create_user(
+                username=f"bulk{i}", email=f"bulk{i}@example.com", password="x"
+            )
+            for i in range(20)
+        ]
+        NotificationPreference.objects.create(
+            user=users[0],
+            email_on_assessment_created=False,
+            email_on_assessment_reviewed=False,
+        )
+
+        def broadcast(recipients):
+            with CaptureQueriesContext(connection) as queries:
+                NotificationService.create_bulk_notifications(
+                    recipients=recipients,
+                    title="Broadcast",
+                    message="Hello",
+                    category="assessment",
+                    send_email=True,
+                )
+            return len(queries)
+
+        self.assertEqual(broadcast(users[:2]), broadcast(users[2:]))
+        # users[0] opted out of assessment emails; everyone else is queued
+        self.assertEqual(OutboundEmail.objects.count(), 19)
+        self.assertEqual(
+            NotificationPreference.objects.filter(user__in=users).count(), 20
+        )
+        self.assertEqual(NotificationService.get_unread_count(users[5]), 1)
+
     def test_get_unread_count(self):
         """Test getting unread notification count"""
         # Create some notifications
@@ -332,3 +390,293 @@ class NotificationServiceTest(TestCase):
 
         self.assertFalse(notification.email_sent)
         self.assertIsNone(notification.email_sent_at)
+
+
+class OutboxServiceTest(TestCase):
+    """Test the outbound email queue and its worker"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="testpass123"
+        )
+        mail.outbox = []
+
+    def _notify(self):
+        return NotificationService.create_notification(
+            recipient=self.user,
+            title="Queued",
+            message="Queued message",
+            category="attendance",
+            send_email=True,
+        )
+
+    def test_send_email_only_queues(self):
+        """Creating a notification writes an outbox row without sending"""
+        notification = self._notify()
+
+        email = OutboundEmail.objects.get(notification=notification)
+        self.assertEqual(email.status, OutboundEmail.Status.PENDING)
+        self.assertEqual(email.to_email, "test@example.com")
+        self.assertIn("Queued", email.subject)
+        self.assertTrue(email.body_html)
+        self.assertEqual(len(mail.outbox), 0)
+
+    def test_batch_uses_single_connection(self):
+        """A batch is delivered over one opened connection"""
+        for _ in range(3):
+            self._notify()
+
+        with patch(
+            "apps.notifications.outbox.get_connection", wraps=get_connection
+        ) as mock_connection:
+            result = OutboxService.process_batch()
+
+        self.assertEqual(result.sent, 3)
+        self.assertEqual(mock_connection.call_count, 1)
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertFalse(
+            OutboundEmail.objects.exclude(status=OutboundEmail.Status.SENT).exists()
+        )
+
+    @override_settings(EMAIL_OUTBOX_MAX_ATTEMPTS=2, EMAIL_OUTBOX_RETRY_BASE_SECONDS=60)
+    def test_failure_is_retried_with_backoff_then_failed(self):
+        """Failed sends are rescheduled and eventually marked failed"""
+        notification = self._notify()
+
+        with patch(
+            "django.core.mail.backends.locmem.EmailBackend.send_messages",
+            side_effect=OSError("SMTP down"),
+        ):
+            result = OutboxService.process_batch()
+            self.assertEqual(result.retried, 1)
+
+            email = OutboundEmail.objects.get()
+            self.assertEqual(email.status, OutboundEmail.Status.PENDING)
+            self.assertEqual(email.attempts, 1)
+            self.assertEqual(email.last_error, "SMTP down")
+            self.assertGreater(email.next_attempt_at, timezone.now())
+
+            # Not due yet, so nothing is claimed
+            self.assertEqual(OutboxService.process_batch().processed, 0)
+
+            OutboundEmail.objects.update(next_attempt_at=timezone.now())
+            result = OutboxService.process_batch()
+
+        self.assertEqual(result.failed, 1)
+        email.refresh_from_db()
+        self.assertEqual(email.status, OutboundEmail.Status.FAILED)
+        notification.refresh_from_db()
+        self.assertFalse(notification.email_sent)
+
+    def test_stale_sending_rows_are_reclaimed(self):
+        """Rows abandoned in SENDING by a crashed worker are picked up again"""
+        self._notify()
+        OutboundEmail.objects.update(status=OutboundEmail.Status.SENDING)
+        self.assertEqual(OutboxService.process_batch().processed, 0)
+
+        OutboundEmail.objects.update(updated_at=timezone.now() - timedelta(hours=1))
+
+        self.assertEqual(OutboxService.process_batch().sent, 1)
+
+    @override_settings(EMAIL_OUTBOX_MAX_ATTEMPTS=2)
+    def test_crashing_email_reaches_failed(self):
+        """Reclaimed rows count an attempt, so a crash loop ends in FAILED"""
+        self._notify()
+
+        for attempt in (1, 2):
+            (email,) = OutboxService.claim_batch()
+            self.assertEqual(email.attempts, attempt)
+            # The worker dies mid-send and the row goes stale
+            OutboundEmail.objects.update(updated_at=timezone.now() - timedelta(hours=1))
+
+        self.assertEqual(OutboxService.claim_batch(), [])
+        email = OutboundEmail.objects.get()
+        self.assertEqual(email.status, OutboundEmail.Status.FAILED)
+        self.assertEqual(email.attempts, 2)
+        self.assertEqual(len(mail.outbox), 0)
+
+    def test_management_command_drains_outbox(self):
+        """process_email_outbox --once sends everything that is due"""
+        for _ in range(3):
+            self._notify()
+
+        call_command("process_email_outbox", once=True, batch_size=2, stdout=StringIO())
+
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertEqual(Notification.objects.filter(email_sent=True).count(), 3)
+
+
+class DigestServiceTest(TestCase):
+    """Test daily and weekly notification digests"""
+
+    def setUp(self):
+        mail.outbox = []
+        self.daily_user = User.objects.create_user(
+            username="daily", email="daily@example.com", password="testpass123"
+        )
+        self.weekly_user = User.objects.create_user(
+            username="weekly", email="weekly@example.com", password="testpass123"
+        )
+        NotificationPreference.objects.create(user=self.daily_user, daily_digest=True)
+        NotificationPreference.objects.create(
+            user=self.weekly_user, weekly_digest=True
+        )
+
+    def _notify(self, user, title="Event", category="attendance"):
+        return NotificationService.create_notification(
+            recipient=user,
+            title=title,
+            message="Something happened",
+            category=category,
+            send_email=True,
+        )
+
+    def test_digest_subscribers_skip_individual_emails(self):
+        """Events for digest subscribers are not queued one by one"""
+        self._notify(self.daily_user)
+        NotificationService.create_bulk_notifications(
+            recipients=[self.weekly_user], title="Bulk", message="Hi", send_email=True
+        )
+
+        self.assertFalse(OutboundEmail.objects.exists())
+
+    def test_daily_digest_groups_notifications_per_user(self):
+        """One digest is queued per subscriber and delivered by the worker"""
+        for i in range(3):
+            self._notify(self.daily_user, title=f"Daily event {i}")
+        self._notify(self.weekly_user)
+
+        result = DigestService.send_digests(DAILY)
+
+        self.assertEqual((result.users, result.notifications), (1, 3))
+        digest = OutboundEmail.objects.get()
+        self.assertEqual(digest.to_email, "daily@example.com")
+        self.assertIn("3 notifications", digest.subject)
+        self.assertIn("Daily event 2", digest.body_html)
+
+        OutboxService.process_batch()
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(
+            Notification.objects.filter(
+                recipient=self.daily_user, email_sent=True
+            ).count(),
+            3,
+        )
+
+    def test_digest_is_not_sent_twice(self):
+        """Notifications already in a digest are not picked up again"""
+        self._notify(self.weekly_user)
+
+        self.assertEqual(DigestService.send_digests(WEEKLY).users, 1)
+        self.assertEqual(DigestService.send_digests(WEEKLY).users, 0)
+
+    def test_digest_honours_category_preferences(self):
+        """Categories the user disabled are left out of the digest"""
+        NotificationPreference.objects.filter(user=self.daily_user).update(
+            email_on_absence_status=False
+        )
+        self._notify(self.daily_user, category="absenteeism")
+
+        self.assertEqual(DigestService.send_digests(DAILY).users, 0)
+
+    def test_late_run_includes_missed_notifications(self):
+        """A digest running two days late still sends the older events"""
+        missed = self._notify(self.daily_user, title="Missed event")
+        Notification.objects.filter(pk=missed.pk).update(
+            created_at=timezone.now() - timedelta(days=3)
+        )
+        self._notify(self.daily_user, title="Recent event")
+
+        result = DigestService.send_digests(DAILY)
+
+        self.assertEqual((result.users, result.notifications), (1, 2))
+        self.assertIn("Missed event", OutboundEmail.objects.get().body_html)
+        self.assertEqual(DigestService.send_digests(DAILY).users, 0)
+
+    def test_new_subscriber_gets_only_new_email_events(self):
+        """History, in-app-only and already read events stay out of a first digest"""
+        user = User.objects.create_user(
+            username="late", email="late@example.com", password="testpass123"
+        )
+        NotificationPreference.objects.create(user=user)
+        self._notify(user, title="Emailed on its own")
+        NotificationService.create_notification(
+            recipient=user, title="In-app only", message="Checked in"
+        )
+        NotificationPreference.objects.filter(user=user).update(daily_digest=True)
+        self._notify(user, title="Already read").mark_as_read()
+        self._notify(user, title="New event")
+
+        result = DigestService.send_digests(DAILY)
+
+        self.assertEqual((result.users, result.notifications), (1, 1))
+        digest = OutboundEmail.objects.get(to_email="late@example.com", notification=None)
+        self.assertIn("New event", digest.body_html)
+        for title in ["Emailed on its own", "In-app only", "Already read"]:
+            self.assertNotIn(title, digest.body_html)
+
+    def test_management_command(self):
+        """send_notification_digests queues weekly digests"""
+        self._notify(self.weekly_user)
+        out = StringIO()
+
+        call_command("send_notification_digests", period="weekly", stdout=out)
+
+        self.assertIn("Queued 1 weekly digest", out.getvalue())
+        self.assertEqual(OutboundEmail.objects.get().to_email, "weekly@example.com")
+
+
+class NotificationCacheTest(TestCase):
+    """Test the cached, lazily evaluated notification context"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="testpass123"
+        )
+        self.request = RequestFactory().get("/")
+        self.request.user = self.user
+
+    def test_context_is_lazy(self):
+        """Building the context must not hit the database"""
+        with self.assertNumQueries(0):
+            notifications_context(self.request)
+
+    def test_count_is_cached_between_requests(self):
+        """The unread count is only queried once until invalidated"""
+        Notification.objects.create(recipient=self.user, title="Test", message="Test")
+
+        with self.assertNumQueries(1):
+            context = notifications_context(self.request)
+            self.assertEqual(context["unread_notifications_count"], 1)
+        with self.assertNumQueries(0):
+            context = notifications_context(self.request)
+            self.assertEqual(context["unread_notifications_count"], 1)
+
+    def test_save_invalidates_cache(self):
+        """Creating or reading a notification refreshes the cached values"""
+        notification = Notification.objects.create(
+            recipient=self.user, title="First", message="Test"
+        )
+        self.assertEqual(NotificationService.get_unread_count(self.user), 1)
+
+        Notification.objects.create(recipient=self.user, title="Second", message="Test")
+        self.assertEqual(NotificationService.get_unread_count(self.user), 2)
+
+        notification.mark_as_read()
+        self.assertEqual(NotificationService.get_unread_count(self.user), 1)
+
+        recent = notifications_context(self.request)["recent_notifications"]
+        self.assertEqual([n.title for n in recent], ["Second", "First"])
+
+    def test_mark_all_as_read_invalidates_cache(self):
+        """Bulk update through the service clears the cached count"""
+        for i in range(3):
+            Notification.objects.create(
+                recipient=self.user, title=f"Test {i}", message="Test"
+            )
+        self.assertEqual(NotificationService.get_unread_count(self.user), 3)
+
+        NotificationService.mark_all_as_read(self.user)
+
+        self.assertEqual(NotificationService.get_unread_count(self.user), 0)
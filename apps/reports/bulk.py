@@ -0,0 +1,142 @@
+"""
+Bulk export of intern performance reports as a streamed ZIP archive.
+
+Report data is gathered with a few grouped queries per chunk of interns,
+HTML is rendered in the calling process, and the PDF conversion is fanned out
+to a process pool whose workers each compile the report stylesheet once.
+Finished PDFs are written to the archive in queryset order as they arrive, so
+neither the archive nor the full set of PDFs is ever held in memory.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, Optional
+
+from django.conf import settings
+from django.db.models import QuerySet
+from django.template.loader import render_to_string
+
+from apps.reports import rendering
+from apps.reports.services import ReportService
+
+
+class _ZipStream:
+    """Write-only buffer that zipfile can stream into without seeking."""
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class BulkReportService:
+    """Service for rendering many intern reports into one archive"""
+
+    @staticmethod
+    def default_workers() -> int:
+        return getattr(settings, "REPORT_EXPORT_WORKERS", None) or os.cpu_count() or 1
+
+    @staticmethod
+    def request_workers() -> int:
+        """Pool size for exports streamed from a web request, kept small."""
+        return min(
+            getattr(settings, "REPORT_REQUEST_EXPORT_WORKERS", 2),
+            BulkReportService.default_workers(),
+        )
+
+    @staticmethod
+    def iter_report_html(interns: QuerySet) -> Iterator[tuple[str, str]]:
+        """
+        Yield ``(filename, html)`` pairs for every intern in the queryset.
+
+        Args:
+            interns: InternProfile queryset to report on
+        """
+        template = "reports/intern_performance_report.html"
+        for report_data in ReportService.gather_bulk_intern_data(interns):
+            intern_profile = report_data["intern"]
+            filename = ReportService.intern_report_filename(intern_profile).replace(
+                ".pdf", f"_{intern_profile.id}.pdf"
+            )
+            yield filename, render_to_string(template, report_data)
+
+    @staticmethod
+    def iter_rendered_pdfs(
+        interns: QuerySet, workers: Optional[int] = None
+    ) -> Iterator[tuple[str, bytes]]:
+        """
+        Yield ``(filename, pdf_bytes)`` pairs, rendering across a process pool.
+
+        At most ``2 * workers`` documents are in flight at once. With a
+        single worker the PDFs are rendered in the current process.
+
+        Args:
+            interns: InternProfile queryset to report on
+            workers: Number of worker processes (defaults to the CPU count)
+        """
+        workers = workers or BulkReportService.default_workers()
+        css_string = ReportService._get_pdf_styles()
+        documents = BulkReportService.iter_report_html(interns)
+
+        if workers <= 1:
+            rendering.init_worker(css_string)
+            for filename, html_string in documents:
+                yield filename, rendering.render_pdf_bytes(html_string, css_string)
+            return
+
+        # Spawned workers only import the Django-free rendering module.
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=rendering.init_worker,
+            initargs=(css_string,),
+        ) as pool:
+            in_flight = deque()
+            for document in documents:
+                in_flight.append(pool.submit(rendering.render_named_pdf, document))
+                if len(in_flight) >= workers * 2:
+                    yield in_flight.popleft().result()
+            while in_flight:
+                yield in_flight.popleft().result()
+
+    @staticmethod
+    def iter_zip(interns: QuerySet, workers: Optional[int] = None) -> Iterator[bytes]:
+        """
+        Yield the bytes of a ZIP archive containing one PDF per intern.
+
+        Suitable for StreamingHttpResponse or for writing to a file.
+
+        Args:
+            interns: InternProfile queryset to report on
+            workers: Number of worker processes (defaults to the CPU count)
+        """
+        stream = _ZipStream()
+        # PDFs are already compressed; storing them keeps the parent cheap.
+        with zipfile.ZipFile(stream, mode="w", compression=zipfile.ZIP_STORED) as archive:
+            for filename, pdf_bytes in BulkReportService.iter_rendered_pdfs(
+                interns, workers=workers
+            ):
+                archive.writestr(filename, pdf_bytes)
+                yield stream.drain()
+        yield stream.drain()
+
+    @staticmethod
+    def write_zip(interns: QuerySet, fileobj, workers: Optional[int] = None) -> None:
+        """Write the report archive for a queryset to an open binary file."""
+        for chunk in BulkReportService.iter_zip(interns, workers=workers):
+            fileobj.write(chunk)
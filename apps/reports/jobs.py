@@ -0,0 +1,280 @@
+"""
+Background rendering and on-disk caching of PDF reports.
+
+Report HTML is rendered on the request thread (it needs the database), then
+the expensive WeasyPrint conversion is handed to a local thread pool. Finished
+PDFs are stored under ``REPORT_CACHE_DIR`` keyed by intern and a fingerprint
+of the data that feeds the report, so identical downloads are served from
+disk instead of being rendered again.
+
+Job state lives on disk rather than in memory so that every worker process
+sees the same picture:
+
+* ``<fingerprint>.pdf``     finished report
+* ``<fingerprint>.pending`` render in progress (created atomically); markers
+  older than ``REPORT_RENDER_TIMEOUT_SECONDS`` belong to a render that died
+* ``<fingerprint>.error``   last render failed
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from django.conf import settings
+from django.db.models import Count, Max, Q
+from django.utils import timezone
+
+from apps.absenteeism.models import AbsenteeismRequest
+from apps.attendance.models import Attendance, AttendanceDay
+from apps.evaluations.models import PerformanceAssessment
+from apps.holidays.models import Holiday
+from apps.interns.models import InternProfile
+from apps.reports.services import ReportService
+
+logger = logging.getLogger(__name__)
+
+# Bump when the report template or styles change so cached PDFs are rebuilt.
+REPORT_FORMAT_VERSION = "4"
+
+FINGERPRINT_RE = re.compile(r"[0-9a-f]{32}")
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=getattr(settings, "REPORT_RENDER_WORKERS", 2),
+                thread_name_prefix="report-render",
+            )
+        return _executor
+
+
+@dataclass
+class ReportJob:
+    """State of a single report render request."""
+
+    class Status:
+        READY = "ready"
+        RENDERING = "rendering"
+        FAILED = "failed"
+        # No live render for this fingerprint; request the report again
+        EXPIRED = "expired"
+
+    intern_id: int
+    fingerprint: str
+    status: str
+    path: Path
+    future: Optional[Future] = None
+
+    @property
+    def is_ready(self) -> bool:
+        return self.status == self.Status.READY
+
+    @property
+    def is_failed(self) -> bool:
+        return self.status == self.Status.FAILED
+
+
+class ReportJobService:
+    """Service for queueing report renders and serving cached results"""
+
+    @staticmethod
+    def cache_dir(intern_id: int) -> Path:
+        """Return the cache directory for one intern's reports."""
+        return Path(settings.REPORT_CACHE_DIR) / f"intern_{intern_id}"
+
+    @staticmethod
+    def intern_data_fingerprint(intern_profile: InternProfile) -> str:
+        """
+        Return a digest that changes whenever the report's source data does.
+
+        The digest covers row counts and last-modified timestamps of the
+        intern's attendance and its daily rollups, assessments, absence
+        requests and applicable holidays, the profile itself, and the current
+        date (the report prints dates relative to today).
+
+        Args:
+            intern_profile: InternProfile instance
+
+        Returns:
+            Hex digest string
+        """
+        attendance = Attendance.objects.filter(intern=intern_profile).aggregate(
+            count=Count("id"), latest=Max("updated_at")
+        )
+        assessments = PerformanceAssessment.objects.filter(
+            intern=intern_profile
+        ).aggregate(count=Count("id"), latest=Max("updated_at"))
+        rollups = AttendanceDay.objects.filter(intern=intern_profile).aggregate(
+            count=Count("id"), latest=Max("updated_at")
+        )
+        holidays = Holiday.objects.filter(
+            Q(branch__isnull=True) | Q(branch_id=intern_profile.branch_id)
+        ).aggregate(count=Count("id"), latest=Max("updated_at"))
+        absences = AbsenteeismRequest.objects.filter(intern=intern_profile).aggregate(
+            count=Count("id"),
+            latest_submitted=Max("submitted_at"),
+            latest_decision=Max("decision_at"),
+        )
+
+        parts = [
+            REPORT_FORMAT_VERSION,
+            timezone.localdate().isoformat(),
+            intern_profile.updated_at.isoformat() if intern_profile.updated_at else "",
+            intern_profile.user.get_full_name(),
+            intern_profile.user.email,
+            str(intern_profile.branch_id),
+            str(intern_profile.internal_supervisor_id),
+            repr(sorted(attendance.items())),
+            repr(sorted(rollups.items())),
+            repr(sorted(assessments.items())),
+            repr(sorted(absences.items())),
+            repr(sorted(holidays.items())),
+        ]
+        return hashlib.sha256("|".join(parts).encode()).hexdigest()[:32]
+
+    @staticmethod
+    def get_intern_report(intern_profile: InternProfile) -> ReportJob:
+        """
+        Return the cached report for an intern, queueing a render if needed.
+
+        Args:
+            intern_profile: InternProfile instance
+
+        Returns:
+            ReportJob describing the current state of the report
+        """
+        fingerprint = ReportJobService.intern_data_fingerprint(intern_profile)
+        directory = ReportJobService.cache_dir(intern_profile.id)
+        pdf_path = directory / f"{fingerprint}.pdf"
+        pending_path = directory / f"{fingerprint}.pending"
+        error_path = directory / f"{fingerprint}.error"
+
+        job = ReportJob(
+            intern_id=intern_profile.id,
+            fingerprint=fingerprint,
+            status=ReportJob.Status.RENDERING,
+            path=pdf_path,
+        )
+
+        if pdf_path.exists():
+            job.status = ReportJob.Status.READY
+            return job
+
+        if error_path.exists():
+            job.status = ReportJob.Status.FAILED
+            return job
+
+        directory.mkdir(parents=True, exist_ok=True)
+        if not ReportJobService._claim(pending_path):
+            # Another request or worker process is already rendering it.
+            return job
+
+        try:
+            html_string = ReportService.render_intern_performance_html(intern_profile)
+        except Exception:
+            pending_path.unlink(missing_ok=True)
+            raise
+
+        job.future = _get_executor().submit(
+            ReportJobService._render_to_disk, html_string, directory, fingerprint
+        )
+        return job
+
+    @staticmethod
+    def job_status(intern_id: int, fingerprint: str) -> str:
+        """
+        Read the state of a queued render from its files, without queueing.
+
+        Used by the status poll, which must stay cheap: no fingerprint is
+        computed and nothing is rendered.
+
+        Args:
+            intern_id: Intern the report belongs to
+            fingerprint: Fingerprint returned when the render was queued
+
+        Returns:
+            One of the ReportJob.Status values
+        """
+        directory = ReportJobService.cache_dir(intern_id)
+        if (directory / f"{fingerprint}.pdf").exists():
+            return ReportJob.Status.READY
+        if (directory / f"{fingerprint}.error").exists():
+            return ReportJob.Status.FAILED
+        pending_path = directory / f"{fingerprint}.pending"
+        if pending_path.exists() and not ReportJobService._is_stale(pending_path):
+            return ReportJob.Status.RENDERING
+        return ReportJob.Status.EXPIRED
+
+    @staticmethod
+    def retry(job: ReportJob) -> None:
+        """Clear a failed render so the next request queues it again."""
+        (job.path.parent / f"{job.fingerprint}.error").unlink(missing_ok=True)
+
+    @staticmethod
+    def _is_stale(pending_path: Path) -> bool:
+        """True if a pending marker outlived the render timeout."""
+        stale_after = getattr(settings, "REPORT_RENDER_TIMEOUT_SECONDS", 300)
+        try:
+            return time.time() - pending_path.stat().st_mtime > stale_after
+        except FileNotFoundError:
+            return False
+
+    @staticmethod
+    def _claim(pending_path: Path) -> bool:
+        """Atomically create the pending marker; False if already claimed."""
+        if ReportJobService._is_stale(pending_path):
+            # The process that claimed this render died; take it over.
+            pending_path.unlink(missing_ok=True)
+
+        try:
+            fd = os.open(pending_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            return False
+        os.close(fd)
+        return True
+
+    @staticmethod
+    def _render_to_disk(html_string: str, directory: Path, fingerprint: str) -> Path:
+        """Render a PDF on a pool thread and publish it atomically."""
+        pdf_path = directory / f"{fingerprint}.pdf"
+        tmp_path = directory / f"{fingerprint}.pdf.tmp"
+        pending_path = directory / f"{fingerprint}.pending"
+
+        try:
+            tmp_path.write_bytes(ReportService.render_pdf(html_string))
+            os.replace(tmp_path, pdf_path)
+        except Exception:
+            logger.exception("Report render failed for %s", directory / fingerprint)
+            (directory / f"{fingerprint}.error").touch()
+            tmp_path.unlink(missing_ok=True)
+            raise
+        finally:
+            pending_path.unlink(missing_ok=True)
+
+        ReportJobService._prune(directory, keep=fingerprint)
+        return pdf_path
+
+    @staticmethod
+    def _prune(directory: Path, keep: str) -> None:
+        """Remove reports for superseded fingerprints and dead render markers."""
+        for path in directory.iterdir():
+            if path.stem == keep:
+                continue
+            if path.suffix in (".pdf", ".error") or (
+                path.suffix == ".pending" and ReportJobService._is_stale(path)
+            ):
+                path.unlink(missing_ok=True)
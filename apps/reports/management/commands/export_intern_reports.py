@@ -0,0 +1,88 @@
+"""
+Management command to export performance reports for many interns as a ZIP
+"""
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.interns.models import InternProfile
+from apps.reports.bulk import BulkReportService
+
+
+class Command(BaseCommand):
+    help = "Render performance reports for a filtered set of interns into a ZIP"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output",
+            type=str,
+            required=True,
+            help="Path of the ZIP file to write",
+        )
+        parser.add_argument(
+            "--branch",
+            type=str,
+            help="Only interns of this branch (id or code)",
+        )
+        parser.add_argument(
+            "--school",
+            type=str,
+            help="Only interns of this school (id or name)",
+        )
+        parser.add_argument(
+            "--active",
+            action="store_true",
+            help="Only interns whose internship is currently running",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="Number of rendering processes (defaults to the CPU count)",
+        )
+
+    def handle(self, *args, **options):
+        interns = InternProfile.objects.all()
+
+        if options["branch"]:
+            interns = interns.filter(
+                self._id_or_field("branch", "code", options["branch"])
+            )
+        if options["school"]:
+            interns = interns.filter(
+                self._id_or_field("school", "name", options["school"])
+            )
+        if options["active"]:
+            today = timezone.localdate()
+            interns = interns.filter(
+                Q(start_date__isnull=True) | Q(start_date__lte=today),
+                Q(end_date__isnull=True) | Q(end_date__gte=today),
+            )
+
+        count = interns.count()
+        if count == 0:
+            raise CommandError("No interns match the given filters.")
+
+        self.stdout.write(f"Rendering {count} report(s) to {options['output']}...")
+        start_time = time.time()
+
+        with open(options["output"], "wb") as fileobj:
+            BulkReportService.write_zip(interns, fileobj, workers=options["workers"])
+
+        duration = time.time() - start_time
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Exported {count} report(s) in {duration:.1f} seconds"
+            )
+        )
+
+    @staticmethod
+    def _id_or_field(relation: str, field: str, value: str) -> Q:
+        """Match a related object by primary key or by a unique field."""
+        lookup = Q(**{f"{relation}__{field}": value})
+        if value.isdigit():
+            lookup |= Q(**{f"{relation}_id": int(value)})
+        return lookup
@@ -0,0 +1,53 @@
+"""
+HTML-to-PDF conversion helpers.
+
+This module deliberately imports nothing from Django so that it can be loaded
+in freshly spawned worker processes. Each process compiles the report
+stylesheet once and reuses it for every document it renders.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from weasyprint import CSS, HTML
+
+_stylesheet: Optional[CSS] = None
+_stylesheet_source: Optional[str] = None
+
+
+def get_stylesheet(css_string: str) -> CSS:
+    """Return the compiled stylesheet for this process, compiling on first use."""
+    global _stylesheet, _stylesheet_source
+    if _stylesheet is None or _stylesheet_source != css_string:
+        _stylesheet = CSS(string=css_string)
+        _stylesheet_source = css_string
+    return _stylesheet
+
+
+def init_worker(css_string: str) -> None:
+    """Process pool initializer: compile the stylesheet once per worker."""
+    get_stylesheet(css_string)
+
+
+def render_pdf_bytes(html_string: str, css_string: Optional[str] = None) -> bytes:
+    """
+    Convert report HTML into PDF bytes.
+
+    Args:
+        html_string: Rendered report HTML
+        css_string: Stylesheet source; may be omitted in pool workers that
+            were started with init_worker
+
+    Returns:
+        PDF document as bytes
+    """
+    stylesheet = get_stylesheet(css_string) if css_string else _stylesheet
+    stylesheets = [stylesheet] if stylesheet is not None else []
+    return HTML(string=html_string, base_url=".").write_pdf(stylesheets=stylesheets)
+
+
+def render_named_pdf(item: tuple[str, str]) -> tuple[str, bytes]:
+    """Render a ``(filename, html)`` pair in a pool worker."""
+    filename, html_string = item
+    return filename, render_pdf_bytes(html_string)
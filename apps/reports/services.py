@@ -4,19 +4,39 @@ Report generation service for PDF and other report types.
 
 from __future__ import annotations
 
+from collections import defaultdict
+from itertools import islice
 from io import BytesIO
-from datetime import datetime, timedelta
-from typing import Optional
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, Iterator, List, Optional
 
 from django.template.loader import render_to_string
 from django.http import HttpResponse
-from django.db.models import Avg, Count, Q
-from weasyprint import HTML, CSS
+from django.utils import timezone
+from django.db.models import (
+    Avg,
+    Count,
+    F,
+    Func,
+    IntegerField,
+    Q,
+    QuerySet,
+    Sum,
+    Window,
+)
+from django.db.models.functions import RowNumber
 
 from apps.interns.models import InternProfile
+from apps.reports import rendering
 from apps.attendance.models import Attendance
+from apps.attendance.rollups import AttendanceRollupService
+from apps.evaluations.analytics import ScoreAnalyticsService, ScoreTrend
 from apps.evaluations.models import PerformanceAssessment
 from apps.absenteeism.models import AbsenteeismRequest
+from apps.holidays.calendar import ExpectedAttendanceService
+
+# Related objects rendered by the performance report template
+REPORT_PROFILE_RELATIONS = ("user", "branch", "school", "internal_supervisor__user")
 
 
 class ReportService:
@@ -33,28 +53,54 @@ class ReportService:
         Returns:
             HttpResponse with PDF content
         """
-        # Gather all data for the report
-        report_data = ReportService._gather_intern_data(intern_profile)
-
-        # Render HTML template
-        html_string = render_to_string(
-            "reports/intern_performance_report.html", report_data
+        pdf_file = ReportService.render_pdf(
+            ReportService.render_intern_performance_html(intern_profile)
         )
 
-        # Generate PDF
-        html = HTML(string=html_string, base_url=".")
-        css = CSS(string=ReportService._get_pdf_styles())
-
-        # Create PDF
-        pdf_file = html.write_pdf(stylesheets=[css])
-
         # Create response
         response = HttpResponse(pdf_file, content_type="application/pdf")
-        filename = f"Performance_Report_{intern_profile.user.get_full_name().replace(' ', '_')}_{datetime.now().strftime('%Y%m%d')}.pdf"
+        filename = ReportService.intern_report_filename(intern_profile)
         response["Content-Disposition"] = f'attachment; filename="{filename}"'
 
         return response
 
+    @staticmethod
+    def render_intern_performance_html(intern_profile: InternProfile) -> str:
+        """
+        Render the HTML source of an intern performance report.
+
+        Args:
+            intern_profile: InternProfile instance
+
+        Returns:
+            HTML string ready to be passed to render_pdf
+        """
+        # Gather all data for the report
+        report_data = ReportService._gather_intern_data(intern_profile)
+
+        return render_to_string("reports/intern_performance_report.html", report_data)
+
+    @staticmethod
+    def render_pdf(html_string: str) -> bytes:
+        """
+        Convert report HTML into PDF bytes with the shared report styles.
+
+        This does no database access, so it is safe to run off the request
+        thread.
+
+        Args:
+            html_string: Rendered report HTML
+
+        Returns:
+            PDF document as bytes
+        """
+        return rendering.render_pdf_bytes(html_string, ReportService._get_pdf_styles())
+
+    @staticmethod
+    def intern_report_filename(intern_profile: InternProfile) -> str:
+        """Return the download filename for an intern performance report."""
+        return f"Performance_Report_{intern_profile.user.get_full_name().replace(' ', '_')}_{datetime.now().strftime('%Y%m%d')}.pdf"
+
     @staticmethod
     def _gather_intern_data(intern_profile: InternProfile) -> dict:
         """
@@ -66,71 +112,230 @@ class ReportService:
         Returns:
             Dictionary containing all report data
         """
-        # Basic intern info
-        user = intern_profile.user
-
-        # Attendance statistics
-        all_attendance = Attendance.objects.filter(intern=intern_profile)
-        total_attendance = all_attendance.count()
-        approved_attendance = all_attendance.filter(
-            approval_status=Attendance.ApprovalStatus.APPROVED
-        ).count()
-        rejected_attendance = all_attendance.filter(
-            approval_status=Attendance.ApprovalStatus.REJECTED
-        ).count()
-        pending_attendance = all_attendance.filter(
-            approval_status=Attendance.ApprovalStatus.PENDING
-        ).count()
-
-        # Calculate attendance rate
-        attendance_rate = (
-            (approved_attendance / total_attendance * 100)
-            if total_attendance > 0
-            else 0
+        return ReportService._gather_for_profiles([intern_profile])[intern_profile.id]
+
+    @staticmethod
+    def gather_intern_data_batch(intern_ids: Iterable[int]) -> Dict[int, dict]:
+        """
+        Gather report data for many interns using grouped queries.
+
+        Runs one query for the profiles and one grouped query per related
+        table, however many ids are passed.
+
+        Args:
+            intern_ids: InternProfile primary keys
+
+        Returns:
+            Dictionary mapping intern id to its report data
+        """
+        profiles = list(
+            InternProfile.objects.filter(id__in=list(intern_ids)).select_related(
+                *REPORT_PROFILE_RELATIONS
+            )
+        )
+        return ReportService._gather_for_profiles(profiles)
+
+    @staticmethod
+    def gather_bulk_intern_data(
+        interns: QuerySet, chunk_size: int = 500
+    ) -> Iterator[dict]:
+        """
+        Stream report data for every intern in a queryset.
+
+        Profiles are read from a database cursor and processed in chunks, so
+        only one chunk is held in memory at a time; each chunk costs the same
+        handful of grouped queries as gather_intern_data_batch.
+
+        Args:
+            interns: InternProfile queryset to report on
+            chunk_size: Number of interns gathered per batch
+
+        Yields:
+            Report data dictionaries, one per intern, in queryset order
+        """
+        profiles = interns.select_related(*REPORT_PROFILE_RELATIONS).iterator(
+            chunk_size=chunk_size
         )
 
-        # Assessment statistics
-        assessments = PerformanceAssessment.objects.filter(
-            intern=intern_profile
-        ).order_by("week_number")
-
-        total_assessments = assessments.count()
-        completed_assessments = assessments.filter(
-            status=PerformanceAssessment.Status.SUBMITTED
-        ).count()
-
-        # Calculate average scores (supervisor and intern scores)
-        avg_supervisor_score = (
-            assessments.filter(supervisor_score__isnull=False).aggregate(
-                Avg("supervisor_score")
-            )["supervisor_score__avg"]
-            or 0
+        while True:
+            chunk = list(islice(profiles, chunk_size))
+            if not chunk:
+                return
+            report_data = ReportService._gather_for_profiles(chunk)
+            for intern_profile in chunk:
+                yield report_data[intern_profile.id]
+
+    @staticmethod
+    def _gather_for_profiles(profiles: List[InternProfile]) -> Dict[int, dict]:
+        """
+        Compute report data for already loaded profiles in six queries.
+
+        Attendance, assessment and absence figures each come from a single
+        GROUP BY intern query (approved absence days are summed in SQL), the
+        five most recent submitted assessments per intern are selected with
+        a window function and monthly hours are read from the daily rollups.
+        Expected working days need one more query for approved absence
+        ranges; holidays come from the cached working calendar. Score trends
+        are cached and cost two more queries only when assessments changed.
+        """
+        if not profiles:
+            return {}
+
+        intern_ids = [intern_profile.id for intern_profile in profiles]
+
+        attendance_status = Attendance.ApprovalStatus
+        attendance_rows = (
+            Attendance.objects.filter(intern_id__in=intern_ids)
+            .order_by()
+            .values("intern_id")
+            .annotate(
+                total=Count("id"),
+                approved=Count(
+                    "id", filter=Q(approval_status=attendance_status.APPROVED)
+                ),
+                rejected=Count(
+                    "id", filter=Q(approval_status=attendance_status.REJECTED)
+                ),
+                pending=Count("id", filter=Q(approval_status=attendance_status.PENDING)),
+            )
         )
+        attendance = {row["intern_id"]: row for row in attendance_rows}
 
-        avg_intern_score = (
-            assessments.filter(intern_score__isnull=False).aggregate(
-                Avg("intern_score")
-            )["intern_score__avg"]
-            or 0
+        assessment_rows = (
+            PerformanceAssessment.objects.filter(intern_id__in=intern_ids)
+            .order_by()
+            .values("intern_id")
+            .annotate(
+                total=Count("id"),
+                completed=Count(
+                    "id", filter=Q(status=PerformanceAssessment.Status.SUBMITTED)
+                ),
+                avg_supervisor=Avg("supervisor_score"),
+                avg_intern=Avg("intern_score"),
+            )
         )
+        assessment = {row["intern_id"]: row for row in assessment_rows}
 
-        # Absence statistics
-        absences = AbsenteeismRequest.objects.filter(intern=intern_profile)
-        total_absences = absences.count()
-        approved_absences = absences.filter(
-            status=AbsenteeismRequest.Status.APPROVED
-        ).count()
-        rejected_absences = absences.filter(
-            status=AbsenteeismRequest.Status.REJECTED
-        ).count()
-        pending_absences = absences.filter(
-            status=AbsenteeismRequest.Status.PENDING
-        ).count()
-
-        # Calculate total days absent
-        approved_absence_days = sum(
-            (absence.end_date - absence.start_date).days + 1
-            for absence in absences.filter(status=AbsenteeismRequest.Status.APPROVED)
+        absence_status = AbsenteeismRequest.Status
+        approved_absence = Q(status=absence_status.APPROVED)
+        absence_rows = (
+            AbsenteeismRequest.objects.filter(intern_id__in=intern_ids)
+            .order_by()
+            .values("intern_id")
+            .annotate(
+                total=Count("id"),
+                approved=Count("id", filter=approved_absence),
+                rejected=Count("id", filter=Q(status=absence_status.REJECTED)),
+                pending=Count("id", filter=Q(status=absence_status.PENDING)),
+                # Inclusive days per request; date - date is an integer in
+                # PostgreSQL, so single-day requests count as one
+                approved_days=Sum(
+                    Func(
+                        F("end_date"),
+                        F("start_date"),
+                        arg_joiner=" - ",
+                        template="(%(expressions)s + 1)",
+                        output_field=IntegerField(),
+                    ),
+                    filter=approved_absence,
+                ),
+            )
+        )
+        absence = {row["intern_id"]: row for row in absence_rows}
+
+        recent_assessments = defaultdict(list)
+        for recent in (
+            PerformanceAssessment.objects.filter(
+                intern_id__in=intern_ids,
+                status=PerformanceAssessment.Status.SUBMITTED,
+            )
+            .annotate(
+                recent_rank=Window(
+                    expression=RowNumber(),
+                    partition_by=F("intern_id"),
+                    order_by=F("assessment_date").desc(),
+                )
+            )
+            .filter(recent_rank__lte=5)
+            .order_by("intern_id", "recent_rank")
+        ):
+            recent_assessments[recent.intern_id].append(recent)
+
+        start_dates = [
+            intern_profile.start_date
+            for intern_profile in profiles
+            if intern_profile.start_date
+        ]
+        monthly_hours = AttendanceRollupService.monthly_hours(
+            intern_ids,
+            start=min(start_dates, default=date.min),
+            end=timezone.localdate(),
+        )
+
+        expected_days = ExpectedAttendanceService.expected_days(profiles)
+
+        score_trends = ScoreAnalyticsService.trends(profiles)
+
+        report_data = {}
+        for intern_profile in profiles:
+            att = attendance.get(intern_profile.id, {})
+            ass = assessment.get(intern_profile.id, {})
+            abs_ = absence.get(intern_profile.id, {})
+
+            report_data[intern_profile.id] = ReportService._build_report_data(
+                intern_profile,
+                total_attendance=att.get("total", 0),
+                approved_attendance=att.get("approved", 0),
+                rejected_attendance=att.get("rejected", 0),
+                pending_attendance=att.get("pending", 0),
+                expected_days=expected_days[intern_profile.id],
+                monthly_hours=monthly_hours.get(intern_profile.id, []),
+                total_assessments=ass.get("total", 0),
+                completed_assessments=ass.get("completed", 0),
+                recent_assessments=recent_assessments[intern_profile.id],
+                avg_supervisor_score=ass.get("avg_supervisor") or 0,
+                avg_intern_score=ass.get("avg_intern") or 0,
+                score_trend=score_trends[intern_profile.id],
+                total_absences=abs_.get("total", 0),
+                approved_absences=abs_.get("approved", 0),
+                rejected_absences=abs_.get("rejected", 0),
+                pending_absences=abs_.get("pending", 0),
+                approved_absence_days=abs_.get("approved_days") or 0,
+            )
+
+        return report_data
+
+    @staticmethod
+    def _build_report_data(
+        intern_profile: InternProfile,
+        *,
+        total_attendance: int,
+        approved_attendance: int,
+        rejected_attendance: int,
+        pending_attendance: int,
+        expected_days: int,
+        monthly_hours,
+        total_assessments: int,
+        completed_assessments: int,
+        recent_assessments,
+        avg_supervisor_score: float,
+        avg_intern_score: float,
+        score_trend: ScoreTrend,
+        total_absences: int,
+        approved_absences: int,
+        rejected_absences: int,
+        pending_absences: int,
+        approved_absence_days: int,
+    ) -> dict:
+        """
+        Assemble the report template context from precomputed statistics.
+
+        Returns:
+            Dictionary containing all report data
+        """
+        # Approved check-ins against expected working days
+        attendance_rate = ExpectedAttendanceService.attendance_rate(
+            approved_attendance, expected_days
         )
 
         # Internship duration
@@ -138,14 +343,9 @@ class ReportService:
         end_date = intern_profile.end_date or datetime.now().date()
         duration_days = (end_date - start_date).days if start_date else 0
 
-        # Recent assessments (last 5)
-        recent_assessments = assessments.filter(
-            status=PerformanceAssessment.Status.SUBMITTED
-        ).order_by("-assessment_date")[:5]
-
         return {
             "intern": intern_profile,
-            "user": user,
+            "user": intern_profile.user,
             "report_date": datetime.now(),
             "start_date": start_date,
             "end_date": end_date,
@@ -155,7 +355,10 @@ class ReportService:
             "approved_attendance": approved_attendance,
             "rejected_attendance": rejected_attendance,
             "pending_attendance": pending_attendance,
+            "expected_days": expected_days,
             "attendance_rate": round(attendance_rate, 1),
+            "monthly_hours": monthly_hours,
+            "total_hours": round(sum(month.hours for month in monthly_hours), 1),
             # Assessments
             "total_assessments": total_assessments,
             "completed_assessments": completed_assessments,
@@ -163,6 +366,7 @@ class ReportService:
             # Average scores
             "avg_supervisor_score": round(avg_supervisor_score, 1),
             "avg_intern_score": round(avg_intern_score, 1),
+            "score_trend": score_trend,
             # Absences
             "total_absences": total_absences,
             "approved_absences": approved_absences,
@@ -1,3 +1,435 @@
-from django.test import TestCase
+"""
+Tests for report generation and the background rendering queue.
+"""
 
-# Create your tests here.
+import io
+import os
+import shutil
+import tempfile
+import zipfile
+from concurrent.futures import Future
+from datetime import date, timedelta
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.accounts.models import User
+from apps.absenteeism.models import AbsenteeismRequest
+from apps.attendance.models import Attendance
+from apps.branches.models import Branch
+from apps.evaluations.models import PerformanceAssessment
+from apps.holidays.calendar import get_working_calendar
+from apps.interns.models import InternProfile
+from apps.reports.bulk import BulkReportService
+from apps.reports.jobs import ReportJob, ReportJobService
+from apps.reports.services import ReportService
+
+
+class ImmediateExecutor:
+    """Executor stand-in that runs submitted work synchronously"""
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as exc:
+            future.set_exception(exc)
+        return future
+
+
+class ReportJobTestMixin:
+    """Create an intern and point the report cache at a temp directory"""
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cache_dir, ignore_errors=True)
+        settings_override = override_settings(REPORT_CACHE_DIR=self.cache_dir)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.branch = Branch.objects.create(name="Main", code="MAIN")
+        self.user = User.objects.create_user(
+            username="intern",
+            email="intern@example.com",
+            password="testpass123",
+            first_name="Ada",
+            last_name="Intern",
+            role=User.Roles.INTERN,
+            is_onboarded=True,
+        )
+        self.intern = InternProfile.objects.create(
+            user=self.user,
+            branch=self.branch,
+            start_date=date.today() - timedelta(days=30),
+            end_date=date.today() + timedelta(days=60),
+        )
+
+
+@patch("apps.reports.services.ReportService.render_pdf", return_value=b"%PDF-test")
+class ReportJobServiceTest(ReportJobTestMixin, TestCase):
+    """Test queueing and caching of rendered reports"""
+
+    def test_first_request_queues_render(self, mock_render):
+        """A cache miss starts a background render"""
+        job = ReportJobService.get_intern_report(self.intern)
+
+        self.assertEqual(job.status, ReportJob.Status.RENDERING)
+        self.assertIsNotNone(job.future)
+        self.assertEqual(job.future.result(timeout=10).read_bytes(), b"%PDF-test")
+
+    def test_cached_report_is_reused(self, mock_render):
+        """Unchanged data is served from disk without rendering again"""
+        ReportJobService.get_intern_report(self.intern).future.result(timeout=10)
+
+        job = ReportJobService.get_intern_report(self.intern)
+
+        self.assertTrue(job.is_ready)
+        self.assertIsNone(job.future)
+        self.assertEqual(mock_render.call_count, 1)
+
+    def test_concurrent_request_does_not_duplicate_render(self, mock_render):
+        """A second request while rendering does not queue another job"""
+        pending = ReportJobService.cache_dir(self.intern.id)
+        pending.mkdir(parents=True)
+        fingerprint = ReportJobService.intern_data_fingerprint(self.intern)
+        (pending / f"{fingerprint}.pending").touch()
+
+        job = ReportJobService.get_intern_report(self.intern)
+
+        self.assertEqual(job.status, ReportJob.Status.RENDERING)
+        self.assertIsNone(job.future)
+
+    def test_fingerprint_changes_with_data(self, mock_render):
+        """New attendance invalidates the cached report"""
+        before = ReportJobService.intern_data_fingerprint(self.intern)
+        Attendance.objects.create(
+            intern=self.intern, branch=self.branch, latitude=0, longitude=0
+        )
+        after = ReportJobService.intern_data_fingerprint(self.intern)
+
+        self.assertNotEqual(before, after)
+
+    @override_settings(REPORT_RENDER_TIMEOUT_SECONDS=60)
+    def test_stale_pending_marker_expires(self, mock_render):
+        """A marker left by a crashed render stops reporting 'rendering'"""
+        directory = ReportJobService.cache_dir(self.intern.id)
+        directory.mkdir(parents=True)
+        fingerprint = ReportJobService.intern_data_fingerprint(self.intern)
+        marker = directory / f"{fingerprint}.pending"
+        marker.touch()
+        self.assertEqual(
+            ReportJobService.job_status(self.intern.id, fingerprint),
+            ReportJob.Status.RENDERING,
+        )
+
+        old = marker.stat().st_mtime - 120
+        os.utime(marker, (old, old))
+        self.assertEqual(
+            ReportJobService.job_status(self.intern.id, fingerprint),
+            ReportJob.Status.EXPIRED,
+        )
+
+        # The next download takes the render over
+        job = ReportJobService.get_intern_report(self.intern)
+        self.assertTrue(job.future.result(timeout=10).exists())
+
+    @override_settings(REPORT_RENDER_TIMEOUT_SECONDS=60)
+    def test_prune_removes_dead_markers(self, mock_render):
+        """Stale markers of other fingerprints are deleted after a render"""
+        directory = ReportJobService.cache_dir(self.intern.id)
+        directory.mkdir(parents=True)
+        dead = directory / f"{'0' * 32}.pending"
+        live = directory / f"{'1' * 32}.pending"
+        dead.touch()
+        live.touch()
+        old = dead.stat().st_mtime - 120
+        os.utime(dead, (old, old))
+
+        ReportJobService.get_intern_report(self.intern).future.result(timeout=10)
+
+        self.assertFalse(dead.exists())
+        self.assertTrue(live.exists())
+
+    def test_failed_render_is_reported(self, mock_render):
+        """Render errors surface as a failed job"""
+        mock_render.side_effect = RuntimeError("boom")
+        job = ReportJobService.get_intern_report(self.intern)
+        with self.assertRaises(RuntimeError):
+            job.future.result(timeout=10)
+
+        self.assertTrue(ReportJobService.get_intern_report(self.intern).is_failed)
+
+
+@patch("apps.reports.jobs._get_executor", return_value=ImmediateExecutor())
+@patch("apps.reports.services.ReportService.render_pdf", return_value=b"%PDF-test")
+class DownloadInternReportViewTest(ReportJobTestMixin, TestCase):
+    """Test the download view serves cached files or a status page"""
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_login(self.user)
+        self.url = reverse("reports:download_intern_report", args=[self.intern.id])
+
+    def test_rendering_page_then_download(self, mock_render, mock_executor):
+        """First request shows the rendering page, later ones get the PDF"""
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 202)
+        self.assertTemplateUsed(response, "reports/report_rendering.html")
+
+        status_url = response.context["status_url"]
+        # Polling only loads session, user and profile, then reads the
+        # job's files: no fingerprint queries and no new render
+        with self.assertNumQueries(3):
+            status = self.client.get(status_url)
+        self.assertEqual(status.json()["status"], ReportJob.Status.READY)
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/pdf")
+        self.assertEqual(b"".join(response.streaming_content), b"%PDF-test")
+        self.assertEqual(mock_render.call_count, 1)
+
+    def test_status_rejects_unknown_job(self, mock_render, mock_executor):
+        """The poll only accepts fingerprints, never arbitrary paths"""
+        url = reverse("reports:intern_report_status", args=[self.intern.id])
+
+        response = self.client.get(url, {"job": "../../etc/passwd"})
+
+        self.assertEqual(response.status_code, 400)
+        mock_render.assert_not_called()
+
+    def test_other_intern_cannot_download(self, mock_render, mock_executor):
+        """Interns cannot fetch someone else's report"""
+        other = User.objects.create_user(
+            username="other",
+            email="other@example.com",
+            password="testpass123",
+            role=User.Roles.INTERN,
+        )
+        self.client.force_login(other)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 302)
+        mock_render.assert_not_called()
+
+
+class BulkReportExportTest(TestCase):
+    """Test bulk report data gathering and ZIP export"""
+
+    def setUp(self):
+        self.branch = Branch.objects.create(name="Main", code="MAIN")
+        self.other_branch = Branch.objects.create(name="Other", code="OTH")
+
+    def _create_interns(self, count, branch=None):
+        interns = []
+        start = InternProfile.objects.count()
+        for i in range(start, start + count):
+            user = User.objects.create_user(
+                username=f"intern{i}",
+                email=f"intern{i}@example.com",
+                password="testpass123",
+                first_name="Intern",
+                last_name=str(i),
+            )
+            intern = InternProfile.objects.create(
+                user=user,
+                branch=branch or self.branch,
+                start_date=date.today() - timedelta(days=10),
+            )
+            Attendance.objects.create(
+                intern=intern,
+                branch=intern.branch,
+                latitude=0,
+                longitude=0,
+                approval_status="approved",
+                check_in_time=timezone.now() - timedelta(hours=3),
+                check_out_time=timezone.now() - timedelta(hours=1),
+            )
+            PerformanceAssessment.objects.create(
+                intern=intern, week_number=1, status="submitted", supervisor_score=80
+            )
+            AbsenteeismRequest.objects.create(
+                intern=intern,
+                reason="Sick",
+                start_date=date.today(),
+                end_date=date.today() + timedelta(days=1),
+                status="approved",
+            )
+            interns.append(intern)
+        return interns
+
+    def test_bulk_data_matches_single_report(self):
+        """Bulk gathering produces the same figures as the per-intern path"""
+        (intern,) = self._create_interns(1)
+
+        single = ReportService._gather_intern_data(intern)
+        (bulk,) = ReportService.gather_bulk_intern_data(
+            InternProfile.objects.filter(id=intern.id)
+        )
+
+        for key in [
+            "total_attendance",
+            "approved_attendance",
+            "attendance_rate",
+            "total_assessments",
+            "completed_assessments",
+            "avg_supervisor_score",
+            "approved_absences",
+            "approved_absence_days",
+        ]:
+            self.assertEqual(single[key], bulk[key], key)
+
+    def test_batch_data_computes_figures_per_intern(self):
+        """Grouped queries keep each intern's figures separate"""
+        first, second = self._create_interns(2)
+        for week in range(2, 8):
+            PerformanceAssessment.objects.create(
+                intern=first,
+                week_number=week,
+                assessment_date=date.today() - timedelta(weeks=week),
+                status="submitted",
+                supervisor_score=60,
+            )
+
+        get_working_calendar()  # holidays are loaded once per process
+        # Seven grouped queries plus score trends and cohort percentiles,
+        # which are recomputed because assessments were just saved
+        with self.assertNumQueries(9):
+            data = ReportService.gather_intern_data_batch([first.id, second.id])
+
+        self.assertEqual(data[first.id]["total_assessments"], 7)
+        self.assertEqual(len(data[first.id]["assessments"]), 5)
+        self.assertEqual(data[first.id]["assessments"][0].week_number, 1)
+        self.assertEqual(data[second.id]["total_assessments"], 1)
+        self.assertEqual(data[second.id]["approved_absence_days"], 2)
+        self.assertEqual(
+            data[second.id]["attendance_rate"],
+            round(100 / data[second.id]["expected_days"], 1),
+        )
+        self.assertEqual(data[second.id]["total_hours"], 2.0)
+
+    def test_single_day_absence_counts_one_day(self):
+        """A one-day approved request is one absence day, not zero"""
+        intern = InternProfile.objects.create(
+            user=User.objects.create_user(
+                username="single_day", email="single_day@example.com"
+            ),
+            branch=self.branch,
+            start_date=date.today() - timedelta(days=10),
+        )
+        AbsenteeismRequest.objects.create(
+            intern=intern,
+            reason="Appointment",
+            start_date=date.today(),
+            end_date=date.today(),
+            status="approved",
+        )
+
+        data = ReportService.gather_intern_data_batch([intern.id])
+
+        self.assertEqual(data[intern.id]["approved_absences"], 1)
+        self.assertEqual(data[intern.id]["approved_absence_days"], 1)
+
+    def test_bulk_data_uses_fixed_queries(self):
+        """The number of queries does not grow with the number of interns"""
+        self._create_interns(2)
+        with CaptureQueriesContext(connection) as small:
+            list(ReportService.gather_bulk_intern_data(InternProfile.objects.all()))
+
+        self._create_interns(8)
+        with CaptureQueriesContext(connection) as large:
+            list(ReportService.gather_bulk_intern_data(InternProfile.objects.all()))
+
+        self.assertEqual(len(small), len(large))
+
+    def test_bulk_data_streams_in_chunks(self):
+        """Chunk boundaries keep every intern once, in queryset order"""
+        interns = self._create_interns(3)
+
+        data = list(
+            ReportService.gather_bulk_intern_data(
+                InternProfile.objects.order_by("id"), chunk_size=2
+            )
+        )
+
+        self.assertEqual(
+            [item["intern"].id for item in data], [intern.id for intern in interns]
+        )
+
+    @override_settings(REPORT_EXPORT_WORKERS=8, REPORT_REQUEST_EXPORT_WORKERS=2)
+    def test_admin_export_uses_small_pool(self):
+        """Downloads from the admin do not start a CPU-sized pool"""
+        self._create_interns(1)
+        admin_user = User.objects.create_superuser(
+            username="admin", email="admin@example.com", password="testpass123"
+        )
+        self.client.force_login(admin_user)
+
+        with patch.object(
+            BulkReportService, "iter_zip", return_value=iter([b"zip"])
+        ) as mock_zip:
+            response = self.client.post(
+                reverse("admin:interns_internprofile_changelist"),
+                {
+                    "action": "export_performance_reports",
+                    "_selected_action": InternProfile.objects.values_list(
+                        "id", flat=True
+                    ),
+                },
+            )
+
+        self.assertEqual(b"".join(response.streaming_content), b"zip")
+        self.assertEqual(mock_zip.call_args.kwargs["workers"], 2)
+
+    @patch("apps.reports.rendering.render_pdf_bytes", return_value=b"%PDF-test")
+    def test_zip_contains_one_pdf_per_intern(self, mock_render):
+        """The archive holds a report for each intern in the queryset"""
+        interns = self._create_interns(3)
+
+        archive = io.BytesIO(
+            b"".join(BulkReportService.iter_zip(InternProfile.objects.all(), workers=1))
+        )
+
+        with zipfile.ZipFile(archive) as zf:
+            names = zf.namelist()
+            self.assertEqual(len(names), 3)
+            for intern in interns:
+                self.assertTrue(any(name.endswith(f"_{intern.id}.pdf") for name in names))
+            self.assertEqual(zf.read(names[0]), b"%PDF-test")
+
+    def test_process_pool_export(self):
+        """Rendering across worker processes yields valid PDFs"""
+        self._create_interns(2)
+
+        pdfs = list(
+            BulkReportService.iter_rendered_pdfs(InternProfile.objects.all(), workers=2)
+        )
+
+        self.assertEqual(len(pdfs), 2)
+        for _, pdf_bytes in pdfs:
+            self.assertTrue(pdf_bytes.startswith(b"%PDF"))
+
+    @patch("apps.reports.rendering.render_pdf_bytes", return_value=b"%PDF-test")
+    def test_management_command_filters_by_branch(self, mock_render):
+        """The export command only includes interns of the chosen branch"""
+        self._create_interns(2)
+        self._create_interns(1, branch=self.other_branch)
+        output = os.path.join(tempfile.mkdtemp(), "reports.zip")
+        self.addCleanup(shutil.rmtree, os.path.dirname(output), ignore_errors=True)
+
+        call_command(
+            "export_intern_reports",
+            output=output,
+            branch="OTH",
+            workers=1,
+            stdout=io.StringIO(),
+        )
+
+        with zipfile.ZipFile(output) as zf:
+            self.assertEqual(len(zf.namelist()), 1)
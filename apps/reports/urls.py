@@ -10,4 +10,9 @@ urlpatterns = [
         views.download_intern_report,
         name="download_intern_report",
     ),
+    path(
+        "intern/<int:intern_id>/status/",
+        views.intern_report_status,
+        name="intern_report_status",
+    ),
 ]
@@ -1,49 +1,93 @@
 from __future__ import annotations
 
 from django.contrib.auth.decorators import login_required
-from django.shortcuts import get_object_or_404, redirect
+from django.http import FileResponse, JsonResponse
+from django.shortcuts import get_object_or_404, redirect, render
 from django.contrib import messages
+from django.urls import reverse
 
 from apps.interns.models import InternProfile
+from apps.accounts.access import can_view_intern_report
 from apps.accounts.decorators import supervisor_or_above
+from apps.reports.jobs import FINGERPRINT_RE, ReportJobService
 from apps.reports.services import ReportService
 
 
+def _report_permission_error(user, intern_profile) -> str | None:
+    """Return an error message if the user may not download this report."""
+    if can_view_intern_report(user, intern_profile):
+        return None
+    if user.role == "intern":
+        return "You can only download your own report."
+    return "You can only download reports for your assigned interns."
+
+
 @login_required
 def download_intern_report(request, intern_id):
     """
     Download PDF performance report for an intern.
 
-    Permissions:
-    - Intern can download their own report
-    - Supervisors can download reports for their assigned interns
-    - Managers and admins can download any report
+    Serves the cached PDF when the report data has not changed since it was
+    last rendered; otherwise queues a background render and returns a status
+    page that polls until the file is ready.
+    """
+    intern_profile = get_object_or_404(
+        InternProfile.objects.select_related("user"), id=intern_id
+    )
+
+    error = _report_permission_error(request.user, intern_profile)
+    if error:
+        messages.error(request, error)
+        return redirect("accounts:dashboard")
+
+    job = ReportJobService.get_intern_report(intern_profile)
+
+    if job.is_ready:
+        return FileResponse(
+            job.path.open("rb"),
+            as_attachment=True,
+            filename=ReportService.intern_report_filename(intern_profile),
+            content_type="application/pdf",
+        )
+
+    if job.is_failed:
+        ReportJobService.retry(job)
+        messages.error(
+            request,
+            "The report could not be generated. Please try again in a moment.",
+        )
+        return redirect("accounts:dashboard")
+
+    context = {
+        "intern_profile": intern_profile,
+        "download_url": reverse("reports:download_intern_report", args=[intern_id]),
+        "status_url": (
+            reverse("reports:intern_report_status", args=[intern_id])
+            + f"?job={job.fingerprint}"
+        ),
+    }
+    return render(request, "reports/report_rendering.html", context, status=202)
+
+
+@login_required
+def intern_report_status(request, intern_id):
+    """
+    API endpoint polled by the rendering page (for AJAX).
+
+    Read-only: it only looks at the files of the render named by ``job``,
+    so polling never recomputes the fingerprint or queues another render.
     """
-    intern_profile = get_object_or_404(InternProfile, id=intern_id)
-
-    # Permission check
-    if request.user.role == "intern":
-        # Interns can only download their own report
-        if intern_profile.user != request.user:
-            messages.error(request, "You can only download your own report.")
-            return redirect("dashboards:intern_dashboard")
-    elif request.user.role == "supervisor":
-        # Supervisors can only download reports for their assigned interns
-        from apps.supervisors.models import EmployeeProfile
-
-        try:
-            employee_profile = EmployeeProfile.objects.get(user=request.user)
-            if intern_profile not in employee_profile.assigned_interns.all():
-                messages.error(
-                    request, "You can only download reports for your assigned interns."
-                )
-                return redirect("dashboards:supervisor_dashboard")
-        except EmployeeProfile.DoesNotExist:
-            messages.error(
-                request, "You do not have permission to download this report."
-            )
-            return redirect("dashboards:supervisor_dashboard")
-    # Managers and admins can download any report
-
-    # Generate and return PDF
-    return ReportService.generate_intern_performance_pdf(intern_profile)
+    intern_profile = get_object_or_404(
+        InternProfile.objects.select_related("user"), id=intern_id
+    )
+
+    error = _report_permission_error(request.user, intern_profile)
+    if error:
+        return JsonResponse({"error": error}, status=403)
+
+    fingerprint = request.GET.get("job", "")
+    if not FINGERPRINT_RE.fullmatch(fingerprint):
+        return JsonResponse({"error": "Unknown report job."}, status=400)
+
+    status = ReportJobService.job_status(intern_profile.id, fingerprint)
+    return JsonResponse({"status": status})
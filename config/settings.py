@@ -122,6 +122,21 @@ MEDIA_ROOT = BASE_DIR / "media"
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+CACHES = {
+    "default": {
+        "BACKEND": os.environ.get(
+            "DJANGO_CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": os.environ.get("DJANGO_CACHE_LOCATION", ""),
+    }
+}
+NOTIFICATION_CACHE_TIMEOUT = int(os.environ.get("NOTIFICATION_CACHE_TIMEOUT", "300"))
+ASSESSMENT_ANALYTICS_CACHE_TIMEOUT = int(
+    os.environ.get("ASSESSMENT_ANALYTICS_CACHE_TIMEOUT", "3600")
+)
+# Scored weeks averaged by the rolling mean in assessment score trends
+ASSESSMENT_TREND_WEEKS = int(os.environ.get("ASSESSMENT_TREND_WEEKS", "4"))
+
 EMAIL_BACKEND = os.environ.get(
     "DJANGO_EMAIL_BACKEND",
     (
@@ -141,12 +156,51 @@ DEFAULT_FROM_EMAIL = os.environ.get(
 )
 SERVER_EMAIL = os.environ.get("DJANGO_SERVER_EMAIL", DEFAULT_FROM_EMAIL)
 
+# Outbound email queue drained by `manage.py process_email_outbox`
+EMAIL_OUTBOX_BATCH_SIZE = int(os.environ.get("EMAIL_OUTBOX_BATCH_SIZE", "50"))
+EMAIL_OUTBOX_MAX_ATTEMPTS = int(os.environ.get("EMAIL_OUTBOX_MAX_ATTEMPTS", "5"))
+EMAIL_OUTBOX_RETRY_BASE_SECONDS = int(
+    os.environ.get("EMAIL_OUTBOX_RETRY_BASE_SECONDS", "60")
+)
+EMAIL_OUTBOX_SENDING_TIMEOUT = int(os.environ.get("EMAIL_OUTBOX_SENDING_TIMEOUT", "600"))
+
 ONBOARDING_LINK_TTL_HOURS = int(os.environ.get("ONBOARDING_LINK_TTL_HOURS", "24"))
 DEFAULT_ASSESSMENT_FREQUENCY = os.environ.get("DEFAULT_ASSESSMENT_FREQUENCY", "weekly")
 DEFAULT_PROXIMITY_THRESHOLD_METERS = int(
     os.environ.get("DEFAULT_PROXIMITY_THRESHOLD_METERS", "150")
 )
 
+ATTENDANCE_LIST_PAGE_SIZE = int(os.environ.get("ATTENDANCE_LIST_PAGE_SIZE", "50"))
+INTERN_LIST_PAGE_SIZE = int(os.environ.get("INTERN_LIST_PAGE_SIZE", "20"))
+# Check-ins up to start time plus grace count as on time in the daily rollups
+ATTENDANCE_START_TIME = os.environ.get("ATTENDANCE_START_TIME", "09:00")
+ATTENDANCE_GRACE_MINUTES = int(os.environ.get("ATTENDANCE_GRACE_MINUTES", "15"))
+# Oldest queued check-in/check-out the batch sync endpoint accepts
+ATTENDANCE_SYNC_MAX_AGE_DAYS = int(os.environ.get("ATTENDANCE_SYNC_MAX_AGE_DAYS", "7"))
+# Working weekdays for expected attendance (0 = Monday)
+WORKING_WEEKDAYS = tuple(
+    int(day) for day in os.environ.get("WORKING_WEEKDAYS", "0,1,2,3,4").split(",")
+)
+# How often each process checks the database for holiday changes
+WORKING_CALENDAR_CHECK_SECONDS = int(
+    os.environ.get("WORKING_CALENDAR_CHECK_SECONDS", "30")
+)
+
+# Size of the grid cells (in degrees) used to index branch geofences
+GEOFENCE_GRID_CELL_DEGREES = float(os.environ.get("GEOFENCE_GRID_CELL_DEGREES", "0.01"))
+# How often each process checks the database for branch and site changes
+GEOFENCE_INDEX_CHECK_SECONDS = int(os.environ.get("GEOFENCE_INDEX_CHECK_SECONDS", "30"))
+
+REPORT_CACHE_DIR = Path(
+    os.environ.get("REPORT_CACHE_DIR") or BASE_DIR / "runtime" / "reports"
+)
+REPORT_RENDER_WORKERS = int(os.environ.get("REPORT_RENDER_WORKERS", "2"))
+REPORT_EXPORT_WORKERS = int(os.environ.get("REPORT_EXPORT_WORKERS", "0")) or None
+# Process pool size for report ZIPs downloaded from the admin
+REPORT_REQUEST_EXPORT_WORKERS = int(
+    os.environ.get("REPORT_REQUEST_EXPORT_WORKERS", "2")
+)
+
 
 def _resolve_log_dir() -> Path:
     """Return a writable directory for log files, trying several fallbacks."""
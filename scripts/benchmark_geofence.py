@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+"""
+Benchmark geofence evaluation: scalar haversine vs the NumPy batch engine.
+
+The scalar path mirrors Attendance.auto_validate: Decimal coordinates are
+converted to float and passed to haversine_distance_meters one check-in at a
+time. The batch path evaluates all check-ins in one call. Both paths run on
+the same synthetic check-ins scattered around a few branches and must agree.
+
+Usage:
+    python scripts/benchmark_geofence.py [--rows 100000] [--branches 20]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from decimal import Decimal
+
+import django
+
+# Add the project directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Setup Django
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+django.setup()
+
+import numpy as np
+
+from apps.attendance.geofence import within_geofence
+from apps.attendance.models import haversine_distance_meters
+
+
+def make_data(rows, branches):
+    rng = random.Random(42)
+    branch_points = [
+        (
+            Decimal(f"{rng.uniform(4.5, 11.0):.9f}"),
+            Decimal(f"{rng.uniform(-3.0, 1.0):.9f}"),
+            rng.choice([100, 150, 300]),
+        )
+        for _ in range(branches)
+    ]
+    check_ins = []
+    for _ in range(rows):
+        branch = rng.randrange(branches)
+        lat, lon, _ = branch_points[branch]
+        # Roughly within +-500m of the branch
+        check_ins.append(
+            (
+                Decimal(f"{float(lat) + rng.uniform(-0.0045, 0.0045):.7f}"),
+                Decimal(f"{float(lon) + rng.uniform(-0.0045, 0.0045):.7f}"),
+                branch,
+            )
+        )
+    return branch_points, check_ins
+
+
+def scalar(branch_points, check_ins):
+    inside = []
+    for lat, lon, branch in check_ins:
+        branch_lat, branch_lon, threshold = branch_points[branch]
+        distance = haversine_distance_meters(
+            float(lat), float(lon), float(branch_lat), float(branch_lon)
+        )
+        inside.append(distance <= threshold)
+    return np.array(inside)
+
+
+def batched(branch_points, check_ins):
+    branch_lat = np.array([float(b[0]) for b in branch_points])
+    branch_lon = np.array([float(b[1]) for b in branch_points])
+    branch_threshold = np.array([b[2] for b in branch_points], dtype=float)
+
+    lat = np.fromiter((float(c[0]) for c in check_ins), dtype=float)
+    lon = np.fromiter((float(c[1]) for c in check_ins), dtype=float)
+    position = np.fromiter((c[2] for c in check_ins), dtype=np.intp)
+    return within_geofence(
+        lat,
+        lon,
+        branch_lat[position],
+        branch_lon[position],
+        branch_threshold[position],
+    )
+
+
+def measure(label, func, *args):
+    started = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - started
+    print(f"  {label:<8} {elapsed * 1000:>10.1f} ms")
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--branches", type=int, default=20)
+    options = parser.parse_args()
+
+    branch_points, check_ins = make_data(options.rows, options.branches)
+    print(f"{options.rows} check-ins across {options.branches} branches")
+    expected = measure("scalar", scalar, branch_points, check_ins)
+    actual = measure("batched", batched, branch_points, check_ins)
+    print(f"  {int(actual.sum())} inside geofence, results match: "
+          f"{bool((expected == actual).all())}")
@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+"""
+Benchmark the intern list statistics as internship history grows.
+
+Times one page of the intern list for 200 synthetic interns with 4, 12 and 26
+weeks of history, comparing the old joined ``Count``/``Avg`` annotations with
+the correlated subqueries of ``annotate_intern_stats``. The joined query
+aggregates assessments x attendances rows per intern, so it slows down as
+history grows (and its counts are wrong); the subquery version stays flat.
+All data is created inside a transaction that is rolled back, so the script is
+safe to run against a development database.
+
+Usage:
+    python scripts/benchmark_intern_list.py [--interns 200] [--weeks 4 12 26]
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+import django
+
+# Add the project directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Setup Django
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+django.setup()
+
+from django.db import transaction
+from django.db.models import Avg, Count, Q
+from django.utils import timezone
+
+from apps.accounts.models import User
+from apps.attendance.models import Attendance
+from apps.branches.models import Branch
+from apps.evaluations.models import PerformanceAssessment
+from apps.interns.models import InternProfile
+from apps.interns.stats import annotate_intern_stats
+
+PAGE_SIZE = 20
+REPEATS = 5
+
+
+class Rollback(Exception):
+    """Raised to discard the benchmark data"""
+
+
+def seed_interns(count, weeks):
+    """Create interns with ``weeks`` of weekday check-ins and weekly assessments"""
+    branch, _ = Branch.objects.get_or_create(
+        code="BENCH", defaults={"name": "Benchmark Branch"}
+    )
+    first_day = timezone.localdate() - timedelta(weeks=weeks)
+
+    users = User.objects.bulk_create(
+        User(
+            username=f"bench_intern_{i}",
+            email=f"bench_intern_{i}@example.com",
+            first_name="Bench",
+            last_name=str(i),
+            role=User.Roles.INTERN,
+        )
+        for i in range(count)
+    )
+    interns = InternProfile.objects.bulk_create(
+        InternProfile(user=user, branch=branch, start_date=first_day) for user in users
+    )
+
+    days = [
+        first_day + timedelta(days=offset)
+        for offset in range(weeks * 7)
+        if (first_day + timedelta(days=offset)).weekday() < 5
+    ]
+    statuses = ["approved", "approved", "approved", "pending", "rejected"]
+    Attendance.objects.bulk_create(
+        (
+            Attendance(
+                intern=intern,
+                branch=branch,
+                latitude=0,
+                longitude=0,
+                check_in_time=timezone.make_aware(
+                    datetime.combine(day, datetime.min.time()) + timedelta(hours=9)
+                ),
+                check_in_date=day,
+                approval_status=statuses[index % len(statuses)],
+            )
+            for intern in interns
+            for index, day in enumerate(days)
+        ),
+        batch_size=5000,
+    )
+    PerformanceAssessment.objects.bulk_create(
+        (
+            PerformanceAssessment(
+                intern=intern,
+                week_number=week,
+                assessment_date=first_day + timedelta(weeks=week),
+                status="submitted",
+                supervisor_score=60 + week % 40,
+            )
+            for intern in interns
+            for week in range(1, weeks + 1)
+        ),
+        batch_size=5000,
+    )
+    return [intern.id for intern in interns]
+
+
+def joined(queryset):
+    """The annotations the intern list used before, one join per relation"""
+    return queryset.annotate(
+        total_assessments=Count("assessments"),
+        avg_score=Avg("assessments__supervisor_score"),
+        total_attendance=Count("attendances"),
+        approved_attendance=Count(
+            "attendances", filter=Q(attendances__approval_status="approved")
+        ),
+    )
+
+
+def measure(label, annotate, intern_ids):
+    queryset = InternProfile.objects.filter(id__in=intern_ids).select_related("user")
+    timings = []
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        page = list(annotate(queryset).order_by("-start_date", "-id")[:PAGE_SIZE])
+        timings.append(time.perf_counter() - started)
+    first = page[0]
+    print(
+        f"  {label:<10} {min(timings) * 1000:>8.1f} ms  "
+        f"assessments={first.total_assessments} attendance={first.total_attendance}"
+    )
+
+
+def run(interns, weeks_list):
+    for weeks in weeks_list:
+        try:
+            with transaction.atomic():
+                intern_ids = seed_interns(interns, weeks)
+                print(f"{interns} intern(s), {weeks} week(s) of history")
+                measure("joined", joined, intern_ids)
+                measure("subquery", annotate_intern_stats, intern_ids)
+                raise Rollback
+        except Rollback:
+            pass
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--interns", type=int, default=200)
+    parser.add_argument("--weeks", type=int, nargs="+", default=[4, 12, 26])
+    args = parser.parse_args()
+    run(args.interns, args.weeks)
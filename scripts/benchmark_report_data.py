@@ -0,0 +1,220 @@
+#!/usr/bin/env python
+"""
+Benchmark intern report data gathering.
+
+Compares the original per-intern gatherer (separate count and aggregate
+queries per status, absence days summed in Python) with the grouped batch
+gatherer for 1, 100 and 1000 synthetic interns. All data is created inside a
+transaction that is rolled back, so the script is safe to run against a
+development database.
+
+Usage:
+    python scripts/benchmark_report_data.py [--sizes 1 100 1000]
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import date, timedelta
+
+import django
+
+# Add the project directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Setup Django
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+django.setup()
+
+from django.db import connection, transaction
+from django.db.models import Avg
+
+from apps.absenteeism.models import AbsenteeismRequest
+from apps.accounts.models import User
+from apps.attendance.models import Attendance
+from apps.branches.models import Branch
+from apps.evaluations.models import PerformanceAssessment
+from apps.interns.models import InternProfile
+from apps.reports.services import ReportService
+
+
+class Rollback(Exception):
+    """Raised to discard the benchmark data"""
+
+
+def seed_interns(count):
+    """Create interns with a few weeks of attendance, assessments and absences"""
+    branch, _ = Branch.objects.get_or_create(
+        code="BENCH", defaults={"name": "Benchmark Branch"}
+    )
+    today = date.today()
+
+    users = User.objects.bulk_create(
+        User(
+            username=f"bench_intern_{i}",
+            email=f"bench_intern_{i}@example.com",
+            first_name="Bench",
+            last_name=str(i),
+            role=User.Roles.INTERN,
+        )
+        for i in range(count)
+    )
+    interns = InternProfile.objects.bulk_create(
+        InternProfile(user=user, branch=branch, start_date=today - timedelta(days=60))
+        for user in users
+    )
+
+    statuses = ["approved", "approved", "approved", "pending", "rejected"]
+    Attendance.objects.bulk_create(
+        Attendance(
+            intern=intern,
+            branch=branch,
+            latitude=0,
+            longitude=0,
+            approval_status=statuses[day % len(statuses)],
+        )
+        for intern in interns
+        for day in range(20)
+    )
+    PerformanceAssessment.objects.bulk_create(
+        PerformanceAssessment(
+            intern=intern,
+            week_number=week,
+            assessment_date=today - timedelta(weeks=week),
+            status="submitted" if week % 4 else "draft",
+            supervisor_score=70 + week,
+            intern_score=65 + week,
+        )
+        for intern in interns
+        for week in range(1, 9)
+    )
+    AbsenteeismRequest.objects.bulk_create(
+        AbsenteeismRequest(
+            intern=intern,
+            reason="Benchmark",
+            start_date=today - timedelta(days=10 * n),
+            end_date=today - timedelta(days=10 * n - 1),
+            status="approved" if n % 2 else "pending",
+        )
+        for intern in interns
+        for n in range(1, 4)
+    )
+    return [intern.id for intern in interns]
+
+
+def gather_per_intern(intern_profile):
+    """Baseline: the per-intern report gatherer the batch path replaced"""
+    all_attendance = Attendance.objects.filter(intern=intern_profile)
+    total_attendance = all_attendance.count()
+    approved_attendance = all_attendance.filter(
+        approval_status=Attendance.ApprovalStatus.APPROVED
+    ).count()
+    rejected_attendance = all_attendance.filter(
+        approval_status=Attendance.ApprovalStatus.REJECTED
+    ).count()
+    pending_attendance = all_attendance.filter(
+        approval_status=Attendance.ApprovalStatus.PENDING
+    ).count()
+
+    assessments = PerformanceAssessment.objects.filter(
+        intern=intern_profile
+    ).order_by("week_number")
+    total_assessments = assessments.count()
+    completed_assessments = assessments.filter(
+        status=PerformanceAssessment.Status.SUBMITTED
+    ).count()
+    avg_supervisor_score = (
+        assessments.filter(supervisor_score__isnull=False).aggregate(
+            Avg("supervisor_score")
+        )["supervisor_score__avg"]
+        or 0
+    )
+    avg_intern_score = (
+        assessments.filter(intern_score__isnull=False).aggregate(
+            Avg("intern_score")
+        )["intern_score__avg"]
+        or 0
+    )
+
+    absences = AbsenteeismRequest.objects.filter(intern=intern_profile)
+    total_absences = absences.count()
+    approved_absences = absences.filter(
+        status=AbsenteeismRequest.Status.APPROVED
+    ).count()
+    rejected_absences = absences.filter(
+        status=AbsenteeismRequest.Status.REJECTED
+    ).count()
+    pending_absences = absences.filter(
+        status=AbsenteeismRequest.Status.PENDING
+    ).count()
+    approved_absence_days = sum(
+        (absence.end_date - absence.start_date).days + 1
+        for absence in absences.filter(status=AbsenteeismRequest.Status.APPROVED)
+    )
+
+    recent_assessments = list(
+        assessments.filter(status=PerformanceAssessment.Status.SUBMITTED).order_by(
+            "-assessment_date"
+        )[:5]
+    )
+
+    return {
+        "total_attendance": total_attendance,
+        "approved_attendance": approved_attendance,
+        "rejected_attendance": rejected_attendance,
+        "pending_attendance": pending_attendance,
+        "total_assessments": total_assessments,
+        "completed_assessments": completed_assessments,
+        "avg_supervisor_score": avg_supervisor_score,
+        "avg_intern_score": avg_intern_score,
+        "total_absences": total_absences,
+        "approved_absences": approved_absences,
+        "rejected_absences": rejected_absences,
+        "pending_absences": pending_absences,
+        "approved_absence_days": approved_absence_days,
+        "assessments": recent_assessments,
+    }
+
+
+def measure(label, func):
+    # Count with an execute wrapper: CaptureQueriesContext keeps only the
+    # last 9000 queries, which the baseline exceeds at 1000 interns
+    queries = 0
+
+    def count(execute, sql, params, many, context):
+        nonlocal queries
+        queries += 1
+        return execute(sql, params, many, context)
+
+    with connection.execute_wrapper(count):
+        started = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - started
+    print(f"  {label:<12} {queries:>6} queries  {elapsed * 1000:>10.1f} ms")
+
+
+def run(sizes):
+    for size in sizes:
+        try:
+            with transaction.atomic():
+                intern_ids = seed_interns(size)
+                print(f"{size} intern(s)")
+
+                def per_intern():
+                    for intern in InternProfile.objects.filter(
+                        id__in=intern_ids
+                    ).select_related("user", "branch", "school", "internal_supervisor__user"):
+                        gather_per_intern(intern)
+
+                measure("per-intern", per_intern)
+                measure("batched", lambda: ReportService.gather_intern_data_batch(intern_ids))
+                raise Rollback
+        except Rollback:
+            pass
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 100, 1000])
+    run(parser.parse_args().sizes)
@@ -0,0 +1,145 @@
+"""
+Tests for absence request conflict detection
+"""
+
+from datetime import date, datetime, time
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.absenteeism.conflicts import AbsenceConflictService
+from apps.absenteeism.forms import AbsenteeismRequestForm
+from apps.absenteeism.models import AbsenteeismRequest
+from apps.attendance.models import Attendance
+from apps.holidays.models import Holiday
+from tests.base import BaseTestCase
+
+
+def day(offset):
+    """Days from Monday 4 March 2024"""
+    return date(2024, 3, 4 + offset)
+
+
+class AbsenceConflictTest(BaseTestCase):
+    """Test overlap, attendance and holiday conflicts"""
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.approved = self._request(day(0), day(1), AbsenteeismRequest.Status.APPROVED)
+
+    def _request(self, start, end, status=AbsenteeismRequest.Status.PENDING):
+        return AbsenteeismRequest.objects.create(
+            intern=self.intern_profile,
+            reason="Appointment",
+            start_date=start,
+            end_date=end,
+            status=status,
+        )
+
+    def _form(self, start, end):
+        return AbsenteeismRequestForm(
+            data={"start_date": start, "end_date": end, "reason": "Family event"},
+            intern=self.intern_profile,
+        )
+
+    def test_period_follows_dates(self):
+        """Saving keeps the daterange in step with the dates"""
+        self.approved.end_date = day(2)
+        self.approved.save(update_fields=["end_date"])
+
+        self.approved.refresh_from_db()
+        self.assertEqual(self.approved.period.lower, day(0))
+        self.assertEqual(self.approved.period.upper, day(3))
+
+    def test_overlaps_follow_status_and_bounds(self):
+        """Only open requests sharing at least one day overlap"""
+        self._request(day(1), day(1), AbsenteeismRequest.Status.REJECTED)
+        pending = self._request(day(3), day(4))
+
+        self.assertEqual(
+            list(AbsenceConflictService.overlapping(self.intern_profile, day(1), day(3))),
+            [self.approved, pending],
+        )
+        self.assertFalse(
+            AbsenceConflictService.overlapping(self.intern_profile, day(2), day(2)).exists()
+        )
+
+    def test_form_rejects_conflicts(self):
+        """Overlaps, attended days and holiday-only periods are form errors"""
+        Attendance.objects.create(
+            intern=self.intern_profile,
+            branch=self.branch,
+            latitude=0,
+            longitude=0,
+            check_in_time=timezone.make_aware(datetime.combine(day(3), time(9))),
+            approval_status=Attendance.ApprovalStatus.APPROVED,
+        )
+        Holiday.objects.create(name="Founders Day", date=day(2))
+
+        form = self._form(day(1), day(3))
+        self.assertFalse(form.is_valid())
+        errors = " ".join(form.non_field_errors())
+        self.assertIn("overlaps your approved request", errors)
+        self.assertIn("approved attendance on Mar 07, 2024", errors)
+
+        form = self._form(day(2), day(2))
+        self.assertFalse(form.is_valid())
+        self.assertIn("no working days", " ".join(form.non_field_errors()))
+
+        self.assertTrue(self._form(day(4), day(4)).is_valid())
+        # Weekend days around a working day are fine
+        self.assertTrue(self._form(day(4), day(6)).is_valid())
+
+    def test_approval_screen_shows_and_blocks_overlaps(self):
+        """Reviewers see conflicts and cannot approve an overlapping range"""
+        Holiday.objects.create(name="Founders Day", date=day(2))
+        pending = self._request(day(1), day(2))
+        self.login_user(self.supervisor_user)
+        url = reverse("absenteeism:approve", args=[pending.id])
+
+        response = self.client.get(url)
+        conflicts = response.context["conflicts"]
+        self.assertEqual(conflicts.overlapping, [self.approved])
+        self.assertEqual(conflicts.working_days, 1)
+        self.assertContains(response, "Founders Day")
+
+        response = self.client.post(url, {"decision": "approve"})
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "overlaps an approved absence")
+        pending.refresh_from_db()
+        self.assertEqual(pending.status, AbsenteeismRequest.Status.PENDING)
+
+        response = self.client.get(reverse("absenteeism:pending_requests"))
+        self.assertTrue(response.context["requests"][0].has_overlap)
+
+    def test_approval_rechecks_overlaps_under_lock(self):
+        """An overlap approved after the screen was built still blocks approval"""
+        first = self._request(day(3), day(4))
+        second = self._request(day(4), day(5))
+        self.login_user(self.supervisor_user)
+        find = AbsenceConflictService.find
+        calls = []
+
+        def find_then_race(*args, **kwargs):
+            conflicts = find(*args, **kwargs)
+            if not calls:
+                # Another reviewer approves the overlapping request meanwhile
+                AbsenteeismRequest.objects.filter(pk=second.pk).update(
+                    status=AbsenteeismRequest.Status.APPROVED
+                )
+            calls.append(conflicts)
+            return conflicts
+
+        with patch.object(AbsenceConflictService, "find", side_effect=find_then_race):
+            response = self.client.post(
+                reverse("absenteeism:approve", args=[first.id]), {"decision": "approve"}
+            )
+
+        self.assertFalse(calls[0].approved_overlaps)
+        self.assertContains(response, "overlaps an approved absence")
+        first.refresh_from_db()
+        self.assertEqual(first.status, AbsenteeismRequest.Status.PENDING)
@@ -0,0 +1,70 @@
+"""
+Tests for the intern access policy
+"""
+
+from django.urls import reverse
+
+from apps.accounts.access import can_supervise, can_view_intern_report
+from apps.accounts.models import User
+from apps.interns.models import InternProfile
+from apps.supervisors.models import EmployeeProfile
+from tests.base import BaseTestCase
+
+
+class AccessPolicyTest(BaseTestCase):
+    """Test can_supervise and report access"""
+
+    def setUp(self):
+        super().setUp()
+        self.other_intern = InternProfile.objects.create(
+            user=self.create_user(username="intern2", email="intern2@test.com"),
+            branch=self.branch,
+        )
+        self.manager_user = self.create_user(
+            username="manager1", email="manager@test.com", role=User.Roles.MANAGER
+        )
+
+    def test_supervisor_limited_to_assigned_interns(self):
+        """Supervisors may act on their own interns only"""
+        self.assertTrue(can_supervise(self.supervisor_user, self.intern_profile))
+        self.assertFalse(can_supervise(self.supervisor_user, self.other_intern))
+        self.assertTrue(can_supervise(self.manager_user, self.other_intern))
+        self.assertTrue(can_supervise(self.admin_user, self.other_intern.pk))
+
+    def test_checks_are_memoized_per_user_object(self):
+        """Repeated checks cost one EXISTS query per intern"""
+        with self.assertNumQueries(1):
+            for _ in range(3):
+                can_supervise(self.supervisor_user, self.intern_profile)
+                can_supervise(self.supervisor_user, self.intern_profile.pk)
+
+        with self.assertNumQueries(0):
+            can_supervise(self.manager_user, self.intern_profile)
+
+    def test_supervisor_without_profile_is_denied(self):
+        """Supervisor accounts without an employee profile see no interns"""
+        EmployeeProfile.objects.filter(user=self.supervisor_user).update(
+            user=self.manager_user
+        )
+        self.assertFalse(can_supervise(self.supervisor_user, self.intern_profile))
+
+    def test_report_access(self):
+        """Interns see their own report; supervisors their interns'"""
+        self.assertTrue(can_view_intern_report(self.intern_user, self.intern_profile))
+        self.assertFalse(can_view_intern_report(self.intern_user, self.other_intern))
+        self.assertFalse(
+            can_view_intern_report(self.supervisor_user, self.other_intern)
+        )
+        self.assertTrue(can_view_intern_report(self.manager_user, self.other_intern))
+
+    def test_views_deny_unassigned_intern(self):
+        """Assessment creation redirects for an unassigned intern"""
+        self.login_user(self.supervisor_user)
+
+        response = self.client.get(
+            reverse("evaluations:create_assessment", args=[self.other_intern.pk]),
+            follow=True,
+        )
+
+        self.assertRedirects(response, reverse("evaluations:assessment_list"))
+        self.assertMessageContains(response, "only create assessments")
@@ -0,0 +1,88 @@
+"""
+Tests for assessment score-trend analytics
+"""
+
+from django.core.cache import cache
+from django.urls import reverse
+
+from apps.evaluations.analytics import ScoreAnalyticsService
+from apps.evaluations.models import PerformanceAssessment
+from apps.interns.models import InternProfile
+from tests.base import BaseTestCase
+
+
+class ScoreAnalyticsTest(BaseTestCase):
+    """Test trends, percentiles and their cache"""
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.other_intern = InternProfile.objects.create(
+            user=self.create_user(username="intern2", email="intern2@test.com"),
+            branch=self.branch,
+        )
+        scores = [(60, 70), (70, None), (65, 65), (80, 90), (90, 85)]
+        for week, (supervisor_score, intern_score) in enumerate(scores, start=1):
+            self._assess(self.intern_profile, week, supervisor_score, intern_score)
+        # Unscored drafts are ignored
+        PerformanceAssessment.objects.create(intern=self.intern_profile, week_number=6)
+        self._assess(self.other_intern, 1, 50)
+
+    def _assess(self, intern, week, supervisor_score, intern_score=None):
+        return PerformanceAssessment.objects.create(
+            intern=intern,
+            week_number=week,
+            status=PerformanceAssessment.Status.REVIEWED,
+            supervisor_score=supervisor_score,
+            intern_score=intern_score,
+        )
+
+    def test_trend_figures(self):
+        """Changes, rolling means and gaps follow the scored weeks"""
+        trend = ScoreAnalyticsService.trend(self.intern_profile)
+
+        self.assertEqual([week.week_number for week in trend.weeks], [1, 2, 3, 4, 5])
+        self.assertEqual(
+            [week.change for week in trend.weeks], [None, 10, -5, 15, 10]
+        )
+        # Four-week window: (70 + 65 + 80 + 90) / 4
+        self.assertEqual(trend.latest.rolling_mean, 76.2)
+        self.assertEqual(trend.weeks[1].rolling_mean, 65.0)
+        self.assertEqual([week.gap for week in trend.weeks], [10, None, 0, 10, -5])
+        self.assertEqual(trend.average_score, 73.0)
+        self.assertEqual(trend.average_gap, 3.8)
+        self.assertEqual(trend.direction, "up")
+
+    def test_cohort_percentiles(self):
+        """Interns are ranked against their branch by average score"""
+        trends = ScoreAnalyticsService.trends(
+            [self.intern_profile, self.other_intern]
+        )
+
+        self.assertEqual(trends[self.intern_profile.id].percentile, 100.0)
+        self.assertEqual(trends[self.other_intern.id].percentile, 50.0)
+
+    def test_trends_are_cached_until_an_assessment_changes(self):
+        """Repeat reads hit the cache; saving an assessment recomputes"""
+        profiles = [self.intern_profile, self.other_intern]
+        with self.assertNumQueries(2):
+            ScoreAnalyticsService.trends(profiles)
+        with self.assertNumQueries(0):
+            ScoreAnalyticsService.trends(profiles)
+
+        self._assess(self.other_intern, 2, 100)
+
+        trends = ScoreAnalyticsService.trends(profiles)
+        self.assertEqual(trends[self.other_intern.id].average_score, 75.0)
+        self.assertEqual(trends[self.other_intern.id].percentile, 100.0)
+        self.assertEqual(trends[self.intern_profile.id].percentile, 50.0)
+
+    def test_my_assessments_shows_trend(self):
+        """The intern's assessment page averages scored weeks only"""
+        self.login_user(self.intern_user)
+
+        response = self.client.get(reverse("evaluations:my_assessments"))
+
+        self.assertEqual(response.context["average_score"], 73.0)
+        self.assertContains(response, "Score Trend")
@@ -0,0 +1,106 @@
+"""
+Tests for the scheduled draft assessment creation
+"""
+
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.evaluations.models import PerformanceAssessment
+from apps.evaluations.scheduler import AssessmentScheduler
+from apps.interns.models import InternProfile
+from apps.notifications.models import Notification
+from tests.base import BaseTestCase
+
+
+class AssessmentSchedulerTest(BaseTestCase):
+    """Test bulk draft creation for due interns"""
+
+    def setUp(self):
+        super().setUp()
+        self.today = timezone.localdate()
+        self.counter = 0
+
+    def _intern(self, days_since_last=None, last_week=3, **fields):
+        self.counter += 1
+        intern = InternProfile.objects.create(
+            user=self.create_user(
+                username=f"sched{self.counter}", email=f"sched{self.counter}@test.com"
+            ),
+            branch=self.branch,
+            internal_supervisor=self.supervisor,
+            start_date=fields.pop("start_date", self.today - timedelta(weeks=6)),
+            **fields,
+        )
+        if days_since_last is not None:
+            PerformanceAssessment.objects.create(
+                intern=intern,
+                week_number=last_week,
+                assessment_date=self.today - timedelta(days=days_since_last),
+            )
+        return intern
+
+    def test_creates_next_draft_for_due_interns(self):
+        """Due interns get their next week; recent, finished and future do not"""
+        overdue = self._intern(days_since_last=8)
+        self._intern(days_since_last=2)
+        self._intern(end_date=self.today - timedelta(days=1))
+        self._intern(start_date=self.today + timedelta(days=1))
+
+        result = AssessmentScheduler.schedule(self.today)
+
+        self.assertEqual((result.due, result.created), (2, 2))
+        draft = PerformanceAssessment.objects.get(intern=overdue, week_number=4)
+        self.assertEqual(draft.status, "draft")
+        self.assertEqual(draft.assessed_by, self.supervisor)
+        self.assertEqual(draft.period_end, self.today)
+        self.assertEqual(draft.period_start, self.today - timedelta(days=6))
+        first = PerformanceAssessment.objects.get(intern=self.intern_profile)
+        self.assertEqual(first.week_number, 1)
+        self.assertEqual(first.period_start, self.today)
+        self.assertEqual(
+            Notification.objects.filter(category="assessment").count(), 2
+        )
+
+        rerun = AssessmentScheduler.schedule(self.today)
+        self.assertEqual((rerun.due, rerun.created), (0, 0))
+
+    def test_query_count_does_not_grow_with_interns(self):
+        """Creation and notification are batched"""
+        self._intern(days_since_last=8)
+        with CaptureQueriesContext(connection) as small:
+            AssessmentScheduler.schedule(self.today)
+
+        for _ in range(6):
+            self._intern(days_since_last=8)
+        PerformanceAssessment.objects.filter(
+            intern__start_date__lte=self.today, assessment_date=self.today
+        ).delete()
+        with CaptureQueriesContext(connection) as large:
+            result = AssessmentScheduler.schedule(self.today)
+
+        self.assertEqual(result.created, 8)
+        # The larger run creates notification preferences for six more users
+        # in the same single INSERT, so the counts match
+        self.assertEqual(len(small), len(large))
+
+    @override_settings(DEFAULT_ASSESSMENT_FREQUENCY="biweekly")
+    def test_frequency_setting_and_command(self):
+        """The frequency comes from settings; the command supports dry runs"""
+        self._intern(days_since_last=8)
+        out = StringIO()
+
+        call_command("schedule_assessments", dry_run=True, stdout=out)
+
+        self.assertIn("1 intern(s) due", out.getvalue())
+        self.assertFalse(
+            PerformanceAssessment.objects.filter(assessment_date=self.today).exists()
+        )
+        with self.assertRaises(CommandError):
+            call_command("schedule_assessments", date="2024-02-30")
@@ -0,0 +1,840 @@
+"""
+Tests for attendance views
+"""
+
+import csv
+import os
+import tempfile
+import zipfile
+from datetime import date, datetime, time, timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.db import IntegrityError, connection, transaction
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.absenteeism.models import AbsenteeismRequest
+from apps.attendance.export import EXPORT_COLUMNS
+from apps.attendance.forms import AttendanceMarkForm
+from apps.attendance.geofence import (
+    Geofence,
+    GeofenceIndex,
+    GeofenceService,
+    get_geofence_index,
+    haversine_distances,
+    invalidate_geofence_index,
+)
+from apps.attendance.missed import MissedCheckInService
+from apps.attendance.models import (
+    Attendance,
+    AttendanceDay,
+    haversine_distance_meters,
+)
+from apps.attendance.rollups import AttendanceRollupService
+from apps.attendance.services import AttendanceApprovalService
+from apps.attendance.pagination import (
+    AttendanceKeysetPaginator,
+    decode_cursor,
+    encode_cursor,
+)
+from apps.branches.models import Branch, BranchSite
+from apps.holidays.calendar import get_working_calendar, invalidate_working_calendar
+from apps.holidays.models import Holiday
+from apps.interns.models import InternProfile
+from apps.notifications.models import Notification, OutboundEmail
+from apps.supervisors.models import EmployeeProfile
+from tests.base import (
+    AuthenticatedTestCase,
+    BaseTestCase,
+    InternTestCase,
+    SupervisorTestCase,
+)
+
+
+class CheckInDateTest(BaseTestCase):
+    """Test the stored local check-in date and its uniqueness"""
+
+    def _check_in(self, **kwargs):
+        return Attendance.objects.create(
+            intern=self.intern_profile,
+            branch=self.branch,
+            latitude=0,
+            longitude=0,
+            **kwargs,
+        )
+
+    def test_check_in_date_follows_check_in_time(self):
+        """check_in_date is the local day of check_in_time"""
+        attendance = self._check_in(check_in_time=timezone.now() - timedelta(days=3))
+        self.assertEqual(
+            attendance.check_in_date, timezone.localdate() - timedelta(days=3)
+        )
+
+        attendance.check_in_time = timezone.now()
+        attendance.save(update_fields=["check_in_time"])
+        attendance.refresh_from_db()
+        self.assertEqual(attendance.check_in_date, timezone.localdate())
+
+    def test_second_check_in_same_day_is_rejected(self):
+        """The database refuses two check-ins on one day for an intern"""
+        self._check_in()
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            self._check_in()
+
+        self._check_in(check_in_time=timezone.now() - timedelta(days=1))
+        self.assertEqual(Attendance.objects.count(), 2)
+
+    def test_legacy_duplicate_can_be_saved(self):
+        """Same-day duplicates left without a date by 0006 stay saveable"""
+        nine = timezone.localtime().replace(hour=9, minute=0)
+        self._check_in(check_in_time=nine)
+        duplicate = self._check_in(check_in_time=nine - timedelta(days=1))
+        # As backfilled: a later check-in on the same day with no date
+        Attendance.objects.filter(pk=duplicate.pk).update(
+            check_in_time=nine + timedelta(minutes=5),
+            check_in_date=None,
+        )
+
+        duplicate = Attendance.objects.get(pk=duplicate.pk)
+        duplicate.approval_status = Attendance.ApprovalStatus.APPROVED
+        duplicate.check_out_time = timezone.now()
+        duplicate.save()
+
+        duplicate.refresh_from_db()
+        self.assertIsNone(duplicate.check_in_date)
+        self.assertEqual(duplicate.approval_status, Attendance.ApprovalStatus.APPROVED)
+
+
+@override_settings(ATTENDANCE_START_TIME="09:00", ATTENDANCE_GRACE_MINUTES=15)
+class AttendanceRollupTest(BaseTestCase):
+    """Test the daily hours rollups"""
+
+    def _day(self, days_ago, hour, minute=0, hours=8, **kwargs):
+        check_in = timezone.make_aware(
+            datetime.combine(
+                timezone.localdate() - timedelta(days=days_ago), time(hour, minute)
+            )
+        )
+        return Attendance.objects.create(
+            intern=self.intern_profile,
+            branch=self.branch,
+            latitude=0,
+            longitude=0,
+            check_in_time=check_in,
+            check_out_time=check_in + timedelta(hours=hours) if hours else None,
+            **kwargs,
+        )
+
+    def test_saving_attendance_updates_rollup(self):
+        """Check-in, checkout and approval are reflected in the rollup"""
+        attendance = self._day(1, 9, 10, hours=None)
+        day = AttendanceDay.objects.get(attendance=attendance)
+        self.assertEqual(day.minutes_worked, 0)
+        self.assertTrue(day.on_time)
+        self.assertEqual(day.approval_status, "pending")
+
+        attendance.check_out_time = attendance.check_in_time + timedelta(hours=7.5)
+        attendance.approve(approver=self.supervisor_user)
+        attendance.save()
+
+        day.refresh_from_db()
+        self.assertEqual(day.minutes_worked, 450)
+        self.assertEqual(day.hours_worked, 7.5)
+        self.assertEqual(day.approval_status, "approved")
+
+        late = self._day(2, 9, 20)
+        self.assertFalse(AttendanceDay.objects.get(attendance=late).on_time)
+
+    def test_bulk_decisions_refresh_rollups(self):
+        """Queryset updates in the bulk approval path keep rollups current"""
+        attendance = self._day(1, 8)
+
+        AttendanceApprovalService.bulk_decide(
+            self.admin_user, [attendance.pk], approve=True
+        )
+
+        self.assertEqual(
+            AttendanceDay.objects.get(attendance=attendance).approval_status,
+            "approved",
+        )
+
+    def test_monthly_hours_counts_approved_days(self):
+        """Only approved days contribute hours"""
+        self._day(0, 8, approval_status="approved")
+        self._day(1, 10, hours=4, approval_status="approved")
+        self._day(2, 8, approval_status="rejected")
+        today = timezone.localdate()
+
+        summary = AttendanceRollupService.monthly_hours(
+            [self.intern_profile.id], today - timedelta(days=2), today
+        )[self.intern_profile.id]
+
+        self.assertEqual(sum(month.hours for month in summary), 12.0)
+        self.assertEqual(sum(month.days for month in summary), 2)
+        self.assertEqual(sum(month.on_time_days for month in summary), 1)
+
+    def test_rebuild_command_restores_rollups(self):
+        """The command recomputes deleted or stale rows"""
+        self._day(0, 8)
+        self._day(1, 8)
+        AttendanceDay.objects.all().delete()
+        out = StringIO()
+
+        call_command("rebuild_attendance_rollups", stdout=out)
+
+        self.assertIn("Rebuilt 2 daily rollup(s)", out.getvalue())
+        self.assertEqual(AttendanceDay.objects.filter(minutes_worked=480).count(), 2)
+
+
+class MissedCheckInTest(BaseTestCase):
+    """Test the nightly missed check-in job"""
+
+    day = date(2024, 1, 10)  # a Wednesday
+
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(invalidate_working_calendar)
+        InternProfile.objects.update(start_date=date(2024, 1, 1), end_date=None)
+        self.other_intern = InternProfile.objects.create(
+            user=self.create_user(username="intern2", email="intern2@test.com"),
+            branch=self.branch,
+            internal_supervisor=self.supervisor,
+            start_date=date(2024, 1, 1),
+        )
+
+    def _check_in(self, intern):
+        Attendance.objects.create(
+            intern=intern,
+            branch=self.branch,
+            latitude=0,
+            longitude=0,
+            check_in_time=timezone.make_aware(datetime.combine(self.day, time(9))),
+        )
+
+    def _missing(self, day=None):
+        return list(MissedCheckInService.missing_interns(day or self.day))
+
+    def test_finds_interns_without_check_in(self):
+        """Checked-in, absent, finished and future interns are skipped"""
+        self._check_in(self.intern_profile)
+        self.assertEqual(self._missing(), [self.other_intern])
+
+        AbsenteeismRequest.objects.create(
+            intern=self.other_intern,
+            status=AbsenteeismRequest.Status.APPROVED,
+            reason="Sick",
+            start_date=self.day - timedelta(days=1),
+            end_date=self.day,
+        )
+        self.assertEqual(self._missing(), [])
+
+        self.assertEqual(
+            self._missing(date(2023, 12, 29)), [], "before start_date"
+        )
+
+    def test_holidays_and_weekends_are_skipped(self):
+        """Full-day holidays for the branch or all branches and weekends"""
+        other_branch = Branch.objects.create(name="Other", code="OTH")
+        Holiday.objects.create(name="Local", date=self.day, branch=other_branch)
+        self.assertEqual(len(self._missing()), 2)
+
+        Holiday.objects.create(name="Branch day", date=self.day, branch=self.branch)
+        self.assertEqual(self._missing(), [])
+
+        self.assertEqual(self._missing(date(2024, 1, 13)), [])
+
+    def test_notify_interns_and_supervisor_once(self):
+        """Each intern and one supervisor summary, idempotent on re-run"""
+        get_working_calendar()
+        # Interns, supervisor dedupe, notification INSERT, preference lookup
+        # and creation, outbox INSERT, plus the atomic savepoint pair
+        with self.assertNumQueries(8):
+            result = MissedCheckInService.notify(self.day)
+
+        self.assertEqual((result.interns, result.supervisors), (2, 1))
+        self.assertEqual(
+            Notification.objects.filter(
+                recipient__in=[self.intern_user, self.other_intern.user],
+                title="Missed check-in on Jan 10, 2024",
+            ).count(),
+            2,
+        )
+        summary = Notification.objects.get(recipient=self.supervisor_user)
+        self.assertIn("2 of your intern(s)", summary.message)
+
+        result = MissedCheckInService.notify(self.day)
+        self.assertEqual((result.interns, result.supervisors), (0, 0))
+        self.assertEqual(Notification.objects.count(), 3)
+
+    def test_command_dry_run(self):
+        """The command reports counts without notifying in dry-run mode"""
+        out = StringIO()
+        call_command(
+            "notify_missed_check_ins", date="2024-01-10", dry_run=True, stdout=out
+        )
+
+        self.assertIn("Would notify 2 intern(s) and 1 supervisor(s)", out.getvalue())
+        self.assertFalse(Notification.objects.exists())
+
+
+class GeofenceRevalidationTest(BaseTestCase):
+    """Test vectorised geofence checks and bulk re-validation"""
+
+    def setUp(self):
+        super().setUp()
+        self.branch.latitude = "5.600000"
+        self.branch.longitude = "-0.180000"
+        self.branch.proximity_threshold_meters = 100
+        self.branch.save()
+        self.other_branch = Branch.objects.create(
+            name="Other Branch",
+            code="OTH",
+            latitude="5.600000",
+            longitude="-0.180000",
+            proximity_threshold_meters=100,
+        )
+        # About 330m north of both branches, so outside the radius for now
+        self.near = self._pending(self.branch, 0)
+        self.far = self._pending(self.branch, 1, latitude="5.700000")
+        self.other = self._pending(self.other_branch, 2)
+
+    def _pending(self, branch, days_ago, latitude="5.603000"):
+        attendance = Attendance.objects.create(
+            intern=self.intern_profile,
+            branch=branch,
+            latitude=latitude,
+            longitude="-0.180000",
+            check_in_time=timezone.now() - timedelta(days=days_ago),
+        )
+        self.assertEqual(attendance.approval_status, "pending")
+        return attendance
+
+    def test_vectorised_distance_matches_scalar(self):
+        """The batch engine agrees with the per-check-in formula"""
+        points = [(5.6, -0.18, 5.603, -0.18), (6.0, -1.0, 5.0, 0.5), (0, 0, 0, 0)]
+        lat1, lon1, lat2, lon2 = zip(*points)
+
+        distances = haversine_distances(lat1, lon1, lat2, lon2)
+
+        for distance, point in zip(distances, points):
+            self.assertAlmostEqual(distance, haversine_distance_meters(*point), 6)
+
+    def test_widening_radius_approves_pending(self):
+        """Pending check-ins inside the new radius are auto-approved"""
+        Branch.objects.filter(pk=self.branch.pk).update(proximity_threshold_meters=500)
+
+        result = GeofenceService.revalidate_pending([self.branch.pk], chunk_size=1)
+
+        self.assertEqual((result.checked, result.approved), (2, 1))
+        self.near.refresh_from_db()
+        self.far.refresh_from_db()
+        self.other.refresh_from_db()
+        self.assertEqual(self.near.approval_status, "approved")
+        self.assertTrue(self.near.auto_approved)
+        self.assertIsNotNone(self.near.approved_at)
+        self.assertEqual(self.far.approval_status, "pending")
+        self.assertEqual(self.other.approval_status, "pending")
+
+    def test_command_filters_by_branch_code(self):
+        """The command accepts branch codes and reports its counts"""
+        Branch.objects.update(proximity_threshold_meters=500)
+        out = StringIO()
+
+        call_command("revalidate_attendance", "--branch", "OTH", stdout=out)
+
+        self.assertIn("Checked 1 pending check-in(s), auto-approved 1", out.getvalue())
+        self.other.refresh_from_db()
+        self.near.refresh_from_db()
+        self.assertEqual(self.other.approval_status, "approved")
+        self.assertEqual(self.near.approval_status, "pending")
+
+
+class GeofenceIndexTest(BaseTestCase):
+    """Test locating check-ins among several sites of a branch"""
+
+    # Small square around (5.65, -0.25)
+    SQUARE = [[5.649, -0.251], [5.649, -0.249], [5.651, -0.249], [5.651, -0.251]]
+
+    def test_locates_circles_and_polygons_per_branch(self):
+        """Points match only geofences of the given branch"""
+        index = GeofenceIndex(
+            [
+                Geofence(branch_id=1, latitude=5.6, longitude=-0.18, radius_meters=100),
+                Geofence(branch_id=1, site_id=7, polygon=tuple(map(tuple, self.SQUARE))),
+                Geofence(branch_id=2, latitude=5.7, longitude=-0.18, radius_meters=100),
+            ]
+        )
+
+        self.assertIsNone(index.locate(1, 5.6005, -0.18).site_id)
+        self.assertEqual(index.locate(1, 5.65, -0.25).site_id, 7)
+        self.assertIsNone(index.locate(1, 5.652, -0.25))
+        self.assertIsNone(index.locate(1, 5.7, -0.18))
+        self.assertEqual(index.locate(2, 5.7, -0.18).branch_id, 2)
+
+        located = index.locate_many(
+            1, [5.6005, 5.65, 5.652, 5.7], [-0.18, -0.25, -0.25, -0.18]
+        )
+        self.assertEqual(
+            [geofence and geofence.site_id for geofence in located],
+            [None, 7, None, None],
+        )
+        self.assertIsNotNone(located[0])
+
+    def test_auto_validate_sees_new_sites(self):
+        """Adding a site refreshes the index used at check-in"""
+        get_geofence_index()
+        BranchSite.objects.create(branch=self.branch, name="Annex", polygon=self.SQUARE)
+
+        attendance = Attendance(
+            intern=self.intern_profile,
+            branch=self.branch,
+            latitude="5.6500000",
+            longitude="-0.2500000",
+        )
+        attendance.auto_validate()
+
+        self.assertTrue(attendance.auto_approved)
+        self.assertEqual(attendance.approval_status, "approved")
+
+    def test_index_follows_changes_from_other_processes(self):
+        """Sites added without this process's signals appear after the next check"""
+        index = get_geofence_index()
+        # bulk_create sends no signals, like a save made by another worker
+        BranchSite.objects.bulk_create(
+            [BranchSite(branch=self.branch, name="Annex", polygon=self.SQUARE)]
+        )
+
+        with self.assertNumQueries(0):
+            self.assertIs(get_geofence_index(), index)
+        with override_settings(GEOFENCE_INDEX_CHECK_SECONDS=0):
+            refreshed = get_geofence_index()
+
+        self.assertIsNot(refreshed, index)
+        self.assertIsNotNone(refreshed.locate(self.branch.id, 5.65, -0.25))
+
+    def test_revalidate_pending_uses_sites(self):
+        """Bulk re-validation approves check-ins inside any site"""
+        inside = Attendance.objects.create(
+            intern=self.intern_profile,
+            branch=self.branch,
+            latitude="5.6500000",
+            longitude="-0.2500000",
+        )
+        BranchSite.objects.create(
+            branch=self.branch,
+            name="Field office",
+            latitude="5.650000",
+            longitude="-0.250000",
+            radius_meters=50,
+            is_active=False,
+        )
+        self.assertEqual(GeofenceService.revalidate_pending().approved, 0)
+
+        BranchSite.objects.create(branch=self.branch, name="Annex", polygon=self.SQUARE)
+        self.assertEqual(GeofenceService.revalidate_pending().approved, 1)
+        inside.refresh_from_db()
+        self.assertTrue(inside.auto_approved)
+
+
+class MarkAttendanceViewTest(InternTestCase):
+    """Test duplicate handling when marking attendance"""
+
+    def setUp(self):
+        super().setUp()
+        self.url = reverse("attendance:mark")
+        self.data = {"latitude": "5.6", "longitude": "-0.18"}
+
+    def test_mark_attendance_once_per_day(self):
+        """A second check-in on the same day is redirected"""
+        response = self.client.post(self.url, self.data)
+        self.assertRedirects(response, reverse("attendance:my_attendance"))
+
+        response = self.client.post(self.url, self.data, follow=True)
+
+        self.assertMessageContains(response, "already marked attendance today")
+        self.assertEqual(Attendance.objects.count(), 1)
+
+    def test_concurrent_check_in_is_handled(self):
+        """Losing the insert race shows a message instead of an error"""
+        original_save = AttendanceMarkForm.save
+
+        def racing_save(form, commit=True):
+            # Another request checks the intern in between the lookup and insert
+            Attendance.objects.create(
+                intern=self.intern_profile, branch=self.branch, latitude=0, longitude=0
+            )
+            return original_save(form, commit)
+
+        with patch.object(AttendanceMarkForm, "save", racing_save):
+            response = self.client.post(self.url, self.data, follow=True)
+
+        self.assertRedirects(response, reverse("attendance:my_attendance"))
+        self.assertMessageContains(response, "already marked attendance today")
+
+
+class SyncAttendanceViewTest(InternTestCase):
+    """Test the offline batch sync endpoint"""
+
+    def setUp(self):
+        super().setUp()
+        self.url = reverse("attendance:sync")
+        Branch.objects.filter(pk=self.branch.pk).update(
+            latitude="5.6000000", longitude="-0.1800000", proximity_threshold_meters=100
+        )
+        invalidate_geofence_index()
+
+    def _at(self, hour, days_ago=1):
+        return (
+            timezone.localtime()
+            .replace(hour=hour, minute=0, second=0, microsecond=0)
+            - timedelta(days=days_ago)
+        ).isoformat()
+
+    def _post(self, events):
+        return self.client.post(
+            self.url, {"events": events}, content_type="application/json"
+        )
+
+    def test_batch_applies_events_and_replays_idempotently(self):
+        """Check-ins and check-outs sync in one request and retries are no-ops"""
+        events = [
+            {"key": "b-out", "type": "check_out", "timestamp": self._at(17, 2)},
+            {
+                "key": "a-in",
+                "type": "check_in",
+                "timestamp": self._at(9, 2),
+                "latitude": "5.6001",
+                "longitude": "-0.18",
+            },
+            {
+                "key": "c-in",
+                "type": "check_in",
+                "timestamp": self._at(9),
+                "latitude": "5.7",
+                "longitude": "-0.18",
+            },
+            {"key": "d-out", "type": "check_out", "timestamp": self._at(8, 3)},
+            {"key": "e-bad", "type": "check_in", "timestamp": self._at(9)},
+        ]
+
+        results = self._post(events).json()["results"]
+
+        self.assertEqual(
+            [result["status"] for result in results],
+            ["checked_out", "checked_in", "checked_in", "rejected", "rejected"],
+        )
+        self.assertEqual(results[0]["attendance_id"], results[1]["attendance_id"])
+        self.assertEqual(results[1]["approval_status"], "approved")
+        self.assertEqual(results[2]["approval_status"], "pending")
+        self.assertEqual(Attendance.objects.count(), 2)
+        day = AttendanceDay.objects.get(attendance_id=results[0]["attendance_id"])
+        self.assertEqual(day.minutes_worked, 8 * 60)
+
+        # Session, user, profile, savepoint pair, row lock, stored events and
+        # the days' attendance; nothing is written
+        with self.assertNumQueries(8):
+            replay = self._post(events[:3]).json()["results"]
+        self.assertTrue(all(result["replayed"] for result in replay))
+        self.assertEqual(
+            [result["attendance_id"] for result in replay],
+            [result["attendance_id"] for result in results[:3]],
+        )
+        self.assertEqual(Attendance.objects.count(), 2)
+
+    def test_existing_check_in_is_reported(self):
+        """A queued check-in for a day already marked online is not duplicated"""
+        self.client.post(
+            reverse("attendance:mark"), {"latitude": "5.6", "longitude": "-0.18"}
+        )
+        response = self._post(
+            [
+                {
+                    "key": "late",
+                    "type": "check_in",
+                    "timestamp": timezone.now().isoformat(),
+                    "latitude": "5.6",
+                    "longitude": "-0.18",
+                }
+            ]
+        )
+
+        self.assertEqual(response.json()["results"][0]["status"], "already_recorded")
+        self.assertEqual(Attendance.objects.count(), 1)
+
+    def test_malformed_requests_are_rejected(self):
+        """Bad bodies and oversized batches get a 400"""
+        response = self.client.post(
+            self.url, "not json", content_type="application/json"
+        )
+        self.assertEqual(response.status_code, 400)
+
+        response = self._post([{}] * 201)
+        self.assertEqual(response.status_code, 400)
+
+        self.assertEqual(self.client.get(self.url).status_code, 405)
+
+
+class BulkApprovalViewTest(SupervisorTestCase):
+    """Test approving and rejecting several check-ins at once"""
+
+    def setUp(self):
+        super().setUp()
+        self.url = reverse("attendance:bulk_approve")
+        self.own = [
+            Attendance.objects.create(
+                intern=self.intern_profile,
+                branch=self.branch,
+                latitude=0,
+                longitude=0,
+                check_in_time=timezone.now() - timedelta(days=i),
+            )
+            for i in range(4)
+        ]
+        other_supervisor = EmployeeProfile.objects.create(
+            user=self.create_user(username="supervisor2", email="sup2@test.com")
+        )
+        other_intern = InternProfile.objects.create(
+            user=self.create_user(username="intern2", email="intern2@test.com"),
+            branch=self.branch,
+            internal_supervisor=other_supervisor,
+        )
+        self.foreign = Attendance.objects.create(
+            intern=other_intern, branch=self.branch, latitude=0, longitude=0
+        )
+
+    def test_approves_only_permitted_pending_records(self):
+        """Records of other supervisors' interns are skipped"""
+        self.own[2].approval_status = "rejected"
+        self.own[2].save()
+        ids = [a.pk for a in self.own[:3]] + [self.foreign.pk]
+
+        response = self.client.post(
+            self.url, {"attendance_ids": ids, "action": "approve"}, follow=True
+        )
+
+        self.assertRedirects(response, reverse("attendance:pending_approvals"))
+        self.assertMessageContains(response, "2 attendance record(s) approved")
+        self.assertMessageContains(response, "2 record(s) were skipped")
+        statuses = dict(Attendance.objects.values_list("id", "approval_status"))
+        self.assertEqual(statuses[self.own[0].pk], "approved")
+        self.assertEqual(statuses[self.own[1].pk], "approved")
+        self.assertEqual(statuses[self.own[2].pk], "rejected")
+        self.assertEqual(statuses[self.foreign.pk], "pending")
+        self.assertEqual(
+            Attendance.objects.filter(approved_by=self.supervisor_user).count(), 2
+        )
+        self.assertEqual(
+            Notification.objects.filter(
+                recipient=self.intern_user, category="attendance"
+            ).count(),
+            2,
+        )
+        self.assertEqual(OutboundEmail.objects.count(), 2)
+
+    def test_query_count_does_not_grow_with_selection(self):
+        """One record costs the same number of queries as several"""
+        # The first decision also creates the intern's notification settings
+        self._count_queries([self.own[0].pk])
+        single = self._count_queries([self.own[1].pk])
+        several = self._count_queries([self.own[2].pk, self.own[3].pk])
+
+        self.assertEqual(single, several)
+        self.assertFalse(
+            Attendance.objects.filter(
+                intern=self.intern_profile, approval_status="pending"
+            ).exists()
+        )
+
+    def _count_queries(self, ids):
+        with CaptureQueriesContext(connection) as context:
+            self.client.post(self.url, {"attendance_ids": ids, "action": "approve"})
+        return len(context.captured_queries)
+
+    def test_reject_requires_note(self):
+        """Rejecting without a note changes nothing"""
+        response = self.client.post(
+            self.url,
+            {"attendance_ids": [self.own[0].pk], "action": "reject"},
+            follow=True,
+        )
+
+        self.assertMessageContains(response, "A note is required")
+        self.assertFalse(
+            Attendance.objects.exclude(approval_status="pending").exists()
+        )
+
+    def test_reject_stores_note(self):
+        """Rejected records keep the supervisor's note"""
+        self.client.post(
+            self.url,
+            {
+                "attendance_ids": [self.own[0].pk],
+                "action": "reject",
+                "note": "Wrong site",
+            },
+        )
+
+        self.own[0].refresh_from_db()
+        self.assertEqual(self.own[0].approval_status, "rejected")
+        self.assertEqual(self.own[0].notes, "Wrong site")
+        self.assertIn(
+            "Reason: Wrong site",
+            Notification.objects.get(recipient=self.intern_user).message,
+        )
+
+
+class AttendanceKeysetPaginatorTest(BaseTestCase):
+    """Test keyset pagination on (check_in_time, id)"""
+
+    def setUp(self):
+        super().setUp()
+        now = timezone.now()
+        other_intern = InternProfile.objects.create(
+            user=self.create_user(username="intern2", email="intern2@test.com"),
+            branch=self.branch,
+        )
+        # Pairs (one per intern) share a timestamp so the id tie-breaker is
+        # exercised without two check-ins on one day for the same intern
+        self.records = [
+            Attendance.objects.create(
+                intern=self.intern_profile if i % 2 else other_intern,
+                branch=self.branch,
+                latitude=0,
+                longitude=0,
+                check_in_time=now - timedelta(days=i // 2),
+            )
+            for i in range(7)
+        ]
+        self.expected = sorted(
+            self.records, key=lambda a: (a.check_in_time, a.id), reverse=True
+        )
+
+    def test_cursor_round_trip(self):
+        """Cursors decode back to the row key and reject garbage"""
+        record = self.records[0]
+        cursor = encode_cursor(record.check_in_time, record.id)
+
+        self.assertEqual(decode_cursor(cursor), (record.check_in_time, record.id))
+        self.assertIsNone(decode_cursor("not-a-cursor"))
+
+    def test_walks_forward_and_back(self):
+        """Next cursors visit every row once; previous cursors return"""
+        paginator = AttendanceKeysetPaginator(Attendance.objects.all(), page_size=3)
+
+        first = paginator.get_page()
+        second = paginator.get_page(after=first.next_cursor)
+        third = paginator.get_page(after=second.next_cursor)
+
+        self.assertEqual(
+            first.object_list + second.object_list + third.object_list, self.expected
+        )
+        self.assertFalse(first.has_previous)
+        self.assertFalse(third.has_next)
+
+        back = paginator.get_page(before=second.previous_cursor)
+        self.assertEqual(back.object_list, first.object_list)
+        self.assertFalse(back.has_previous)
+        self.assertTrue(back.has_next)
+
+    def test_invalid_cursor_returns_first_page(self):
+        """A tampered cursor falls back to the first page"""
+        paginator = AttendanceKeysetPaginator(Attendance.objects.all(), page_size=3)
+
+        self.assertEqual(
+            paginator.get_page(after="garbage").object_list, self.expected[:3]
+        )
+
+
+class AttendanceListViewTest(AuthenticatedTestCase):
+    """Test the supervisor attendance list"""
+
+    def setUp(self):
+        super().setUp()
+        now = timezone.now()
+        for i in range(5):
+            Attendance.objects.create(
+                intern=self.intern_profile,
+                branch=self.branch,
+                latitude=0,
+                longitude=0,
+                check_in_time=now - timedelta(days=i),
+                approval_status="approved" if i % 2 else "pending",
+            )
+        self.url = reverse("attendance:list")
+
+    @override_settings(ATTENDANCE_LIST_PAGE_SIZE=2)
+    def test_list_is_paginated_with_filters_kept(self):
+        """Next links carry the active filters"""
+        response = self.client.get(self.url, {"status": "pending"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "?status=pending&after=")
+        page = response.context["page"]
+        self.assertEqual(len(page), 2)
+        self.assertTrue(page.has_next)
+        self.assertEqual(response.context["filter_query"], "status=pending")
+
+        response = self.client.get(
+            self.url, {"status": "pending", "after": page.next_cursor}
+        )
+        rows = list(response.context["page"])
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0].approval_status, "pending")
+
+    def test_date_filters(self):
+        """date_from/date_to bound the list by local calendar day"""
+        today = timezone.localdate()
+        response = self.client.get(
+            self.url,
+            {
+                "date_from": (today - timedelta(days=1)).isoformat(),
+                "date_to": today.isoformat(),
+            },
+        )
+
+        self.assertEqual(len(response.context["page"]), 2)
+
+    def test_invalid_date_is_ignored(self):
+        """Malformed dates do not break the page"""
+        response = self.client.get(self.url, {"date_from": "2024-02-30"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context["page"]), 5)
+
+    def test_export_streams_filtered_csv(self):
+        """The export reuses the list filters and streams CSV rows"""
+        Attendance.objects.filter(approval_status="approved").update(
+            notes="=HYPERLINK(1)"
+        )
+        response = self.client.get(
+            reverse("attendance:export"), {"status": "approved", "format": "csv"}
+        )
+
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "text/csv; charset=utf-8")
+        rows = list(
+            csv.reader(
+                b"".join(response.streaming_content).decode("utf-8-sig").splitlines()
+            )
+        )
+        self.assertEqual(tuple(rows[0]), EXPORT_COLUMNS)
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(rows[1][EXPORT_COLUMNS.index("Status")], "Approved")
+        self.assertEqual(rows[1][EXPORT_COLUMNS.index("Notes")], "'=HYPERLINK(1)")
+
+    def test_export_xlsx_command(self):
+        """The command writes a workbook with one row per record"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "attendance.xlsx")
+            call_command("export_attendance", output=path, stdout=StringIO())
+
+            with zipfile.ZipFile(path) as archive:
+                self.assertIn("xl/workbook.xml", archive.namelist())
+                sheet = archive.read("xl/worksheets/sheet1.xml").decode()
+
+        self.assertEqual(sheet.count("<row "), 6)
+        self.assertIn("Distance from branch (m)", sheet)
@@ -0,0 +1,143 @@
+"""
+Tests for the working-day calendar
+"""
+
+from datetime import date, timedelta
+
+from django.test import override_settings
+
+from apps.absenteeism.models import AbsenteeismRequest
+from apps.holidays.calendar import (
+    ExpectedAttendanceService,
+    WorkingCalendar,
+    get_working_calendar,
+    invalidate_working_calendar,
+    merge_ranges,
+)
+from apps.holidays.models import Holiday
+from tests.base import BaseTestCase
+
+# Monday 2 September 2024 to Friday 27 September 2024: 20 weekdays
+MONDAY = date(2024, 9, 2)
+FOUR_WEEKS_LATER = date(2024, 9, 27)
+
+
+class WorkingCalendarTest(BaseTestCase):
+    """Test working-day arithmetic"""
+
+    def test_counts_weekdays_arithmetically(self):
+        """Weekday counts match a day-by-day walk for every start weekday"""
+        calendar = WorkingCalendar([])
+        for offset in range(7):
+            start = MONDAY + timedelta(days=offset)
+            for length in range(0, 40):
+                end = start + timedelta(days=length)
+                expected = sum(
+                    1
+                    for n in range(length + 1)
+                    if (start + timedelta(days=n)).weekday() < 5
+                )
+                self.assertEqual(calendar.count_weekdays(start, end), expected)
+
+    def test_holidays_and_absences_are_excluded_once(self):
+        """Holidays inside an absence range are not subtracted twice"""
+        calendar = WorkingCalendar(
+            [
+                (None, date(2024, 9, 4)),  # global, Wednesday
+                (None, date(2024, 9, 7)),  # global, Saturday
+                (self.branch.id, date(2024, 9, 16)),  # branch, Monday
+                (self.branch.id + 1, date(2024, 9, 17)),  # other branch
+            ]
+        )
+
+        self.assertEqual(calendar.working_days(MONDAY, FOUR_WEEKS_LATER), 19)
+        self.assertEqual(
+            calendar.working_days(MONDAY, FOUR_WEEKS_LATER, branch_id=self.branch.id),
+            18,
+        )
+        absences = [
+            (date(2024, 9, 3), date(2024, 9, 5)),
+            (date(2024, 9, 5), date(2024, 9, 9)),
+        ]
+        # Tue 3 - Mon 9 is 5 weekdays, one of them the global holiday
+        self.assertEqual(
+            calendar.working_days(
+                MONDAY, FOUR_WEEKS_LATER, branch_id=self.branch.id, excluded=absences
+            ),
+            14,
+        )
+
+    def test_merge_ranges_clips_and_joins(self):
+        """Overlapping and adjacent ranges merge; outside parts are clipped"""
+        self.assertEqual(
+            merge_ranges(
+                [
+                    (date(2024, 8, 30), date(2024, 9, 3)),
+                    (date(2024, 9, 4), date(2024, 9, 4)),
+                    (date(2024, 9, 20), date(2024, 10, 3)),
+                ],
+                MONDAY,
+                FOUR_WEEKS_LATER,
+            ),
+            [(MONDAY, date(2024, 9, 4)), (date(2024, 9, 20), FOUR_WEEKS_LATER)],
+        )
+
+
+class ExpectedAttendanceTest(BaseTestCase):
+    """Test expected days from holidays and approved absences"""
+
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(invalidate_working_calendar)
+        self.intern_profile.start_date = MONDAY
+        self.intern_profile.end_date = FOUR_WEEKS_LATER
+        self.intern_profile.save()
+
+    def test_expected_days_use_database_holidays_and_absences(self):
+        """Saved holidays refresh the cached calendar"""
+        get_working_calendar()
+        Holiday.objects.create(name="Founders Day", date=date(2024, 9, 4))
+        Holiday.objects.create(
+            name="Branch Day", date=date(2024, 9, 16), branch=self.branch
+        )
+        AbsenteeismRequest.objects.create(
+            intern=self.intern_profile,
+            reason="Sick",
+            start_date=date(2024, 9, 23),
+            end_date=date(2024, 9, 24),
+            status="approved",
+        )
+        AbsenteeismRequest.objects.create(
+            intern=self.intern_profile,
+            reason="Trip",
+            start_date=date(2024, 9, 25),
+            end_date=date(2024, 9, 27),
+            status="rejected",
+        )
+
+        # Holiday version check, holiday reload and approved absences
+        with self.assertNumQueries(3):
+            expected = ExpectedAttendanceService.expected_days([self.intern_profile])
+
+        self.assertEqual(expected[self.intern_profile.id], 16)
+
+    def test_calendar_follows_changes_from_other_processes(self):
+        """Holidays saved without this process's signals load after the next check"""
+        calendar = get_working_calendar()
+        # bulk_create sends no signals, like a save made by another worker
+        Holiday.objects.bulk_create(
+            [Holiday(name="Founders Day", date=date(2024, 9, 4))]
+        )
+
+        with self.assertNumQueries(0):
+            self.assertIs(get_working_calendar(), calendar)
+        with override_settings(WORKING_CALENDAR_CHECK_SECONDS=0):
+            refreshed = get_working_calendar()
+
+        self.assertEqual(refreshed.working_days(MONDAY, FOUR_WEEKS_LATER), 19)
+
+    def test_rate_is_capped(self):
+        """Rates are relative to expected days and never exceed 100"""
+        self.assertEqual(ExpectedAttendanceService.attendance_rate(15, 20), 75.0)
+        self.assertEqual(ExpectedAttendanceService.attendance_rate(25, 20), 100.0)
+        self.assertEqual(ExpectedAttendanceService.attendance_rate(3, 0), 0.0)
@@ -0,0 +1,135 @@
+"""
+Tests for the intern summary view and cohort leaderboard
+"""
+
+from datetime import date, timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.absenteeism.models import AbsenteeismRequest
+from apps.attendance.models import Attendance
+from apps.evaluations.models import PerformanceAssessment
+from apps.interns.models import InternProfile, InternSummary
+from apps.interns.summary import InternSummaryService
+from apps.schools.models import School
+from tests.base import BaseTestCase
+
+
+class InternSummaryTest(BaseTestCase):
+    """Test the summary view totals and the pages reading them"""
+
+    def setUp(self):
+        super().setUp()
+        self.other_school = School.objects.create(name="Other School")
+        self.other_intern = InternProfile.objects.create(
+            user=self.create_user(username="intern2", email="intern2@test.com"),
+            branch=self.branch,
+            school=self.other_school,
+            internal_supervisor=self.supervisor,
+        )
+
+        for week, score in enumerate([70, 90], start=1):
+            PerformanceAssessment.objects.create(
+                intern=self.intern_profile,
+                week_number=week,
+                supervisor_score=score,
+                status=PerformanceAssessment.Status.REVIEWED,
+            )
+        PerformanceAssessment.objects.create(
+            intern=self.other_intern, week_number=1, supervisor_score=60
+        )
+        start = timezone.now() - timedelta(days=5)
+        for offset, status in enumerate(["approved", "approved", "pending"]):
+            check_in = start + timedelta(days=offset)
+            Attendance.objects.create(
+                intern=self.intern_profile,
+                branch=self.branch,
+                latitude=0,
+                longitude=0,
+                check_in_time=check_in,
+                check_out_time=check_in + timedelta(hours=8),
+                approval_status=status,
+            )
+        AbsenteeismRequest.objects.create(
+            intern=self.intern_profile,
+            reason="Exam",
+            start_date=date(2024, 3, 4),
+            end_date=date(2024, 3, 6),
+            status=AbsenteeismRequest.Status.APPROVED,
+        )
+        InternSummaryService.refresh()
+
+    def test_totals_are_not_multiplied_by_joins(self):
+        """Each source table is counted independently"""
+        summary = InternSummary.objects.get(intern=self.intern_profile)
+
+        self.assertEqual(summary.total_assessments, 2)
+        self.assertEqual(summary.reviewed_assessments, 2)
+        self.assertEqual(summary.avg_score, 80.0)
+        self.assertEqual(summary.total_attendance, 3)
+        self.assertEqual(summary.approved_attendance, 2)
+        self.assertEqual(summary.approved_hours, 16.0)
+        self.assertEqual(summary.attendance_rate, 66.7)
+        self.assertEqual(summary.total_absences, 1)
+        self.assertEqual(summary.approved_absence_days, 3)
+
+    def test_leaderboard_groups_and_ranks(self):
+        """Cohorts are compared by school and interns ranked by score"""
+        self.login_user(self.supervisor_user)
+
+        response = self.client.get(reverse("interns:leaderboard"), {"group": "school"})
+
+        self.assertEqual(response.status_code, 200)
+        cohorts = response.context["cohorts"]
+        self.assertEqual(
+            [(cohort.label, cohort.avg_score) for cohort in cohorts],
+            [(self.school.name, 80.0), ("Other School", 60.0)],
+        )
+        self.assertEqual(cohorts[0].approved_hours, 16.0)
+        self.assertEqual(
+            [summary.intern_id for summary in response.context["leaders"]],
+            [self.intern_profile.id, self.other_intern.id],
+        )
+
+        response = self.client.get(
+            reverse("interns:leaderboard"),
+            {"group": "school", "cohort": self.other_school.id},
+        )
+        self.assertEqual(
+            [summary.intern_id for summary in response.context["leaders"]],
+            [self.other_intern.id],
+        )
+
+    def test_supervisor_sees_only_assigned_interns(self):
+        """Unassigned interns are left out of a supervisor's comparison"""
+        self.other_intern.internal_supervisor = None
+        self.other_intern.save()
+        self.login_user(self.supervisor_user)
+
+        response = self.client.get(reverse("interns:leaderboard"))
+
+        self.assertEqual(
+            [summary.intern_id for summary in response.context["leaders"]],
+            [self.intern_profile.id],
+        )
+        self.assertEqual(response.context["cohorts"][0].interns, 1)
+
+    def test_refresh_command_picks_up_changes(self):
+        """New records appear after the scheduled refresh"""
+        PerformanceAssessment.objects.create(
+            intern=self.other_intern, week_number=2, supervisor_score=100
+        )
+        self.assertEqual(
+            InternSummary.objects.get(intern=self.other_intern).total_assessments, 1
+        )
+
+        out = StringIO()
+        call_command("refresh_intern_summaries", stdout=out)
+
+        summary = InternSummary.objects.get(intern=self.other_intern)
+        self.assertEqual(summary.total_assessments, 2)
+        self.assertEqual(summary.avg_score, 80.0)
+        self.assertIn("Refreshed intern summaries", out.getvalue())
@@ -0,0 +1,154 @@
+"""
+Tests for the role dashboards and their statistics service
+"""
+
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.absenteeism.models import AbsenteeismRequest
+from apps.attendance.models import Attendance
+from apps.dashboards.services import DashboardStatsService
+from apps.evaluations.models import PerformanceAssessment
+from apps.supervisors.models import EmployeeProfile
+from tests.base import BaseTestCase
+
+
+class DashboardStatsServiceTest(BaseTestCase):
+    """Test the conditional-aggregate statistics service"""
+
+    def setUp(self):
+        super().setUp()
+        for days_ago, status in enumerate(["approved", "approved", "pending", "rejected"]):
+            Attendance.objects.create(
+                intern=self.intern_profile,
+                branch=self.branch,
+                latitude=0,
+                longitude=0,
+                check_in_time=timezone.now() - timedelta(days=days_ago),
+                approval_status=status,
+            )
+        PerformanceAssessment.objects.create(
+            intern=self.intern_profile, week_number=1, status="draft"
+        )
+        PerformanceAssessment.objects.create(
+            intern=self.intern_profile,
+            week_number=2,
+            status="reviewed",
+            supervisor_score=80,
+        )
+        PerformanceAssessment.objects.create(
+            intern=self.intern_profile,
+            week_number=3,
+            status="reviewed",
+            supervisor_score=70,
+        )
+        today = timezone.localdate()
+        AbsenteeismRequest.objects.create(
+            intern=self.intern_profile,
+            reason="Sick",
+            start_date=today,
+            end_date=today,
+            status="pending",
+        )
+
+    def test_attendance_stats_single_query(self):
+        """Attendance breakdown is computed in one query"""
+        with self.assertNumQueries(1):
+            stats = DashboardStatsService.attendance_stats(
+                Attendance.objects.filter(intern=self.intern_profile),
+                today=timezone.localdate(),
+            )
+
+        self.assertEqual(stats.total, 4)
+        self.assertEqual(stats.approved, 2)
+        self.assertEqual(stats.pending, 1)
+        self.assertEqual(stats.rejected, 1)
+        self.assertEqual(stats.today, 1)
+
+    def test_assessment_stats_single_query(self):
+        """Assessment breakdown and average are computed in one query"""
+        with self.assertNumQueries(1):
+            stats = DashboardStatsService.assessment_stats()
+
+        self.assertEqual(stats.total, 3)
+        self.assertEqual(stats.draft, 1)
+        self.assertEqual(stats.reviewed, 2)
+        self.assertEqual(stats.pending_self_assessment, 1)
+        self.assertEqual(stats.average_supervisor_score, 75)
+
+    def test_absence_stats_single_query(self):
+        """Absence breakdown is computed in one query"""
+        with self.assertNumQueries(1):
+            stats = DashboardStatsService.absence_stats()
+
+        self.assertEqual(stats.total, 1)
+        self.assertEqual(stats.pending, 1)
+        self.assertEqual(stats.approved, 0)
+
+    def test_empty_queryset(self):
+        """Empty tables produce zeroed stats"""
+        stats = DashboardStatsService.attendance_stats(Attendance.objects.none())
+        self.assertEqual(stats.total, 0)
+        self.assertEqual(stats.pending, 0)
+
+
+class DashboardQueryBudgetTest(BaseTestCase):
+    """Each dashboard must render within a fixed number of queries"""
+
+    def setUp(self):
+        super().setUp()
+        self.manager_user = self.create_user(
+            username="manager1",
+            email="manager@test.com",
+            role="manager",
+            is_onboarded=True,
+        )
+        self.employee_user = self.create_user(
+            username="employee1",
+            email="employee@test.com",
+            role="employee",
+            is_onboarded=True,
+        )
+        EmployeeProfile.objects.create(user=self.employee_user)
+        for days_ago in range(5):
+            Attendance.objects.create(
+                intern=self.intern_profile,
+                branch=self.branch,
+                latitude=0,
+                longitude=0,
+                check_in_time=timezone.now() - timedelta(days=days_ago),
+            )
+
+    def assertQueryBudget(self, user, url_name, budget):
+        """Render a dashboard and check it stays within the query budget"""
+        self.login_user(user)
+        cache.clear()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse(url_name))
+        self.assertEqual(response.status_code, 200)
+        self.assertLessEqual(
+            len(queries),
+            budget,
+            "\n".join(query["sql"] for query in queries.captured_queries),
+        )
+
+    def test_intern_dashboard_budget(self):
+        # Includes this month's hours from the daily rollups
+        self.assertQueryBudget(self.intern_user, "dashboards:intern", 11)
+
+    def test_supervisor_dashboard_budget(self):
+        self.assertQueryBudget(self.supervisor_user, "dashboards:supervisor", 13)
+
+    def test_manager_dashboard_budget(self):
+        self.assertQueryBudget(self.manager_user, "dashboards:manager", 11)
+
+    def test_admin_dashboard_budget(self):
+        self.assertQueryBudget(self.admin_user, "dashboards:admin", 13)
+
+    def test_employee_dashboard_budget(self):
+        self.assertQueryBudget(self.employee_user, "dashboards:employee", 5)
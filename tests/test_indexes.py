@@ -0,0 +1,178 @@
+"""
+EXPLAIN-based checks that the hot query paths can use their indexes.
+
+The fixture spreads a few thousand rows over many interns and assessors and
+runs ANALYZE, and sequential scans are disabled while planning. The tests
+therefore check that each query has a matching index, not which plan the
+planner would choose on production data.
+"""
+
+from datetime import date, timedelta
+from unittest import skipUnless
+
+from django.db import connection
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.absenteeism.models import AbsenteeismRequest
+from apps.accounts.models import User
+from apps.attendance.models import Attendance
+from apps.branches.models import Branch
+from apps.evaluations.models import PerformanceAssessment
+from apps.interns.models import InternProfile
+from apps.supervisors.models import EmployeeProfile
+
+
+@skipUnless(connection.vendor == "postgresql", "EXPLAIN checks need PostgreSQL")
+class QueryPathIndexTest(TestCase):
+    """Assert index usage for dashboard, report and approval-queue queries"""
+
+    @classmethod
+    def setUpTestData(cls):
+        # Spread rows over many interns and assessors so that the planner
+        # statistics make the composite indexes the selective choice
+        users = User.objects.bulk_create(
+            User(username=f"index_user_{i}", email=f"index_user_{i}@test.com")
+            for i in range(45)
+        )
+        assessors = EmployeeProfile.objects.bulk_create(
+            EmployeeProfile(user=user) for user in users[:5]
+        )
+        branch = Branch.objects.create(name="Index Branch", code="IDX")
+        interns = InternProfile.objects.bulk_create(
+            InternProfile(user=user, branch=branch, start_date=date.today())
+            for user in users[5:]
+        )
+
+        statuses = ["approved"] * 8 + ["pending", "rejected"]
+        Attendance.objects.bulk_create(
+            Attendance(
+                intern=intern,
+                branch=branch,
+                latitude=0,
+                longitude=0,
+                check_in_time=timezone.now() - timedelta(days=day),
+                approval_status=statuses[day % len(statuses)],
+            )
+            for intern in interns
+            for day in range(50)
+        )
+        PerformanceAssessment.objects.bulk_create(
+            PerformanceAssessment(
+                intern=intern,
+                assessed_by=assessors[(n + week) % len(assessors)],
+                week_number=week,
+                status="reviewed" if week % 10 else "submitted",
+            )
+            for n, intern in enumerate(interns)
+            for week in range(1, 21)
+        )
+        AbsenteeismRequest.objects.bulk_create(
+            AbsenteeismRequest(
+                intern=intern,
+                reason="Index test",
+                start_date=date.today(),
+                end_date=date.today(),
+                status=statuses[n % len(statuses)],
+            )
+            for intern in interns
+            for n in range(20)
+        )
+        with connection.cursor() as cursor:
+            for model in (Attendance, PerformanceAssessment, AbsenteeismRequest):
+                cursor.execute(f"ANALYZE {model._meta.db_table}")
+
+        cls.intern = interns[0]
+        cls.assessor = assessors[0]
+
+    def assertUsesIndex(self, queryset, index_name):
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+        plan = queryset.explain()
+        self.assertIn(index_name, plan, f"{index_name} not used:\n{plan}")
+
+    def test_attendance_intern_status(self):
+        self.assertUsesIndex(
+            Attendance.objects.filter(
+                intern=self.intern, approval_status="pending"
+            )
+            .order_by()
+            .values("id"),
+            "attendance_intern_status_idx",
+        )
+
+    def test_attendance_intern_history(self):
+        self.assertUsesIndex(
+            Attendance.objects.filter(intern=self.intern).order_by(
+                "-check_in_time"
+            )[:10],
+            "attendance_intern_checkin_idx",
+        )
+
+    def test_attendance_pending_queue(self):
+        self.assertUsesIndex(
+            Attendance.objects.filter(approval_status="pending").order_by(
+                "-check_in_time"
+            )[:50],
+            "attendance_pending_idx",
+        )
+
+    def test_attendance_keyset_list(self):
+        self.assertUsesIndex(
+            Attendance.objects.order_by("-check_in_time", "-id")[:50],
+            "attendance_checkin_id_idx",
+        )
+
+    def test_assessment_assessor_status(self):
+        self.assertUsesIndex(
+            PerformanceAssessment.objects.filter(
+                assessed_by=self.assessor, status="reviewed"
+            )
+            .order_by()
+            .values("id"),
+            "assessment_assessor_status_idx",
+        )
+
+    def test_assessment_intern_status(self):
+        self.assertUsesIndex(
+            PerformanceAssessment.objects.filter(
+                intern=self.intern, status="draft"
+            )
+            .order_by()
+            .values("id"),
+            "assessment_intern_status_idx",
+        )
+
+    def test_assessment_review_queue(self):
+        self.assertUsesIndex(
+            PerformanceAssessment.objects.filter(
+                assessed_by=self.assessor, status="submitted"
+            ).order_by("-assessment_date")[:20],
+            "assessment_submitted_idx",
+        )
+
+    def test_absence_intern_status(self):
+        self.assertUsesIndex(
+            AbsenteeismRequest.objects.filter(
+                intern=self.intern, status="pending"
+            )
+            .order_by()
+            .values("id"),
+            "absence_intern_status_idx",
+        )
+
+    def test_absence_intern_history(self):
+        self.assertUsesIndex(
+            AbsenteeismRequest.objects.filter(intern=self.intern).order_by(
+                "-submitted_at"
+            )[:10],
+            "absence_intern_submitted_idx",
+        )
+
+    def test_absence_pending_queue(self):
+        self.assertUsesIndex(
+            AbsenteeismRequest.objects.filter(status="pending").order_by(
+                "submitted_at"
+            ),
+            "absence_pending_idx",
+        )
@@ -6,8 +6,11 @@ from django.test import TestCase
 from django.urls import reverse
 from django.contrib.auth import get_user_model
 from django.http import Http404
-from datetime import date, timedelta
+from django.utils import timezone
+from datetime import date, datetime, time, timedelta
 
+from apps.attendance.models import Attendance
+from apps.evaluations.models import PerformanceAssessment
 from apps.interns.models import InternProfile, InternType
 from tests.base import (
     BaseTestCase,
@@ -56,6 +59,50 @@ class InternListViewTest(AuthenticatedTestCase):
         # Check if pagination is working (assuming 20 items per page)
         self.assertTrue(response.context["is_paginated"])
 
+    def test_intern_list_second_page(self):
+        """Later pages hold the remaining interns and keep the filters"""
+        for i in range(20):
+            InternProfile.objects.create(
+                user=self.create_user(username=f"paged_{i}", email=f"paged_{i}@test.com"),
+                branch=self.branch,
+                start_date=date.today() + timedelta(days=i + 1),
+            )
+
+        response = self.client.get(
+            reverse("interns:list"), {"branch": self.branch.id, "page": 2}
+        )
+
+        self.assertEqual(response.context["total_count"], 21)
+        self.assertEqual(list(response.context["interns"]), [self.intern_profile])
+        self.assertContains(response, f"?branch={self.branch.id}&page=1")
+
+    def test_intern_list_stats_are_not_multiplied(self):
+        """Assessment and attendance figures are counted independently"""
+        for week, score in enumerate([70, 90], start=1):
+            PerformanceAssessment.objects.create(
+                intern=self.intern_profile, week_number=week, supervisor_score=score
+            )
+        start = date.today() - timedelta(days=5)
+        for offset, status in enumerate(["approved", "approved", "pending"]):
+            Attendance.objects.create(
+                intern=self.intern_profile,
+                branch=self.branch,
+                latitude=0,
+                longitude=0,
+                check_in_time=timezone.make_aware(
+                    datetime.combine(start + timedelta(days=offset), time(9))
+                ),
+                approval_status=status,
+            )
+
+        response = self.client.get(reverse("interns:list"))
+
+        listed = response.context["interns"][0]
+        self.assertEqual(listed.total_assessments, 2)
+        self.assertEqual(listed.avg_score, 80.0)
+        self.assertEqual(listed.total_attendance, 3)
+        self.assertEqual(listed.approved_attendance, 2)
+
     def test_intern_list_view_filtering(self):
         """Test filtering in intern list"""
         # Create intern with different type